@@ -550,19 +550,32 @@ function displayTranslation(data) {
 
 /**
  * Play translated audio through speakers
+ * Translations can arrive as several sentence clips; they play back to back
  */
-async function playTranslatedAudio(audioBlob) {
-    try {
+let translatedAudioQueue = Promise.resolve();
+
+function playTranslatedAudio(audioBlob) {
+    translatedAudioQueue = translatedAudioQueue.then(() => playAudioClip(audioBlob));
+    return translatedAudioQueue;
+}
+
+function playAudioClip(audioBlob) {
+    return new Promise((resolve) => {
         const audioUrl = URL.createObjectURL(audioBlob);
         const audio = new Audio(audioUrl);
+        const finish = () => {
+            URL.revokeObjectURL(audioUrl);
+            resolve();
+        };
         
-        audio.onended = () => URL.revokeObjectURL(audioUrl);
-        
-        await audio.play();
+        audio.onended = finish;
+        audio.onerror = finish;
         
-    } catch (error) {
-        console.error('Audio playback error:', error);
-    }
+        audio.play().catch((error) => {
+            console.error('Audio playback error:', error);
+            finish();
+        });
+    });
 }
 
 /**
@@ -666,6 +679,14 @@ function pcm16ToWav(base64Pcm16) {
     return new Blob([wavBytes], { type: 'audio/wav' });
 }
 
+/**
+ * MP3 starts with an ID3 tag ("ID3") or an MPEG frame sync (11 set bits)
+ */
+function isMp3(byteArray) {
+    return (byteArray[0] === 0x49 && byteArray[1] === 0x44 && byteArray[2] === 0x33) ||
+        (byteArray[0] === 0xFF && (byteArray[1] & 0xE0) === 0xE0);
+}
+
 /**
  * Play audio from base64 encoded string
  */
@@ -685,6 +706,10 @@ async function playAudioFromBase64(base64Audio) {
             // "OggS" magic bytes - it's Opus
             audioBlob = new Blob([byteArray], { type: 'audio/ogg; codecs=opus' });
             console.log('🔊 Detected Opus audio format');
+        } else if (isMp3(byteArray)) {
+            // MP3 (model profiles with mp3 output)
+            audioBlob = new Blob([byteArray], { type: 'audio/mpeg' });
+            console.log('🔊 Detected MP3 audio format');
         } else {
             // Assume raw PCM16, convert to WAV
             audioBlob = pcm16ToWav(base64Audio);
@@ -839,7 +864,7 @@ function triggerReplay() {
             const byteArray = new Uint8Array(byteNumbers);
             
             // Create blob and URL
-            const audioBlob = new Blob([byteArray], { type: 'audio/ogg; codecs=opus' });
+            const audioBlob = new Blob([byteArray], { type: isMp3(byteArray) ? 'audio/mpeg' : 'audio/ogg; codecs=opus' });
             const audioUrl = URL.createObjectURL(audioBlob);
             
             // Set audio source and play
@@ -1344,6 +1369,11 @@ function handleRoomMessage(event) {
                 }
                 break;
                 
+            case 'status':
+                // Server notices, e.g. translation paused/resumed under heavy load
+                showToast(message.message, 'info');
+                break;
+                
             case 'pong':
                 console.log('🏠 Received pong from room');
                 break;
@@ -0,0 +1,113 @@
+"""
+Benchmark: prompt cache hit rate and time-to-first-token, legacy vs cache-friendly prompt layout
+Run from the backend directory (needs OPENAI_API_KEY):
+    python benchmarks/prompt_cache_benchmark.py [source_lang] [target_lang]
+
+Legacy layout puts the previous transcript in the system prompt (the old
+TraditionalTranslator) so the prefix changes every turn. The new layout keeps
+the system prompt and per-pair instructions identical across turns.
+Note the provider only caches prefixes of 1024+ tokens.
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.prompts import ICELANDIC_INSTRUCTIONS, translation_messages
+
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+MODEL = os.getenv("BENCH_MODEL", "gpt-4o-mini")
+
+CONVERSATION = [
+    "Good morning, thanks for coming in today.",
+    "Could you tell me your name and where you are staying at the moment?",
+    "We need a few documents before we can register you.",
+    "Do you have a passport or any other identification with you?",
+    "That's fine, we can make a copy of it here.",
+    "Next week there will be a meeting about housing.",
+    "Please let us know if you need an interpreter for that meeting.",
+    "Is there anything else you would like to ask me today?",
+]
+
+
+def legacy_messages(text: str, source_lang: str, target_lang: str, context: str):
+    icelandic = f"\n{ICELANDIC_INSTRUCTIONS}\n" if "is" in (source_lang, target_lang) else ""
+    system_prompt = f"""You are a professional real-time translator specializing in accurate, natural translations.
+Translate the following from {source_lang} to {target_lang}.
+{icelandic}
+Maintain natural conversational tone, slang, and emotional context.
+Keep translations concise and accurate. Use correct spelling, grammar, and punctuation.
+Previous context: {context[-150:] if context else 'None'}"""
+    return [{"role": "system", "content": system_prompt}, {"role": "user", "content": text}]
+
+
+def stream_translation(messages):
+    """Returns (time to first token ms, prompt tokens, cached tokens)"""
+    start = time.perf_counter()
+    ttft = None
+    usage = {}
+    with requests.post(
+        "https://api.openai.com/v1/chat/completions",
+        headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+        json={
+            "model": MODEL,
+            "messages": messages,
+            "temperature": 0,
+            "max_tokens": 200,
+            "stream": True,
+            "stream_options": {"include_usage": True}
+        },
+        stream=True,
+        timeout=30
+    ) as response:
+        if response.status_code != 200:
+            raise RuntimeError(f"Chat failed: {response.status_code} - {response.text}")
+        for line in response.iter_lines():
+            if not line.startswith(b"data: ") or line == b"data: [DONE]":
+                continue
+            chunk = json.loads(line[6:])
+            if ttft is None and chunk.get("choices") and chunk["choices"][0]["delta"].get("content"):
+                ttft = (time.perf_counter() - start) * 1000
+            if chunk.get("usage"):
+                usage = chunk["usage"]
+    cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+    return ttft or 0.0, usage.get("prompt_tokens", 0), cached
+
+
+def run(label: str, build, source_lang: str, target_lang: str):
+    ttfts, prompt_total, cached_total = [], 0, 0
+    context = ""
+    for text in CONVERSATION:
+        ttft, prompt_tokens, cached = stream_translation(build(text, source_lang, target_lang, context))
+        ttfts.append(ttft)
+        prompt_total += prompt_tokens
+        cached_total += cached
+        context = text
+    ratio = cached_total / prompt_total if prompt_total else 0.0
+    print(f"  {label:<8} TTFT median {statistics.median(ttfts):6.0f}ms  max {max(ttfts):6.0f}ms  "
+          f"prompt tokens {prompt_total:5d}  cached {cached_total:5d} ({ratio:5.1%})")
+
+
+def main():
+    if not OPENAI_API_KEY:
+        print(__doc__)
+        print("OPENAI_API_KEY not set")
+        sys.exit(1)
+
+    source_lang = sys.argv[1] if len(sys.argv) > 1 else "en"
+    target_lang = sys.argv[2] if len(sys.argv) > 2 else "is"
+    print(f"{source_lang} → {target_lang}, {len(CONVERSATION)} turns, model {MODEL}")
+    run("legacy", legacy_messages, source_lang, target_lang)
+    run("cached", translation_messages, source_lang, target_lang)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: Whisper upload size and latency, original WebM vs re-encoded
+Run from the backend directory:
+    python benchmarks/whisper_upload_benchmark.py sample1.webm [sample2.webm ...]
+Set OPENAI_API_KEY to also measure transcription round-trip time
+"""
+
+import io
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+# Add backend directory to Python path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.audio_jobs import compact_for_whisper
+
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+ROUNDS = int(os.getenv("BENCH_ROUNDS", "3"))
+
+
+def transcribe(filename: str, data: bytes, mime: str) -> float:
+    """Upload to Whisper and return wall-clock milliseconds"""
+    start = time.perf_counter()
+    response = requests.post(
+        "https://api.openai.com/v1/audio/transcriptions",
+        headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+        files={"file": (filename, io.BytesIO(data), mime)},
+        data={"model": "whisper-1", "response_format": "json"},
+        timeout=30
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    if response.status_code != 200:
+        raise RuntimeError(f"Whisper failed: {response.status_code} - {response.text}")
+    return elapsed
+
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        print(__doc__)
+        sys.exit(1)
+
+    variants = [("original", None), ("opus 24k", "opus"), ("flac", "flac")]
+
+    for path in paths:
+        original = Path(path).read_bytes()
+        print(f"\n{path}: {len(original)} bytes")
+
+        for label, codec in variants:
+            if codec is None:
+                filename, data, mime, encode_ms = "audio.webm", original, "audio/webm", 0.0
+            else:
+                start = time.perf_counter()
+                result = compact_for_whisper(original, "webm", codec)
+                encode_ms = (time.perf_counter() - start) * 1000
+                filename, data, mime = result["filename"], result["data"], result["mime"]
+
+            saved = 100.0 * (1 - len(data) / len(original))
+            line = f"  {label:<10} {len(data):>9} bytes ({saved:5.1f}% saved)  encode {encode_ms:6.1f}ms"
+
+            if OPENAI_API_KEY:
+                timings = [transcribe(filename, data, mime) for _ in range(ROUNDS)]
+                line += f"  whisper median {statistics.median(timings):7.0f}ms (+encode {statistics.median(timings) + encode_ms:7.0f}ms)"
+            print(line)
+
+    if not OPENAI_API_KEY:
+        print("\nOPENAI_API_KEY not set - skipped transcription latency")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,9 @@ from services.audio_processor import AudioProcessor
 from services.translator_realtime import RealtimeTranslator
 from services.translator_traditional import TraditionalTranslator
 from services.buffer_manager import BufferManager
+from services.audio_workers import audio_pool
+from services.degradation import degradation
+from services.openai_clients import openai_clients
 from utils.logger import setup_logger
 
 load_dotenv()
@@ -62,6 +65,23 @@ async def startup_event():
     mode = "Realtime API" if USE_REALTIME_API else "Traditional Pipeline"
     logger.info(f"[STARTUP] LiveTranslateAI starting in {mode} mode")
     logger.info(f"[CONFIG] Max buffer duration: {MAX_BUFFER_DURATION}s")
+    
+    # CPU-heavy audio work (decode, replay export) runs in worker processes
+    await audio_pool.start()
+    
+    # One pooled OpenAI client shared by all sessions
+    await openai_clients.start(OPENAI_API_KEY)
+    
+    # Steps the pipeline down (captions only, faster models) when upstream slows
+    degradation.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release process-wide resources"""
+    await degradation.shutdown()
+    await openai_clients.shutdown()
+    await audio_pool.shutdown()
 
 
 @app.get("/")
@@ -84,7 +104,9 @@ async def health_check():
             "status": "healthy",
             "api_key_configured": bool(OPENAI_API_KEY),
             "active_sessions": len(active_sessions),
-            "mode": "realtime" if USE_REALTIME_API else "traditional"
+            "mode": "realtime" if USE_REALTIME_API else "traditional",
+            "openai_pool": openai_clients.get_stats(),
+            "degradation": degradation.get_stats()
         }
     )
 
@@ -116,9 +138,16 @@ async def websocket_translate(websocket: WebSocket):
         "buffer": buffer_manager,
         "processor": audio_processor,
         "translator": translator,
+        "pipeline": None,
         "connected_at": datetime.utcnow().isoformat()
     }
     
+    # Traditional mode: STT/MT/TTS run as overlapping stages, results delivered in order
+    if isinstance(translator, TraditionalTranslator):
+        async def on_result(result: Dict):
+            await deliver_result(websocket, session_id, result)
+        active_sessions[session_id]["pipeline"] = translator.create_pipeline(on_result)
+    
     logger.info(f"[SESSION] New session: {session_id}")
     
     try:
@@ -190,6 +219,8 @@ async def websocket_translate(websocket: WebSocket):
     finally:
         # Cleanup session
         if session_id in active_sessions:
+            if active_sessions[session_id]["pipeline"]:
+                await active_sessions[session_id]["pipeline"].close()
             # Clear buffers for privacy
             active_sessions[session_id]["buffer"].clear()
             del active_sessions[session_id]
@@ -211,7 +242,6 @@ async def process_audio_chunk(
         
         processor = session["processor"]
         translator = session["translator"]
-        buffer_manager = session["buffer"]
         
         # VAD check (skip silent chunks)
         if not processor.is_speech(audio_chunk):
@@ -229,43 +259,17 @@ async def process_audio_chunk(
             except:
                 pass
         
-        # Add to processing queue
-        logger.info("[DEBUG] About to call translator.process_audio")
-        result = await translator.process_audio(audio_chunk, timestamp, heartbeat_callback=send_heartbeat)
-        logger.info(f"[DEBUG] Translator returned: {result is not None}")
+        pipeline = session.get("pipeline")
+        if pipeline:
+            # Returns once the chunk is queued; the receive loop keeps reading
+            # while earlier chunks are still in translation or TTS
+            await send_heartbeat()
+            await pipeline.submit(translator.new_job(audio_chunk, timestamp))
+            return
         
+        result = await translator.process_audio(audio_chunk, timestamp, heartbeat_callback=send_heartbeat)
         if result:
-            # Buffer for replay
-            buffer_manager.add_segment(
-                timestamp=timestamp,
-                original_text=result.get("original_text", ""),
-                translated_text=result.get("translated_text", ""),
-                audio_data=result.get("audio_data"),
-                source_lang=result.get("source_lang", ""),
-                target_lang=result.get("target_lang", "")
-            )
-            
-            # Check if WebSocket is still open before sending
-            if websocket.client_state.name != "CONNECTED":
-                logger.warning("WebSocket closed - cannot send result")
-                return
-            
-            # Send to client
-            await websocket.send_json({
-                "type": "translation",
-                "timestamp": timestamp,
-                "original": result.get("original_text"),
-                "translated": result.get("translated_text"),
-                "source_lang": result.get("source_lang"),
-                "target_lang": result.get("target_lang"),
-                "latency_ms": result.get("latency_ms", 0)
-            })
-            
-            # Send audio if available
-            if result.get("audio_data"):
-                await websocket.send_bytes(result["audio_data"])
-                
-            logger.info(f"Translation sent successfully: {result.get('original_text', '')[:30]}...")
+            await deliver_result(websocket, session_id, result)
         else:
             logger.warning("No translation result - skipping")
             
@@ -281,6 +285,65 @@ async def process_audio_chunk(
             pass  # WebSocket might already be closed
 
 
+async def deliver_result(websocket: WebSocket, session_id: str, result: Dict):
+    """
+    Send a translation result to the client and buffer it for replay
+    Sentence audio (audio_parts) is sent clip by clip as each one is ready
+    """
+    session = active_sessions.get(session_id)
+    if not session:
+        return
+    
+    # Check if WebSocket is still open before sending
+    connected = websocket.client_state.name == "CONNECTED"
+    if not connected:
+        logger.warning("WebSocket closed - cannot send result")
+    else:
+        # Send to client
+        await websocket.send_json({
+            "type": "translation",
+            "timestamp": result.get("timestamp"),
+            "original": result.get("original_text"),
+            "translated": result.get("translated_text"),
+            "source_lang": result.get("source_lang"),
+            "target_lang": result.get("target_lang"),
+            "latency_ms": result.get("latency_ms", 0),
+            "profile": result.get("profile")
+        })
+    
+    audio_data = result.get("audio_data")
+    audio_parts = result.get("audio_parts")
+    if audio_parts:
+        clips = []
+        for index, part in enumerate(audio_parts):
+            try:
+                clip = await part
+            except Exception as e:
+                logger.error(f"TTS failed for sentence {index + 1}/{len(audio_parts)}: {e}")
+                for remaining in audio_parts[index + 1:]:
+                    remaining.cancel()
+                break
+            clips.append(clip)
+            if connected:
+                await websocket.send_bytes(clip)
+        audio_data = b"".join(clips)
+    elif audio_data and connected:
+        await websocket.send_bytes(audio_data)
+    
+    # Buffer for replay
+    session["buffer"].add_segment(
+        timestamp=result.get("timestamp"),
+        original_text=result.get("original_text", ""),
+        translated_text=result.get("translated_text", ""),
+        audio_data=audio_data,
+        source_lang=result.get("source_lang", ""),
+        target_lang=result.get("target_lang", "")
+    )
+    
+    if connected:
+        logger.info(f"Translation sent successfully: {result.get('original_text', '')[:30]}...")
+
+
 async def handle_control_message(
     websocket: WebSocket,
     session_id: str,
@@ -310,6 +373,15 @@ async def handle_control_message(
             "target_lang": target_lang
         })
     
+    elif action == "set_profile":
+        # Latency tier: models, voice and token limits (traditional mode only)
+        translator = session["translator"]
+        if not isinstance(translator, TraditionalTranslator):
+            await websocket.send_json({"type": "error", "message": "Model profiles apply to traditional mode only"})
+            return
+        profile = translator.set_profile(message.get("profile"))
+        await websocket.send_json({"type": "profile_updated", "profile": profile.name})
+    
     elif action == "ping":
         # Heartbeat
         await websocket.send_json({"type": "pong", "timestamp": datetime.utcnow().isoformat()})
@@ -336,8 +408,8 @@ async def generate_replay(websocket: WebSocket, session_id: str, duration: int):
         })
         return
     
-    # Generate concatenated audio and VTT
-    audio_data, vtt_data = buffer_manager.export_replay(segments)
+    # Generate concatenated audio and VTT (pydub work runs in the audio worker pool)
+    audio_data, vtt_data = await buffer_manager.export_replay_async(segments)
     
     # Send replay package
     await websocket.send_json({
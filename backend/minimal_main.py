@@ -11,10 +11,9 @@ import logging
 import uuid
 import time
 import base64
-import io
 import requests
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple
 import os
 from auth import verify_google_token, create_session_token
 from usage import check_usage_limit, get_usage_info
@@ -24,6 +23,22 @@ from database import (
     check_fingerprint_used, update_user_tier, get_user_by_subscription_id,
     update_stripe_customer, get_user_stripe_customer_id, get_db_connection
 )
+from services.audio_workers import audio_pool
+from services.deadline import Deadline
+from services.language_detect import DETECTION_MODES, LANGUAGE_DETECTION, detect_spoken_language
+from services.degradation import degradation
+from services.model_profiles import MODEL_PROFILES, ModelProfile, get_profile, record_profile_latency
+from services.openai_clients import openai_clients
+from services.pivot import (
+    PATH_ENGLISH_CACHED, PATH_SINGLE, PATH_SINGLE_FALLBACK, PATH_TWO_CALL, PIVOT_MODE,
+    english_cache, parse_pivot_content
+)
+from services.prompts import pivot_messages, record_prompt_usage, translation_messages
+from services.transcript_filter import filter_transcription
+from services.translation_routes import ROUTE_DIRECT, ROUTE_PIVOT_SINGLE, translation_router
+from services.utterance_coalescer import UtteranceCoalescer
+from services.whisper_upload import prepare_whisper_upload, get_upload_stats
+from utils.metrics import metrics
 from stripe_integration import (
     create_checkout_session, create_portal_session,
     verify_webhook_signature, handle_checkout_completed,
@@ -65,88 +80,212 @@ DAILY_API_KEY = os.getenv("DAILY_API_KEY")  # Get from https://dashboard.daily.c
 FREE_MINUTES_LIMIT = 15  # Free tier limit
 MAX_AUDIO_SIZE = 10 * 1024 * 1024  # 10MB max audio chunk (security limit)
 MAX_CONCURRENT_CALLS_PER_USER = 3  # Prevent abuse
+# Room translation: "whisper" (Whisper→GPT→TTS chain) or "realtime" (OpenAI Realtime sessions, Whisper fallback)
+ROOM_TRANSLATION_MODE = os.getenv("ROOM_TRANSLATION_MODE", "whisper")
+ROOM_MODES = ("whisper", "realtime")
+
+async def post_translation(text: str, source_lang: str, target_lang: str,
+                           deadline: Optional[Deadline] = None, profile: Optional[ModelProfile] = None):
+    """
+    Chat completion for one translation (prefix-cache-friendly prompt layout)
+    with the profile's MT model and token limit
+    
+    Returns:
+        The HTTP response; callers check status_code
+    """
+    profile = profile or get_profile(None)
+    started = time.perf_counter()
+    response = await openai_clients.post_within(
+        "https://api.openai.com/v1/chat/completions", deadline, "minimal.mt", cap=4,
+        headers={
+            "Authorization": f"Bearer {OPENAI_API_KEY}",
+            "Content-Type": "application/json"
+        },
+        json={
+            "model": profile.mt_model,
+            "messages": translation_messages(text, source_lang, target_lang),
+            "max_tokens": profile.mt_max_tokens,
+            "temperature": 0,
+        }
+    )
+    if response.status_code == 200:
+        record_prompt_usage("minimal.mt", response.json().get("usage"), (time.perf_counter() - started) * 1000)
+    return response
+
+async def post_speech(text: str, deadline: Optional[Deadline] = None,
+                      profile: Optional[ModelProfile] = None):
+    """
+    Speech for a translation with the profile's TTS model, voice and format
+    
+    Returns:
+        The HTTP response; callers check status_code
+    """
+    profile = profile or get_profile(None)
+    return await openai_clients.post_within(
+        "https://api.openai.com/v1/audio/speech", deadline, "minimal.tts", cap=10,
+        headers={
+            "Authorization": f"Bearer {OPENAI_API_KEY}",
+            "Content-Type": "application/json"
+        },
+        json={
+            "model": profile.tts_model,
+            "voice": profile.tts_voice,
+            "input": text[:4096],  # OpenAI TTS max is 4096 chars
+            "response_format": profile.tts_format,
+            "speed": profile.tts_speed
+        }
+    )
+
+async def post_pivot(text: str, source_lang: str, target_lang: str,
+                     deadline: Optional[Deadline] = None, profile: Optional[ModelProfile] = None):
+    """
+    One chat completion returning the English intermediate and the target translation
+    as a JSON object (see parse_pivot_content)
+    
+    Returns:
+        The HTTP response; callers check status_code
+    """
+    profile = profile or get_profile(None)
+    started = time.perf_counter()
+    response = await openai_clients.post_within(
+        "https://api.openai.com/v1/chat/completions", deadline, "minimal.pivot", cap=6,
+        headers={
+            "Authorization": f"Bearer {OPENAI_API_KEY}",
+            "Content-Type": "application/json"
+        },
+        json={
+            "model": profile.mt_model,
+            "messages": pivot_messages(text, source_lang, target_lang),
+            "max_tokens": profile.mt_max_tokens * 2,  # English + target
+            "temperature": 0,
+            "response_format": {"type": "json_object"}
+        }
+    )
+    if response.status_code == 200:
+        record_prompt_usage("minimal.pivot", response.json().get("usage"), (time.perf_counter() - started) * 1000)
+    return response
 
 # Helper function for two-step translation (improves quality via English intermediary)
-def translate_via_english(text: str, source_lang: str, target_lang: str) -> str:
+async def translate_via_english(text: str, source_lang: str, target_lang: str,
+                                deadline: Optional[Deadline] = None,
+                                profile: Optional[ModelProfile] = None,
+                                mode: str = PIVOT_MODE) -> Tuple[str, str]:
     """
     Two-step translation: source → English → target
     Improves quality because English has the best training data
     Works for any language pair, especially useful for Icelandic
     
+    English intermediates are cached, so other target languages for the same
+    utterance only pay for the English → target step.
+    
     Args:
         text: Source text to translate
         source_lang: Source language code
         target_lang: Target language code
+        deadline: Utterance latency budget shared by both steps
+        profile: Model profile for both steps
+        mode: "single" (one structured-output request) or "two_call"
     
     Returns:
-        Translated text
+        Translated text and the path taken (PATH_* in services/pivot.py)
     """
     try:
-        # Step 1: Translate to English (if not already English)
-        if source_lang != "en":
+        english_text = text if source_lang == "en" else english_cache.get(source_lang, text)
+        path = PATH_ENGLISH_CACHED if english_text is not None else PATH_TWO_CALL
+        
+        # Single request: source → English → target, both returned as JSON
+        if english_text is None and mode == "single":
+            logger.info(f"🌍 Pivot: Translating {source_lang} → English → {target_lang} in one request")
+            pivot_response = await post_pivot(text, source_lang, target_lang, deadline, profile)
+            
+            if pivot_response.status_code != 200:
+                raise Exception(f"Pivot translation failed: {pivot_response.status_code}")
+            
+            try:
+                english_text, final_translation = parse_pivot_content(
+                    pivot_response.json()["choices"][0]["message"]["content"]
+                )
+                english_cache.put(source_lang, text, english_text)
+                metrics.increment("pivot.single")
+                logger.info(f"✅ English intermediate: '{english_text}'")
+                logger.info(f"✅ Final translation: '{final_translation}'")
+                return final_translation, PATH_SINGLE
+            except ValueError as e:
+                metrics.increment("pivot.parse_failures")
+                logger.warning(f"⚠️ {e} - falling back to two requests")
+                english_text = None
+                path = PATH_SINGLE_FALLBACK
+        
+        # Step 1: Translate to English (if not already English or cached)
+        if english_text is None:
             logger.info(f"🌍 Step 1: Translating {source_lang} → English")
-            step1_response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {OPENAI_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": "gpt-3.5-turbo",
-                    "messages": [
-                        {"role": "user", "content": f"Translate from {source_lang} to English. Maintain natural conversational tone. Use correct spelling, grammar, and punctuation.\n\nText to translate:\n{text}"}
-                    ],
-                    "max_tokens": 200,
-                    "temperature": 0,
-                },
-                timeout=4
-            )
+            step1_response = await post_translation(text, source_lang, "en", deadline, profile)
             
             if step1_response.status_code != 200:
                 raise Exception(f"Step 1 translation failed: {step1_response.status_code}")
             
             english_text = step1_response.json()["choices"][0]["message"]["content"].strip()
+            english_cache.put(source_lang, text, english_text)
             logger.info(f"✅ English intermediate: '{english_text}'")
-        else:
-            english_text = text
         
         # Step 2: Translate English → target language
         logger.info(f"🌍 Step 2: Translating English → {target_lang}")
         
-        # Add Icelandic-specific instructions only if target is Icelandic
-        target_instructions = ""
-        if target_lang == "is":
-            target_instructions = "\n\nCRITICAL for Icelandic: Use correct spelling and grammar. Pay special attention to:\n- Special characters: ð (eth), þ (thorn), æ, ö\n- Correct declensions and conjugations\n- Proper capitalization (Icelandic uses lowercase for most nouns)\n- Natural Icelandic word order\n"
-        
-        step2_response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {OPENAI_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "model": "gpt-3.5-turbo",
-                "messages": [
-                    {"role": "user", "content": f"Translate from English to {target_lang}.{target_instructions}Maintain natural conversational tone. Use correct spelling, grammar, and punctuation.\n\nText to translate:\n{english_text}"}
-                ],
-                "max_tokens": 200,
-                "temperature": 0,
-            },
-            timeout=4
-        )
+        # Icelandic-specific instructions come with the pair's cached prompt prefix
+        step2_response = await post_translation(english_text, "en", target_lang, deadline, profile)
         
         if step2_response.status_code != 200:
             raise Exception(f"Step 2 translation failed: {step2_response.status_code}")
         
         final_translation = step2_response.json()["choices"][0]["message"]["content"].strip()
+        metrics.increment(f"pivot.{path}")
         logger.info(f"✅ Final translation: '{final_translation}'")
         
-        return final_translation
+        return final_translation, path
         
     except Exception as e:
         logger.error(f"❌ Two-step translation error: {e}")
         raise
 
+async def translate_routed(text: str, source_lang: str, target_lang: str,
+                           deadline: Optional[Deadline] = None,
+                           profile: Optional[ModelProfile] = None) -> str:
+    """
+    Translate over the route translation_router picks for the pair (direct,
+    single-call pivot or two-call pivot) and record how it went
+    
+    Returns:
+        Translated text
+    
+    Raises:
+        Exception: The chosen route failed
+    """
+    route = translation_router.choose(source_lang, target_lang)
+    started = time.perf_counter()
+    try:
+        if route == ROUTE_DIRECT:
+            response = await post_translation(text, source_lang, target_lang, deadline, profile)
+            if response.status_code != 200:
+                raise Exception(f"Translation failed: {response.status_code}")
+            translated = response.json()["choices"][0]["message"]["content"].strip()
+        else:
+            logger.info(f"🌍 Using {route} translation: {source_lang} → English → {target_lang}")
+            mode = PATH_SINGLE if route == ROUTE_PIVOT_SINGLE else PATH_TWO_CALL
+            translated, path = await translate_via_english(text, source_lang, target_lang, deadline, profile, mode=mode)
+            if path != mode:
+                # Not what the route costs: an English-cache hit is one English → target call,
+                # and a single-call fallback paid for three requests. Neither feeds route latency
+                if path == PATH_SINGLE_FALLBACK:
+                    translation_router.record(source_lang, target_lang, route, 0, ok=False)
+                else:
+                    metrics.observe(f"routes.{source_lang}-{target_lang}.{path}_ms", (time.perf_counter() - started) * 1000)
+                return translated
+    except Exception:
+        translation_router.record(source_lang, target_lang, route, 0, ok=False)
+        raise
+    translation_router.record(source_lang, target_lang, route, (time.perf_counter() - started) * 1000, ok=True)
+    return translated
+
 # Setup
 app = FastAPI(title="LiveTranslateAI API", version="1.0.0")
 
@@ -206,6 +345,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def startup_event():
+    """Start process-wide workers"""
+    await audio_pool.start()
+    await openai_clients.start(OPENAI_API_KEY)
+    degradation.start()
+    if OPENAI_API_KEY:
+        from services.translator_realtime import session_pool
+        await session_pool.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop process-wide workers"""
+    from services.realtime_rooms import realtime_rooms
+    from services.translator_realtime import session_pool
+    await realtime_rooms.close_all()
+    room_coalescer.shutdown()
+    await session_pool.shutdown()
+    await degradation.shutdown()
+    await openai_clients.shutdown()
+    await audio_pool.shutdown()
+
 @app.get("/")
 async def root():
     return {"service": "LiveTranslateAI", "status": "running"}
@@ -215,7 +376,24 @@ async def health_check():
     return {
         "status": "healthy",
         "api_key_configured": bool(OPENAI_API_KEY),
-        "mode": "minimal"
+        "mode": "minimal",
+        "whisper_upload": get_upload_stats(),
+        "openai_pool": openai_clients.get_stats(),
+        "deadlines": metrics.snapshot("deadline."),
+        "prompt_cache": metrics.snapshot("prompt_cache."),
+        "profiles": metrics.snapshot("profiles."),
+        "degradation": degradation.get_stats(),
+        "transcript_filter": metrics.snapshot("transcript_filter.")["counters"],
+        "coalescer": room_coalescer.get_stats(),
+        "pivot": {
+            "mode": PIVOT_MODE,
+            "english_cache": english_cache.get_stats(),
+            "single": metrics.counters.get("pivot.single", 0),
+            "two_call": metrics.counters.get("pivot.two_call", 0),
+            "single_fallback": metrics.counters.get("pivot.single_fallback", 0),
+            "english_cached": metrics.counters.get("pivot.english_cached", 0),
+            "parse_failures": metrics.counters.get("pivot.parse_failures", 0)
+        }
     }
 
 @app.post("/api/auth/google")
@@ -373,13 +551,22 @@ async def create_room(request: Request):
             "is_host": True
         }
         
+        room_mode = data.get('mode') if data.get('mode') in ROOM_MODES else ROOM_TRANSLATION_MODE
+        room_profile = get_profile(data.get('profile')).name
+        room_tier = host_user.get('tier', 'free')  # Lower tiers are shed first under load
+        room_detection = data.get('language_detection') if data.get('language_detection') in DETECTION_MODES else LANGUAGE_DETECTION
+        
         rooms[room_id] = {
             "id": room_id,
             "host_user_id": user_id,  # Track HOST for billing
             "host_name": host_user.get('name', 'Host'),
             "created_at": datetime.utcnow().isoformat(),
             "participants": [host_participant],
-            "active": True
+            "active": True,
+            "mode": room_mode,
+            "profile": room_profile,
+            "tier": room_tier,
+            "language_detection": room_detection
         }
         active_connections[room_id] = []
         logger.info(f"🏠 Created room: {room_id} for HOST: {host_user.get('name')} (user_id: {user_id})")
@@ -570,6 +757,12 @@ async def create_stripe_checkout(request: Request):
         logger.error(f"❌ Stripe checkout error: {e}")
         return JSONResponse({"error": str(e)}, status_code=500)
 
+@app.get("/api/admin/translation-routes")
+@limiter.limit("30/minute")  # Rate limit admin endpoints
+async def get_translation_routes(request: Request):
+    """Admin endpoint: current translation route per language pair with p50/p95 latencies"""
+    return translation_router.get_stats()
+
 @app.post("/api/admin/reset-account")
 @limiter.limit("10/minute")  # Rate limit admin endpoints
 async def reset_account(request: Request):
@@ -929,6 +1122,7 @@ async def websocket_translate(websocket: WebSocket):
     # Default language settings
     source_lang = "en"
     target_lang = "es"
+    profile = get_profile(None)
     
     try:
         await websocket.send_json({
@@ -949,12 +1143,14 @@ async def websocket_translate(websocket: WebSocket):
                     
                     # Real translation pipeline: Whisper STT → GPT Translation
                     try:
-                        import requests
-                        import io
                         import time
                         
                         start_time = time.time()
                         whisper_start = time.time()
+                        # Latency budget for this utterance, shared by STT, MT and TTS
+                        deadline = Deadline()
+                        # Under load the controller may force faster models for this utterance
+                        active_profile = degradation.effective_profile(profile)
                         
                         # Step 1: Transcribe audio with Whisper (optimized)
                         logger.info("📝 Starting Whisper transcription...")
@@ -965,113 +1161,67 @@ async def websocket_translate(websocket: WebSocket):
                             whisper_prompt = "Þetta er íslenskur texti með íslenskum stöfum: ð, þ, æ, ö. Algeng orð og setningar: vandamálið, prófum, prófa, prófað, prófun, þýðing, þýðingin, þýðingar, þýða, þýðir, þýddi, spænska, spænsku, íslenska, íslensku, íslenskar, íslenskum, nokkurnvegin, nokkurn veginn, rétt, réttur, réttur, rétt, réttri, réttum, textinn, texti, texta, þarf, þarft, þurfa, þurftu, nákvæmlega, nákvæmur, nákvæmt, getur, geta, getum, getið, gettu, leiðinlegt, leiðinlegur, leiðinleg, sjáum, sjá, sér, séð, smátt, smá, smáir, smáar, smáum, hversu, hversu mikið, hversu lengi, ættir, ætti, ættum, ættuð, ættu, appið, app, appi, appin, finn, finna, finnur, finnum, finnið, finna, núna, hægt, rólega, rólegur, rólegt, missa, missir, missum, missið, missa, venjuna, venja, venjur, venjum, einbeita, einbeitir, einbeitum, einbeitið, einbeita, einbeita mér, einbeitir sér, einbeitum okkur, mikið, mikill, mikil, miklu, miklar, miklar, hluti, hlutir, hlutum, hluta, fara, fer, förum, farið, fara, taka, tekur, tökum, takið, taka, rólega, bókka, bókkar, bókkum, bókkið, bókka, ykkur, ykkar, án, án skotands, án áhyggjna, byrja, byrjar, byrjum, byrjið, byrja, byrja mér, róa, róar, róum, róið, róa, róa mér, standa, stendur, stöndum, standið, standa, standast, stendst, stöndumst, standist, standast, þar, held, halda, höldum, haldið, halda, eiginlega, væri, værum, væruð, væru, væri, fallið, fallinn, fallin, fallnir, fallnar, nýtt, nýr, ný, nýjum, nýja, nýjar, erfitt, erfiður, erfið, erfiðir, erfiðar, erfiðum, erfiða, láta, lætur, látum, látið, láta, láta mér, ná, nær, náum, náið, ná, ná það, vaga, vagar, vöguð, vagið, vaga, vaga mér."
                         
                         whisper_data = {
-                            "model": "whisper-1",
+                            "model": active_profile.stt_model,
                             "language": source_lang,  # Use selected source language
-                            "response_format": "json"  # Explicit format
+                            "response_format": "verbose_json"  # Segment no_speech_prob/avg_logprob/compression_ratio for the filter
                         }
                         if whisper_prompt:
                             whisper_data["prompt"] = whisper_prompt
                         
-                        whisper_response = requests.post(
-                            "https://api.openai.com/v1/audio/transcriptions",
+                        # Optionally shrink large uploads (mono 16kHz Opus/FLAC) before sending
+                        upload_name, upload_bytes, upload_mime = await prepare_whisper_upload(audio_chunk)
+                        
+                        # Whisper is usually done in 2-4s; no single attempt may exceed 10s
+                        whisper_response = await openai_clients.post_within(
+                            "https://api.openai.com/v1/audio/transcriptions", deadline, "minimal.stt", cap=10,
                             headers={
                                 "Authorization": f"Bearer {OPENAI_API_KEY}"
                             },
                             files={
-                                "file": ("audio.webm", io.BytesIO(audio_chunk), "audio/webm")
+                                "file": (upload_name, upload_bytes, upload_mime)
                             },
-                            data=whisper_data,
-                            timeout=10  # Whisper is usually done in 2-4s
+                            data=whisper_data
                         )
                         
                         if whisper_response.status_code != 200:
                             raise Exception(f"Whisper failed: {whisper_response.status_code} - {whisper_response.text}")
                         
-                        transcription = whisper_response.json().get("text", "").strip()
+                        transcription = filter_transcription(whisper_response.json())  # Drops silence/hallucinated segments
                         whisper_time = int((time.time() - whisper_start) * 1000)
                         logger.info(f"✅ Transcription: '{transcription}' ({whisper_time}ms)")
                         
                         if not transcription:
                             raise Exception("Empty transcription - no speech detected")
                         
-                        # Step 2: Translate with GPT-3.5-turbo
-                        # Use two-step translation (via English) for Icelandic translations
-                        # This improves quality because English has the best training data
+                        # Step 2: Translate (direct or via English, chosen from measured latency per pair)
                         translation_start = time.time()
                         logger.info("🌍 Starting translation...")
-                        
-                        if target_lang == "is" and source_lang != "en":
-                            # Two-step: source → English → Icelandic (better quality)
-                            logger.info(f"🌍 Using two-step translation for better Icelandic quality: {source_lang} → English → Icelandic")
-                            translated = translate_via_english(transcription, source_lang, target_lang)
-                        elif source_lang == "is" and target_lang != "en":
-                            # Two-step: Icelandic → English → target (ensures proper translation from Icelandic)
-                            logger.info(f"🌍 Using two-step translation from Icelandic: {source_lang} → English → {target_lang}")
-                            translated = translate_via_english(transcription, source_lang, target_lang)
-                        else:
-                            # Direct translation (faster, sufficient for most cases)
-                            icelandic_instructions = ""
-                            if target_lang == "is":
-                                icelandic_instructions = "\n\nCRITICAL for Icelandic: Use correct spelling and grammar. Pay special attention to:\n- Special characters: ð (eth), þ (thorn), æ, ö\n- Correct declensions and conjugations\n- Proper capitalization (Icelandic uses lowercase for most nouns)\n- Natural Icelandic word order\n"
-                            
-                            translation_prompt = f"Translate from {source_lang} to {target_lang}.{icelandic_instructions}Maintain natural conversational tone. Use correct spelling, grammar, and punctuation.\n\nText to translate:\n{transcription}"
-                            
-                            translation_response = requests.post(
-                                "https://api.openai.com/v1/chat/completions",
-                                headers={
-                                    "Authorization": f"Bearer {OPENAI_API_KEY}",
-                                    "Content-Type": "application/json"
-                                },
-                                json={
-                                    "model": "gpt-3.5-turbo",  # 5x faster than GPT-4o for simple translations
-                                    "messages": [
-                                        {"role": "user", "content": translation_prompt}
-                                    ],
-                                    "max_tokens": 200,
-                                    "temperature": 0,
-                                },
-                                timeout=4  # Much faster model
-                            )
-                            
-                            if translation_response.status_code != 200:
-                                raise Exception(f"Translation failed: {translation_response.status_code}")
-                            
-                            translated = translation_response.json()["choices"][0]["message"]["content"].strip()
+                        translated = await translate_routed(transcription, source_lang, target_lang, deadline, active_profile)
                         
                         translation_time = int((time.time() - translation_start) * 1000)
                         logger.info(f"✅ Translation: '{translated}' ({translation_time}ms)")
                         
                         # Step 3: Generate TTS audio (ultra-optimized)
                         tts_start = time.time()
-                        logger.info("🔊 Starting TTS audio generation...")
-                        tts_response = requests.post(
-                            "https://api.openai.com/v1/audio/speech",
-                            headers={
-                                "Authorization": f"Bearer {OPENAI_API_KEY}",
-                                "Content-Type": "application/json"
-                            },
-                            json={
-                                "model": "tts-1",
-                                "voice": "alloy",  # Fastest voice
-                                "input": translated[:4096],  # OpenAI TTS max is 4096 chars
-                                "response_format": "opus",
-                                "speed": 1.05  # Slightly faster (barely noticeable)
-                            },
-                            timeout=10
-                        )
-                        
-                        if tts_response.status_code != 200:
-                            logger.warning(f"TTS failed: {tts_response.status_code}")
-                            audio_base64 = None
+                        audio_base64 = None
+                        if degradation.skip_tts:
+                            logger.info("📉 Captions only under load - skipping TTS")
                         else:
-                            # Convert audio to base64 for sending via WebSocket
-                            import base64
-                            audio_base64 = base64.b64encode(tts_response.content).decode('utf-8')
-                            tts_time = int((time.time() - tts_start) * 1000)
-                            logger.info(f"✅ TTS audio generated: {len(tts_response.content)} bytes ({tts_time}ms)")
+                            logger.info("🔊 Starting TTS audio generation...")
+                            tts_response = await post_speech(translated, deadline, active_profile)
+                            
+                            if tts_response.status_code != 200:
+                                logger.warning(f"TTS failed: {tts_response.status_code}")
+                            else:
+                                # Convert audio to base64 for sending via WebSocket
+                                import base64
+                                audio_base64 = base64.b64encode(tts_response.content).decode('utf-8')
+                                tts_time = int((time.time() - tts_start) * 1000)
+                                logger.info(f"✅ TTS audio generated: {len(tts_response.content)} bytes ({tts_time}ms)")
                         
                         latency_ms = int((time.time() - start_time) * 1000)
-                        logger.info(f"⏱️ Total latency: {latency_ms}ms (Whisper: {whisper_time}ms | Translation: {translation_time}ms | TTS: {tts_time if tts_response.status_code == 200 else 0}ms)")
+                        record_profile_latency(active_profile, latency_ms)
+                        logger.info(f"⏱️ Total latency: {latency_ms}ms (Whisper: {whisper_time}ms | Translation: {translation_time}ms | TTS: {tts_time if audio_base64 else 0}ms)")
                         
                         # Hide original transcription ONLY when source is Icelandic (workers don't need to see what they said)
                         # BUT show it when target is Icelandic (workers need to see what refugees said)
@@ -1086,7 +1236,8 @@ async def websocket_translate(websocket: WebSocket):
                             "source_lang": source_lang,
                             "target_lang": target_lang,
                             "latency_ms": latency_ms,
-                            "audio_base64": audio_base64
+                            "audio_base64": audio_base64,
+                            "profile": active_profile.name
                         })
                             
                     except Exception as e:
@@ -1104,6 +1255,10 @@ async def websocket_translate(websocket: WebSocket):
                         source_lang = message.get("source_lang", "en")
                         target_lang = message.get("target_lang", "es")
                         logger.info(f"Language settings updated: {source_lang} → {target_lang}")
+                    elif message.get("action") == "set_profile":
+                        profile = get_profile(message.get("profile"))
+                        logger.info(f"Model profile: {profile.name}")
+                        await websocket.send_json({"type": "profile_updated", "profile": profile.name})
                         
             except WebSocketDisconnect:
                 break
@@ -1200,8 +1355,26 @@ async def websocket_room(websocket: WebSocket, room_id: str):
                     
                     if speaker_id:
                         logger.info(f"🎤 Received audio from participant {speaker_id} in room {room_id}: {len(audio_chunk)} bytes")
+                        # Under heavy load, low-priority rooms are paused (notified once per episode)
+                        if degradation.should_shed(room_id, rooms[room_id].get("tier", "free")):
+                            if not rooms[room_id].get("shed"):
+                                rooms[room_id]["shed"] = True
+                                await broadcast_to_room(room_id, {
+                                    "type": "status",
+                                    "message": "Translation paused: service is under heavy load"
+                                })
+                            continue
+                        if rooms[room_id].pop("shed", False):
+                            await broadcast_to_room(room_id, {
+                                "type": "status",
+                                "message": "Translation resumed"
+                            })
+                        
                         # Process translation for OTHER participants only (exclude speaker)
-                        await process_room_translation(room_id, audio_chunk, speaker_id)
+                        if rooms[room_id].get("mode") == "realtime":
+                            await process_room_realtime(room_id, audio_chunk, speaker_id)
+                        else:
+                            await process_room_translation(room_id, audio_chunk, speaker_id)
                     else:
                         logger.error(f"❌ Cannot process audio - no participant_id associated with WebSocket {websocket_id} in room {room_id}")
                         logger.error(f"❌ Current participant_id: {current_participant_id}")
@@ -1218,6 +1391,42 @@ async def websocket_room(websocket: WebSocket, room_id: str):
                     
                     if message.get("action") == "ping":
                         await websocket.send_json({"type": "pong"})
+                    elif message.get("action") == "room_mode":
+                        # Switch between Whisper pipeline and Realtime sessions (host only: it closes everyone's sessions)
+                        mode = message.get("mode")
+                        if not is_room_host(room_id, current_participant_id):
+                            await websocket.send_json({"type": "error", "message": "Only the host can change the room mode"})
+                        elif mode in ROOM_MODES:
+                            rooms[room_id]["mode"] = mode
+                            if mode != "realtime":
+                                from services.realtime_rooms import realtime_rooms
+                                for participant in rooms[room_id]["participants"]:
+                                    await realtime_rooms.close_speaker(room_id, participant["id"])
+                            logger.info(f"🏠 Room {room_id} translation mode: {mode}")
+                            await broadcast_to_room(room_id, {"type": "room_mode", "mode": mode})
+                    elif message.get("action") == "set_profile":
+                        # Latency tier for the Whisper pipeline (host only: it sets cost and latency for every listener)
+                        if not is_room_host(room_id, current_participant_id):
+                            await websocket.send_json({"type": "error", "message": "Only the host can change the model profile"})
+                        elif message.get("profile") in MODEL_PROFILES:
+                            rooms[room_id]["profile"] = message["profile"]
+                            logger.info(f"🏠 Room {room_id} model profile: {message['profile']}")
+                            await broadcast_to_room(room_id, {"type": "room_profile", "profile": message["profile"]})
+                    elif message.get("action") == "language_detection":
+                        # "detect": route on Whisper's detected language instead of the declared one
+                        # (host only: it changes routing for every speaker)
+                        if not is_room_host(room_id, current_participant_id):
+                            await websocket.send_json({"type": "error", "message": "Only the host can change language detection"})
+                        elif message.get("mode") in DETECTION_MODES:
+                            rooms[room_id]["language_detection"] = message["mode"]
+                            logger.info(f"🏠 Room {room_id} language detection: {message['mode']}")
+                            await broadcast_to_room(room_id, {"type": "language_detection", "mode": message["mode"]})
+                    elif message.get("action") == "audio_output":
+                        # Realtime rooms: stream audio_delta messages instead of one clip per translation
+                        if current_participant_id:
+                            for participant in rooms[room_id]["participants"]:
+                                if participant["id"] == current_participant_id:
+                                    participant["stream_audio"] = message.get("format") == "stream"
                     elif message.get("action") == "set_language":
                         # Update participant language
                         participant_id = message.get("participant_id")
@@ -1303,6 +1512,14 @@ async def websocket_room(websocket: WebSocket, room_id: str):
         websocket_id = id(websocket)
         if websocket_id in websocket_to_participant:
             participant_id = websocket_to_participant[websocket_id]
+            # Deliver anything the speaker said right before leaving
+            await room_coalescer.close((room_id, participant_id))
+            if rooms.get(room_id, {}).get("mode") == "realtime":
+                try:
+                    from services.realtime_rooms import realtime_rooms
+                    await realtime_rooms.close_speaker(room_id, participant_id)
+                except Exception as e:
+                    logger.error(f"❌ Failed to close Realtime sessions for {participant_id}: {e}")
             if participant_id in participant_connections:
                 del participant_connections[participant_id]
             del websocket_to_participant[websocket_id]
@@ -1313,8 +1530,54 @@ async def websocket_room(websocket: WebSocket, room_id: str):
             active_connections[room_id] = [conn for conn in active_connections[room_id] if conn != websocket]
             logger.info(f"👋 User left room {room_id} (remaining: {len(active_connections[room_id])})")
 
-async def process_room_translation(room_id: str, audio_chunk: bytes, speaker_id: str):
-    """Process translation for room and send to listeners (exclude speaker)"""
+async def process_room_realtime(room_id: str, audio_chunk: bytes, speaker_id: str):
+    """
+    Translate room audio through OpenAI Realtime sessions (one per listener language)
+    Falls back to the Whisper pipeline for languages without a session
+    """
+    participants = rooms[room_id]["participants"]
+    speaker_participant = next((p for p in participants if p["id"] == speaker_id), None)
+    if not speaker_participant:
+        logger.error(f"Speaker {speaker_id} not found in room participants")
+        return
+    
+    speaker_source_lang = speaker_participant.get("source_lang", "en")
+    # Listeners hear translations in their source (native) language; skip those who already understand
+    listener_langs = {
+        p.get("source_lang", "en") for p in participants
+        if p["id"] != speaker_id and p.get("source_lang", "en") != speaker_source_lang
+    }
+    if not listener_langs:
+        return
+    
+    def listeners_for(lang: str):
+        # Resolved at send time so joins/leaves/language changes apply mid-response
+        return lambda: [
+            p for p in rooms.get(room_id, {}).get("participants", [])
+            if p["id"] != speaker_id and p.get("source_lang", "en") == lang
+        ]
+    
+    try:
+        from services.realtime_rooms import realtime_rooms
+        unserved = await realtime_rooms.route(
+            room_id, speaker_id, speaker_source_lang, listener_langs, audio_chunk,
+            listeners_for, lambda pid, message: send_to_participant(room_id, pid, message)
+        )
+    except Exception as e:
+        logger.error(f"❌ Realtime room translation failed, using Whisper: {e}")
+        unserved = listener_langs
+    
+    if unserved:
+        await process_room_translation(room_id, audio_chunk, speaker_id, listener_langs=unserved)
+
+async def process_room_translation(room_id: str, audio_chunk: bytes, speaker_id: str,
+                                   listener_langs: Optional[Set[str]] = None):
+    """
+    Process translation for room and send to listeners (exclude speaker)
+    
+    listener_langs limits delivery to listeners whose native language is in the set
+    (used as the fallback path for Realtime rooms)
+    """
     try:
         start_time = time.time()
         
@@ -1339,6 +1602,11 @@ async def process_room_translation(room_id: str, audio_chunk: bytes, speaker_id:
         
         speaker_source_lang = speaker_participant.get("source_lang", "en")
         logger.info(f"🎤 Speaker {speaker_id} is speaking in {speaker_source_lang}")
+        profile = degradation.effective_profile(get_profile(rooms[room_id].get("profile")))
+        detect_language = rooms[room_id].get("language_detection", LANGUAGE_DETECTION) == "detect"
+        
+        # Latency budget for transcribing this chunk
+        deadline = Deadline()
         
         # Step 1: Transcribe audio ONCE in the speaker's language
         whisper_start = time.time()
@@ -1350,30 +1618,34 @@ async def process_room_translation(room_id: str, audio_chunk: bytes, speaker_id:
             whisper_prompt = "Þetta er íslenskur texti með íslenskum stöfum: ð, þ, æ, ö. Algeng orð og setningar: vandamálið, prófum, prófa, prófað, prófun, þýðing, þýðingin, þýðingar, þýða, þýðir, þýddi, spænska, spænsku, íslenska, íslensku, íslenskar, íslenskum, nokkurnvegin, nokkurn veginn, rétt, réttur, réttur, rétt, réttri, réttum, textinn, texti, texta, þarf, þarft, þurfa, þurftu, nákvæmlega, nákvæmur, nákvæmt, getur, geta, getum, getið, gettu, leiðinlegt, leiðinlegur, leiðinleg, sjáum, sjá, sér, séð, smátt, smá, smáir, smáar, smáum, hversu, hversu mikið, hversu lengi, ættir, ætti, ættum, ættuð, ættu, appið, app, appi, appin, finn, finna, finnur, finnum, finnið, finna, núna, hægt, rólega, rólegur, rólegt, missa, missir, missum, missið, missa, venjuna, venja, venjur, venjum, einbeita, einbeitir, einbeitum, einbeitið, einbeita, einbeita mér, einbeitir sér, einbeitum okkur, mikið, mikill, mikil, miklu, miklar, miklar, hluti, hlutir, hlutum, hluta, fara, fer, förum, farið, fara, taka, tekur, tökum, takið, taka, rólega, bókka, bókkar, bókkum, bókkið, bókka, ykkur, ykkar, án, án skotands, án áhyggjna, byrja, byrjar, byrjum, byrjið, byrja, byrja mér, róa, róar, róum, róið, róa, róa mér, standa, stendur, stöndum, standið, standa, standast, stendst, stöndumst, standist, standast, þar, held, halda, höldum, haldið, halda, eiginlega, væri, værum, væruð, væru, væri, fallið, fallinn, fallin, fallnir, fallnar, nýtt, nýr, ný, nýjum, nýja, nýjar, erfitt, erfiður, erfið, erfiðir, erfiðar, erfiðum, erfiða, láta, lætur, látum, látið, láta, láta mér, ná, nær, náum, náið, ná, ná það, vaga, vagar, vöguð, vagið, vaga, vaga mér."
         
         whisper_data = {
-            "model": "whisper-1",
-            "language": speaker_source_lang,  # Use speaker's source language
-            "response_format": "json"
+            "model": profile.stt_model,
+            "response_format": "verbose_json"  # Segment no_speech_prob/avg_logprob/compression_ratio for the filter
         }
+        if not detect_language:
+            whisper_data["language"] = speaker_source_lang  # Use speaker's source language
         if whisper_prompt:
             whisper_data["prompt"] = whisper_prompt
         
-        whisper_response = requests.post(
-            "https://api.openai.com/v1/audio/transcriptions",
+        # Optionally shrink large uploads (mono 16kHz Opus/FLAC) before sending
+        upload_name, upload_bytes, upload_mime = await prepare_whisper_upload(audio_chunk)
+        
+        whisper_response = await openai_clients.post_within(
+            "https://api.openai.com/v1/audio/transcriptions", deadline, "minimal.stt", cap=10,
             headers={
                 "Authorization": f"Bearer {OPENAI_API_KEY}"
             },
             files={
-                "file": ("audio.webm", io.BytesIO(audio_chunk), "audio/webm")
+                "file": (upload_name, upload_bytes, upload_mime)
             },
-            data=whisper_data,
-            timeout=10
+            data=whisper_data
         )
         
         if whisper_response.status_code != 200:
             logger.error(f"Whisper failed: {whisper_response.status_code} - {whisper_response.text}")
             return
         
-        transcription = whisper_response.json().get("text", "").strip()
+        whisper_json = whisper_response.json()
+        transcription = filter_transcription(whisper_json)  # Drops silence/hallucinated segments
         whisper_time = int((time.time() - whisper_start) * 1000)
         logger.info(f"✅ Transcription: '{transcription}' ({whisper_time}ms)")
         
@@ -1381,8 +1653,55 @@ async def process_room_translation(room_id: str, audio_chunk: bytes, speaker_id:
             logger.warning(f"Empty transcription - no speech detected")
             return
         
+        # Route on the language actually spoken (bilingual speakers switch mid-call)
+        spoken_lang = speaker_source_lang
+        if detect_language:
+            spoken_lang = detect_spoken_language(whisper_json.get("language"), transcription, speaker_source_lang)
+        
+        # Hold short fragments ("so", "and then") per speaker; the merged unit is translated once.
+        # A change of spoken language or listener set delivers the pending unit first
+        listener_key = frozenset(listener_langs) if listener_langs is not None else None
+        await room_coalescer.add(
+            (room_id, speaker_id),
+            transcription,
+            {
+                "spoken_lang": spoken_lang,
+                "listener_langs": listener_langs,
+                "speaker_source_lang": speaker_source_lang,
+                "profile": profile,
+                "start_time": start_time
+            },
+            group=(spoken_lang, listener_key)
+        )
+        
+    except Exception as e:
+        logger.error(f"❌ Room translation error: {e}")
+        await broadcast_to_room(room_id, {
+            "type": "error",
+            "message": f"Translation failed: {str(e)}"
+        })
+
+async def translate_room_utterance(key: Tuple, transcription: str, utterance: Dict):
+    """
+    Translate one (possibly coalesced) utterance and send it to each listener (exclude speaker)
+    
+    key is (room_id, speaker_id) as passed to room_coalescer
+    """
+    room_id, speaker_id = key
+    spoken_lang = utterance["spoken_lang"]
+    listener_langs = utterance["listener_langs"]
+    speaker_source_lang = utterance["speaker_source_lang"]
+    profile = utterance["profile"]
+    start_time = utterance["start_time"]  # First fragment, so latency_ms includes the hold
+    try:
+        if room_id not in rooms:
+            return
+        participants = rooms[room_id]["participants"]
+        
         # Step 2: Process translation for each listener (EXCLUDE the speaker)
         listeners = [p for p in participants if p["id"] != speaker_id]
+        if listener_langs is not None:
+            listeners = [p for p in listeners if p.get("source_lang", "en") in listener_langs]
         logger.info(f"👂 Translating for {len(listeners)} listeners...")
         
         if len(listeners) == 0:
@@ -1392,12 +1711,15 @@ async def process_room_translation(room_id: str, audio_chunk: bytes, speaker_id:
         for listener in listeners:
             listener_id = listener['id']
             listener_name = listener.get('name', listener_id)
+            # Each listener's MT and TTS get their own budget (listeners are served one after another;
+            # the hold before this is bounded by COALESCE_MAX_WAIT_MS)
+            deadline = Deadline()
             source_lang_listener = listener.get("source_lang", "en")
             target_lang_listener = listener.get("target_lang", "es")
             
             logger.info(f"👂 Processing listener: {listener_name} (id: {listener_id})")
             logger.info(f"👂 Listener language settings: source={source_lang_listener} (native), target={target_lang_listener} (speaks to others)")
-            logger.info(f"👂 Speaker is speaking: {speaker_source_lang}, Listener will receive translations in: {source_lang_listener}")
+            logger.info(f"👂 Speaker is speaking: {spoken_lang}, Listener will receive translations in: {source_lang_listener}")
             
             try:
                 # FIXED: Translate to listener's SOURCE language (native), not target_lang
@@ -1429,98 +1751,58 @@ async def process_room_translation(room_id: str, audio_chunk: bytes, speaker_id:
                 # Let's change the logic: translate TO listener's source_lang (their native/comfortable language)
                 
                 # Skip if speaker is already speaking listener's native language
-                if translate_to_lang == speaker_source_lang:
-                    logger.info(f"⏭️ Skipping {listener_name} - speaker is already speaking {speaker_source_lang} which matches listener's native language {translate_to_lang}")
+                if translate_to_lang == spoken_lang:
+                    if spoken_lang != speaker_source_lang:
+                        # Detected switch into the listener's language: original text only, no MT/TTS
+                        logger.info(f"⏭️ {listener_name} understands {spoken_lang} - sending original text")
+                        metrics.increment("language_detect.passthrough")
+                        await send_to_participant(room_id, listener["id"], {
+                            "type": "translation",
+                            "timestamp": datetime.utcnow().timestamp(),
+                            "original": transcription,
+                            "translated": transcription,
+                            "source_lang": spoken_lang,
+                            "target_lang": translate_to_lang,
+                            "latency_ms": int((time.time() - start_time) * 1000),
+                            "audio_base64": None,
+                            "passthrough": True
+                        })
+                    else:
+                        logger.info(f"⏭️ Skipping {listener_name} - speaker is already speaking {spoken_lang} which matches listener's native language {translate_to_lang}")
                     continue
                 
                 # Translate to listener's native language (source), not target
-                logger.info(f"🌍 Translating for {listener_name}: {speaker_source_lang} → {translate_to_lang} (speaker speaks {speaker_source_lang}, listener wants {translate_to_lang})")
+                logger.info(f"🌍 Translating for {listener_name}: {spoken_lang} → {translate_to_lang} (speaker speaks {spoken_lang}, listener wants {translate_to_lang})")
                 
-                # Step 2a: Translate with GPT-3.5-turbo
-                # Use two-step translation (via English) for Icelandic translations
+                # Step 2a: Translate (direct or via English, chosen from measured latency per pair)
                 translation_start = time.time()
-                
-                if translate_to_lang == "is" and speaker_source_lang != "en":
-                    # Two-step: source → English → Icelandic (better quality)
-                    logger.info(f"🌍 Using two-step translation for better Icelandic quality: {speaker_source_lang} → English → Icelandic")
-                    try:
-                        translated = translate_via_english(transcription, speaker_source_lang, translate_to_lang)
-                    except Exception as e:
-                        logger.error(f"Two-step translation failed for {listener['name']}: {e}")
-                        continue
-                elif speaker_source_lang == "is" and translate_to_lang != "en":
-                    # Two-step: Icelandic → English → target (ensures proper translation from Icelandic)
-                    logger.info(f"🌍 Using two-step translation from Icelandic: {speaker_source_lang} → English → {translate_to_lang}")
-                    try:
-                        translated = translate_via_english(transcription, speaker_source_lang, translate_to_lang)
-                    except Exception as e:
-                        logger.error(f"Two-step translation failed for {listener['name']}: {e}")
-                        continue
-                else:
-                    # Direct translation (faster, sufficient for most cases)
-                    icelandic_instructions = ""
-                    if translate_to_lang == "is":
-                        icelandic_instructions = "\n\nCRITICAL for Icelandic: Use correct spelling and grammar. Pay special attention to:\n- Special characters: ð (eth), þ (thorn), æ, ö\n- Correct declensions and conjugations\n- Proper capitalization (Icelandic uses lowercase for most nouns)\n- Natural Icelandic word order\n"
-                    
-                    translation_prompt = f"Translate from {speaker_source_lang} to {translate_to_lang}.{icelandic_instructions}Maintain natural conversational tone. Use correct spelling, grammar, and punctuation.\n\nText to translate:\n{transcription}"
-                    
-                    translation_response = requests.post(
-                        "https://api.openai.com/v1/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {OPENAI_API_KEY}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": "gpt-3.5-turbo",
-                            "messages": [
-                                {"role": "user", "content": translation_prompt}
-                            ],
-                            "max_tokens": 1000,  # Increased to handle longer translations
-                            "temperature": 0,
-                        },
-                        timeout=4
-                    )
-                    
-                    if translation_response.status_code != 200:
-                        logger.error(f"Translation failed for {listener['name']}: {translation_response.status_code}")
-                        continue
-                    
-                    translated = translation_response.json()["choices"][0]["message"]["content"].strip()
+                try:
+                    translated = await translate_routed(transcription, spoken_lang, translate_to_lang, deadline, profile)
+                except Exception as e:
+                    logger.error(f"Translation failed for {listener['name']}: {e}")
+                    continue
                 
                 translation_time = int((time.time() - translation_start) * 1000)
                 logger.info(f"✅ Translation for {listener['name']}: '{translated}' ({translation_time}ms)")
-                logger.info(f"🔍 DEBUG - Translation details: speaker_lang={speaker_source_lang}, translate_to_lang={translate_to_lang}, translated_text_lang={translate_to_lang}")
+                logger.info(f"🔍 DEBUG - Translation details: speaker_lang={spoken_lang}, translate_to_lang={translate_to_lang}, translated_text_lang={translate_to_lang}")
                 
                 # Step 2b: Generate TTS audio
                 tts_start = time.time()
-                tts_response = requests.post(
-                    "https://api.openai.com/v1/audio/speech",
-                    headers={
-                        "Authorization": f"Bearer {OPENAI_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "tts-1",
-                        "voice": "alloy",
-                        "input": translated[:4096],  # OpenAI TTS max is 4096 chars
-                        "response_format": "opus",
-                        "speed": 1.05
-                    },
-                    timeout=10
-                )
-                
                 audio_base64 = None
-                if tts_response.status_code == 200:
+                tts_response = None if degradation.skip_tts else await post_speech(translated, deadline, profile)
+                
+                if tts_response is not None and tts_response.status_code == 200:
                     audio_base64 = base64.b64encode(tts_response.content).decode('utf-8')
                     tts_time = int((time.time() - tts_start) * 1000)
                     logger.info(f"✅ TTS for {listener['name']}: {len(tts_response.content)} bytes ({tts_time}ms)")
                 
                 latency_ms = int((time.time() - start_time) * 1000)
+                record_profile_latency(profile, latency_ms)
                 
                 # Hide original transcription ONLY when source is Icelandic (workers don't need to see what they said)
                 # BUT show it when target is Icelandic (workers need to see what refugees said)
-                # So: hide when speaker_source_lang == "is", show when translate_to_lang == "is"
-                original_display = "" if speaker_source_lang == "is" else transcription
+                # So: hide when spoken_lang == "is", show when translate_to_lang == "is"
+                original_display = "" if spoken_lang == "is" else transcription
                 
                 # Send translation to this specific listener
                 translation_message = {
@@ -1528,12 +1810,13 @@ async def process_room_translation(room_id: str, audio_chunk: bytes, speaker_id:
                     "timestamp": datetime.utcnow().timestamp(),
                     "original": original_display,
                     "translated": translated,
-                    "source_lang": speaker_source_lang,
+                    "source_lang": spoken_lang,
                     "target_lang": translate_to_lang,
                     "latency_ms": latency_ms,
-                    "audio_base64": audio_base64
+                    "audio_base64": audio_base64,
+                    "profile": profile.name
                 }
-                logger.info(f"🔍 DEBUG - Sending to {listener_name}: original_lang={speaker_source_lang}, translated_lang={translate_to_lang}")
+                logger.info(f"🔍 DEBUG - Sending to {listener_name}: original_lang={spoken_lang}, translated_lang={translate_to_lang}")
                 logger.info(f"🔍 DEBUG - Message content: original='{transcription[:50]}...', translated='{translated[:50]}...'")
                 await send_to_participant(room_id, listener["id"], translation_message)
                 
@@ -1547,6 +1830,16 @@ async def process_room_translation(room_id: str, audio_chunk: bytes, speaker_id:
             "message": f"Translation failed: {str(e)}"
         })
 
+# Per-speaker fragment coalescing in front of room MT/TTS
+room_coalescer = UtteranceCoalescer(translate_room_utterance)
+
+def is_room_host(room_id: str, participant_id: Optional[str]) -> bool:
+    """True when participant_id is the room's host participant"""
+    for participant in rooms.get(room_id, {}).get("participants", []):
+        if participant["id"] == participant_id:
+            return bool(participant.get("is_host"))
+    return False
+
 async def send_to_participant(room_id: str, participant_id: str, message: dict):
     """Send message to a specific participant in a room"""
     logger.info(f"📤 Attempting to send translation to participant {participant_id} in room {room_id}")
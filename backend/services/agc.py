@@ -0,0 +1,173 @@
+"""
+Streaming automatic gain control for 16-bit PCM
+Replaces whole-buffer peak normalization with per-speaker running state
+"""
+
+import logging
+import math
+from typing import Dict, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INT16_MAX = 32767.0
+
+
+class StreamingAGC:
+    """
+    Frame-by-frame gain control with running peak/RMS envelopes
+    Processes frames in place; float32 scratch space is reused across calls
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        target_rms: float = 0.1,
+        ceiling: float = 0.7,
+        max_gain: float = 10.0,
+        noise_floor: float = 0.003,
+        attack_ms: float = 10.0,
+        release_ms: float = 300.0
+    ):
+        """
+        Initialize AGC
+
+        Args:
+            sample_rate: Audio sample rate in Hz
+            target_rms: Desired speech RMS level (fraction of full scale)
+            ceiling: Peak ceiling after gain (0.7 matches the old normalize_audio)
+            max_gain: Upper bound on applied gain
+            noise_floor: RMS below which gain is not increased (avoids pumping silence)
+            attack_ms: Envelope time constant for rising levels
+            release_ms: Envelope time constant for falling levels
+        """
+        self.sample_rate = sample_rate
+        self.target_rms = target_rms
+        self.ceiling = ceiling
+        self.max_gain = max_gain
+        self.noise_floor = noise_floor
+        self.attack_ms = attack_ms
+        self.release_ms = release_ms
+
+        # Running state
+        self.peak = 0.0
+        self.rms = 0.0
+        self.gain = 1.0
+        self.frames_processed = 0
+
+        # Reusable float32 scratch space (grown on demand, never shrunk)
+        self._scratch = np.empty(0, dtype=np.float32)
+        self._gains = np.empty(0, dtype=np.float32)
+        self._ramp = np.empty(0, dtype=np.float32)
+        self._coefficients: Dict[int, Tuple[float, float]] = {}
+
+    def reset(self):
+        """Forget running levels (e.g. when a new speaker takes over)"""
+        self.peak = 0.0
+        self.rms = 0.0
+        self.gain = 1.0
+        self.frames_processed = 0
+
+    def _coefficients_for(self, n_samples: int) -> Tuple[float, float]:
+        """(attack, release) one-pole smoothing coefficients for a frame of n_samples"""
+        coefficients = self._coefficients.get(n_samples)
+        if coefficients is None:
+            frame_ms = 1000.0 * n_samples / self.sample_rate
+            coefficients = (
+                math.exp(-frame_ms / max(self.attack_ms, 1e-3)),
+                math.exp(-frame_ms / max(self.release_ms, 1e-3))
+            )
+            self._coefficients[n_samples] = coefficients
+        return coefficients
+
+    def _ensure_scratch(self, n: int):
+        if self._scratch.shape[0] < n:
+            self._scratch = np.empty(n, dtype=np.float32)
+            self._gains = np.empty(n, dtype=np.float32)
+        if self._ramp.shape[0] != n:
+            # Ramp must span exactly one frame; only rebuilt when the frame size changes
+            self._ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+
+    def process(self, frame) -> None:
+        """
+        Apply gain to a frame of 16-bit PCM in place
+
+        Args:
+            frame: Writable bytes-like object (bytearray, writable memoryview)
+        """
+        samples = np.frombuffer(frame, dtype=np.int16)
+        n = samples.shape[0]
+        if n == 0:
+            return
+        if not samples.flags.writeable:
+            raise ValueError("AGC requires a writable buffer (e.g. bytearray)")
+
+        self._ensure_scratch(n)
+        work = self._scratch[:n]
+
+        # int16 -> float32 in [-1, 1) without an intermediate abs() on int16
+        np.multiply(samples, 1.0 / INT16_MAX, out=work, casting="unsafe")
+
+        frame_peak = max(float(work.max()), -float(work.min()))
+        frame_rms = math.sqrt(float(np.dot(work, work)) / n)
+
+        # Envelope followers: fast attack, slow release
+        attack, release = self._coefficients_for(n)
+        coeff = attack if frame_peak > self.peak else release
+        self.peak = coeff * self.peak + (1.0 - coeff) * frame_peak
+        coeff = attack if frame_rms > self.rms else release
+        self.rms = coeff * self.rms + (1.0 - coeff) * frame_rms
+
+        # Desired gain: bring RMS to target, never push the peak past the ceiling
+        if self.rms > self.noise_floor:
+            desired = min(self.target_rms / self.rms, self.max_gain)
+        else:
+            desired = min(self.gain, 1.0)
+        if self.peak > 0:
+            desired = min(desired, self.ceiling / self.peak)
+
+        # Hard limit on this frame so a sudden transient cannot clip:
+        # gain reductions it forces apply instantly instead of ramping
+        start_gain = self.gain
+        if frame_peak > 0:
+            frame_limit = self.ceiling / frame_peak
+            desired = min(desired, frame_limit)
+            start_gain = min(start_gain, frame_limit)
+
+        # Linear ramp from previous gain to new gain avoids zipper noise
+        if desired != start_gain:
+            gains = np.multiply(self._ramp, desired - start_gain, out=self._gains[:n])
+            gains += start_gain
+            work *= gains
+        else:
+            work *= start_gain
+        self.gain = desired
+
+        work *= INT16_MAX
+        np.clip(work, -INT16_MAX - 1, INT16_MAX, out=work)
+        np.copyto(samples, work, casting="unsafe")
+
+        self.frames_processed += 1
+
+    def process_stream(self, audio, frame_ms: int = 100) -> None:
+        """
+        Run AGC over a longer buffer in fixed-size frames, in place
+
+        Args:
+            audio: Writable bytes-like PCM buffer
+            frame_ms: Frame duration in milliseconds
+        """
+        view = memoryview(audio).cast("B")
+        view = view[:len(view) - len(view) % 2]  # Drop a trailing half-sample
+        frame_bytes = int(self.sample_rate * frame_ms / 1000) * 2
+        for offset in range(0, len(view), frame_bytes):
+            self.process(view[offset:offset + frame_bytes])
+
+    def get_state(self) -> Dict:
+        return {
+            "peak": self.peak,
+            "rms": self.rms,
+            "gain": self.gain,
+            "frames_processed": self.frames_processed
+        }
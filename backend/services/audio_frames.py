@@ -0,0 +1,94 @@
+"""
+Binary framing for translated audio sent to clients
+Coalesces small Realtime audio deltas into 40-100ms frames behind a fixed header
+"""
+
+import base64
+import os
+import struct
+from typing import List
+
+# Frame layout (little-endian, 8 bytes):
+#   version  u8   FRAME_VERSION
+#   codec    u8   CODEC_PCM16 (the only codec so far)
+#   duration u16  Audio duration in milliseconds
+#   seq      u32  Per-connection frame counter
+FRAME_HEADER = struct.Struct("<BBHI")
+FRAME_VERSION = 1
+CODEC_PCM16 = 0  # 24kHz mono little-endian PCM16
+
+DELTA_FRAME_MIN_MS = int(os.getenv("REALTIME_DELTA_FRAME_MIN_MS", "40"))
+DELTA_FRAME_MAX_MS = int(os.getenv("REALTIME_DELTA_FRAME_MAX_MS", "100"))
+
+
+def pack_frame(payload: bytes, codec: int, duration_ms: int, seq: int) -> bytes:
+    """Prefix payload with the frame header"""
+    header = FRAME_HEADER.pack(FRAME_VERSION, codec, min(duration_ms, 0xFFFF), seq & 0xFFFFFFFF)
+    return header + payload
+
+
+def unpack_frame(frame: bytes):
+    """
+    Split a frame into header fields and payload
+
+    Returns:
+        (codec, duration_ms, seq, payload)
+    """
+    version, codec, duration_ms, seq = FRAME_HEADER.unpack_from(frame)
+    if version != FRAME_VERSION:
+        raise ValueError(f"Unsupported audio frame version {version}")
+    return codec, duration_ms, seq, memoryview(frame)[FRAME_HEADER.size:]
+
+
+class AudioDeltaCoalescer:
+    """
+    Decodes base64 PCM16 deltas once and regroups them into frames
+
+    Frames are emitted as soon as DELTA_FRAME_MIN_MS is buffered and never
+    exceed DELTA_FRAME_MAX_MS; flush() drains the tail at end of a response.
+    """
+
+    def __init__(self, sample_rate: int = 24000, min_ms: int = DELTA_FRAME_MIN_MS,
+                 max_ms: int = DELTA_FRAME_MAX_MS):
+        bytes_per_ms = sample_rate * 2 // 1000
+        self.sample_rate = sample_rate
+        self.min_bytes = bytes_per_ms * min_ms
+        self.max_bytes = bytes_per_ms * max_ms
+        self._pending = bytearray()
+
+    def add(self, delta_b64: str) -> List[bytes]:
+        """
+        Buffer one delta
+
+        Returns:
+            PCM chunks ready to send (possibly empty)
+        """
+        self._pending += base64.b64decode(delta_b64)
+        if len(self._pending) < self.min_bytes:
+            return []
+
+        # Whole max-size frames, then the remainder if it is above the minimum
+        chunks = []
+        view = memoryview(self._pending)
+        offset = 0
+        while len(view) - offset >= self.min_bytes:
+            size = min(self.max_bytes, len(view) - offset)
+            size -= size % 2  # Keep samples whole
+            chunks.append(bytes(view[offset:offset + size]))
+            offset += size
+        view.release()
+        del self._pending[:offset]
+        return chunks
+
+    def flush(self) -> List[bytes]:
+        """Remaining audio (shorter than the minimum frame)"""
+        usable = len(self._pending) - len(self._pending) % 2
+        if not usable:
+            self._pending.clear()
+            return []
+        chunk = bytes(self._pending[:usable])
+        self._pending.clear()
+        return [chunk]
+
+    def duration_ms(self, pcm: bytes) -> int:
+        return len(pcm) * 1000 // (self.sample_rate * 2)
@@ -0,0 +1,101 @@
+"""
+CPU-bound audio jobs executed in the audio worker pool
+All functions are module-level (picklable) and take/return plain bytes
+"""
+
+import io
+import logging
+from typing import Dict, List, Optional
+
+try:
+    from pydub import AudioSegment
+    PYDUB_AVAILABLE = True
+except ImportError:
+    PYDUB_AVAILABLE = False
+    AudioSegment = None
+
+logger = logging.getLogger(__name__)
+
+
+def decode_audio(data: bytes, format: str = "webm") -> Dict:
+    """
+    Decode compressed audio to interleaved PCM
+
+    Args:
+        data: Encoded audio bytes
+        format: Container format understood by ffmpeg
+
+    Returns:
+        Dict with raw PCM plus frame_rate, channels and sample_width
+    """
+    if not PYDUB_AVAILABLE:
+        raise RuntimeError("pydub not available - cannot decode audio")
+
+    audio = AudioSegment.from_file(io.BytesIO(data), format=format)
+    return {
+        "raw": audio.raw_data,
+        "frame_rate": audio.frame_rate,
+        "channels": audio.channels,
+        "sample_width": audio.sample_width
+    }
+
+
+def concat_mp3(chunks: List[Optional[bytes]], silence_ms: int = 500, bitrate: str = "128k") -> bytes:
+    """
+    Concatenate MP3 segments, inserting silence for segments without audio
+
+    Args:
+        chunks: MP3 bytes per segment (None for a silent placeholder)
+        silence_ms: Placeholder duration in milliseconds
+        bitrate: Output MP3 bitrate
+
+    Returns:
+        Combined MP3 bytes
+    """
+    if not PYDUB_AVAILABLE:
+        raise RuntimeError("pydub not available - cannot concatenate audio")
+
+    combined = AudioSegment.empty()
+    for chunk in chunks:
+        if chunk:
+            combined += AudioSegment.from_mp3(io.BytesIO(chunk))
+        else:
+            combined += AudioSegment.silent(duration=silence_ms)
+
+    output = io.BytesIO()
+    combined.export(output, format="mp3", bitrate=bitrate)
+    return output.getvalue()
+
+
+def compact_for_whisper(data: bytes, format: str = "webm", codec: str = "opus",
+                        sample_rate: int = 16000, bitrate: str = "24k") -> Dict:
+    """
+    Downmix to mono, resample and re-encode audio to shrink Whisper uploads
+
+    Args:
+        data: Encoded audio from the browser
+        format: Input container format
+        codec: "opus" (Ogg/Opus at bitrate) or "flac" (lossless)
+        sample_rate: Output sample rate (Whisper works at 16kHz internally)
+        bitrate: Opus bitrate
+
+    Returns:
+        Dict with encoded bytes, filename and mime type
+    """
+    from services.resampler import resample_pcm16
+
+    decoded = decode_audio(data, format)
+    pcm = resample_pcm16(
+        decoded["raw"], decoded["frame_rate"], sample_rate,
+        decoded["channels"], decoded["sample_width"]
+    )
+    audio = AudioSegment(data=pcm, sample_width=2, frame_rate=sample_rate, channels=1)
+
+    output = io.BytesIO()
+    if codec == "flac":
+        audio.export(output, format="flac")
+        return {"data": output.getvalue(), "filename": "audio.flac", "mime": "audio/flac"}
+
+    audio.export(output, format="ogg", codec="libopus", bitrate=bitrate,
+                 parameters=["-application", "voip"])
+    return {"data": output.getvalue(), "filename": "audio.ogg", "mime": "audio/ogg"}
@@ -15,11 +15,11 @@ except ImportError:
             return True  # Always return True when VAD is not available
     webrtcvad = type('webrtcvad', (), {'Vad': DummyVAD})()
     
-import numpy as np
-from typing import Optional
+from typing import List
 import struct
 import logging
-from io import BytesIO
+
+from services.ring_buffer import total_length
 
 logger = logging.getLogger(__name__)
 
@@ -76,98 +76,88 @@ class AudioProcessor:
             logger.warning(f"VAD error: {e}, assuming speech")
             return True  # Fail open to avoid dropping valid audio
     
-    def convert_to_wav(self, audio_data: bytes, sample_rate: int = None) -> bytes:
+    @staticmethod
+    def wav_header(data_length: int, sample_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
         """
-        Convert audio data to WAV format for Whisper API
-        Handles both PCM data and WebM/Opus data
+        Build a 44-byte PCM WAV header
+
+        Args:
+            data_length: Size of the PCM payload in bytes
+            sample_rate: Sample rate in Hz
+            channels: Channel count
+            sample_width: Bytes per sample
+
+        Returns:
+            WAV header bytes
+        """
+        block_align = channels * sample_width
+        return struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', data_length + 36, b'WAVE',
+            b'fmt ', 16, 1, channels, sample_rate,
+            sample_rate * block_align, block_align, sample_width * 8,
+            b'data', data_length
+        )
+    
+    def wav_parts(self, audio_data, sample_rate: int = None) -> List[memoryview]:
+        """
+        WAV file as a scatter/gather list: header followed by PCM views
+        Suitable for writelines()/os.writev() without joining the payload
         
         Args:
-            audio_data: Raw audio bytes (PCM or WebM)
+            audio_data: PCM bytes-like object, or a sequence of them (e.g. ring buffer windows)
             sample_rate: Sample rate (defaults to instance sample_rate)
         
         Returns:
-            WAV file bytes
+            List of buffers making up the WAV file
         """
         if sample_rate is None:
             sample_rate = self.sample_rate
         
+        if isinstance(audio_data, (bytes, bytearray, memoryview)):
+            parts = [memoryview(audio_data)]
+        else:
+            parts = [memoryview(p) for p in audio_data]
+        
         # Check if it's WebM/Opus data (starts with WebM signature)
-        if audio_data.startswith(b'\x1a\x45\xdf\xa3'):
+        if parts and bytes(parts[0][:4]) == b'\x1a\x45\xdf\xa3':
             logger.warning("WebM/Opus audio detected - using raw data as WAV (may cause issues)")
             # For now, treat WebM data as if it were PCM and create a WAV header
             # This is a temporary workaround - in production you'd use FFmpeg
-            pcm_data = audio_data
-        else:
-            # Assume it's already PCM data
-            pcm_data = audio_data
-        
-        # WAV header construction
-        wav_buffer = BytesIO()
-        
-        # RIFF header
-        wav_buffer.write(b'RIFF')
-        wav_buffer.write(struct.pack('<I', len(pcm_data) + 36))  # File size - 8
-        wav_buffer.write(b'WAVE')
-        
-        # fmt chunk
-        wav_buffer.write(b'fmt ')
-        wav_buffer.write(struct.pack('<I', 16))  # fmt chunk size
-        wav_buffer.write(struct.pack('<H', 1))   # PCM format
-        wav_buffer.write(struct.pack('<H', 1))   # Mono
-        wav_buffer.write(struct.pack('<I', sample_rate))
-        wav_buffer.write(struct.pack('<I', sample_rate * 2))  # Byte rate
-        wav_buffer.write(struct.pack('<H', 2))   # Block align
-        wav_buffer.write(struct.pack('<H', 16))  # Bits per sample
-        
-        # data chunk
-        wav_buffer.write(b'data')
-        wav_buffer.write(struct.pack('<I', len(pcm_data)))
-        wav_buffer.write(pcm_data)
-        
-        return wav_buffer.getvalue()
+        
+        header = self.wav_header(total_length(parts), sample_rate)
+        return [memoryview(header)] + parts
     
-    def create_overlapping_chunks(self, audio_data: bytes, chunk_size: int, overlap: float = 0.5):
+    def convert_to_wav(self, audio_data, sample_rate: int = None) -> bytes:
         """
-        Split audio into overlapping chunks for better transcription
+        Convert audio data to WAV format for Whisper API
+        Handles both PCM data and WebM/Opus data
         
         Args:
-            audio_data: Audio bytes
-            chunk_size: Size of each chunk in bytes
-            overlap: Overlap ratio (0.0 to 1.0)
+            audio_data: Raw audio bytes (PCM or WebM), or a sequence of PCM views
+            sample_rate: Sample rate (defaults to instance sample_rate)
         
-        Yields:
-            Overlapping audio chunks
+        Returns:
+            WAV file bytes (PCM is copied exactly once, into the result)
         """
-        stride = int(chunk_size * (1 - overlap))
-        
-        for i in range(0, len(audio_data), stride):
-            chunk = audio_data[i:i + chunk_size]
-            if len(chunk) >= chunk_size // 2:  # Yield if at least half full
-                yield chunk
+        return b''.join(self.wav_parts(audio_data, sample_rate))
     
-    def normalize_audio(self, audio_data: bytes) -> bytes:
+    def create_overlapping_chunks(self, audio_data, chunk_size: int, overlap: float = 0.5):
         """
-        Normalize audio levels to improve transcription
+        Split audio into overlapping chunks for better transcription
         
         Args:
-            audio_data: Raw PCM audio bytes
+            audio_data: Audio bytes-like object
+            chunk_size: Size of each chunk in bytes
+            overlap: Overlap ratio (0.0 to 1.0)
         
-        Returns:
-            Normalized audio bytes
+        Yields:
+            Overlapping audio chunks as zero-copy memoryviews
         """
-        try:
-            # Convert to numpy array
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            
-            # Normalize to 70% of max to avoid clipping
-            max_val = np.abs(audio_array).max()
-            if max_val > 0:
-                normalized = (audio_array * (32767 * 0.7 / max_val)).astype(np.int16)
-                return normalized.tobytes()
-            
-            return audio_data
+        view = memoryview(audio_data)
+        stride = max(1, int(chunk_size * (1 - overlap)))
         
-        except Exception as e:
-            logger.warning(f"Normalization error: {e}, returning original")
-            return audio_data
-
+        for i in range(0, len(view), stride):
+            chunk = view[i:i + chunk_size]
+            if len(chunk) >= chunk_size // 2:  # Yield if at least half full
+                yield chunk
@@ -0,0 +1,283 @@
+"""
+Process pool for CPU-bound audio work (decode, resample, re-encode, replay export)
+Keeps the asyncio event loop free: small jobs are micro-batched per IPC round
+trip, large buffers travel through shared memory instead of the pipe
+"""
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+AUDIO_WORKERS = int(os.getenv("AUDIO_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+BATCH_WINDOW_MS = float(os.getenv("AUDIO_BATCH_WINDOW_MS", "2"))
+MAX_BATCH_SIZE = 16
+SHM_THRESHOLD = 256 * 1024  # Buffers at least this big go through shared memory
+
+
+@dataclass(frozen=True)
+class SharedBuffer:
+    """Picklable handle to a buffer placed in shared memory"""
+    name: str
+    size: int
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing block
+    Worker processes share the parent's resource tracker, so attaching does
+    not add a second registration; whoever unlinks (the parent) unregisters it
+    """
+    return shared_memory.SharedMemory(name=name)
+
+
+def _to_shared(data) -> Tuple[SharedBuffer, shared_memory.SharedMemory]:
+    """Copy a buffer into a new shared memory block"""
+    size = len(data)
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    shm.buf[:size] = data
+    return SharedBuffer(shm.name, size), shm
+
+
+def _read_shared(handle: SharedBuffer) -> bytes:
+    shm = _attach(handle.name)
+    try:
+        return bytes(shm.buf[:handle.size])
+    finally:
+        shm.close()
+
+
+def _unpack(value):
+    """Replace SharedBuffer handles (also inside lists) with their bytes"""
+    if isinstance(value, SharedBuffer):
+        return _read_shared(value)
+    if isinstance(value, list):
+        return [_unpack(v) for v in value]
+    return value
+
+
+def _pack_result(value):
+    """Worker side: return large byte results through shared memory"""
+    if isinstance(value, (bytes, bytearray)) and len(value) >= SHM_THRESHOLD:
+        handle, shm = _to_shared(value)
+        shm.close()  # Parent unlinks after reading
+        return handle
+    return value
+
+
+def _run_job(fn: Callable, args: tuple, kwargs: dict):
+    args = tuple(_unpack(a) for a in args)
+    kwargs = {k: _unpack(v) for k, v in kwargs.items()}
+    return _pack_result(fn(*args, **kwargs))
+
+
+def _run_batch(jobs: List[Tuple[Callable, tuple, dict]]) -> List[Tuple[bool, Any]]:
+    """Execute several jobs in one IPC round trip; errors are returned, not raised"""
+    results = []
+    for fn, args, kwargs in jobs:
+        try:
+            results.append((True, _run_job(fn, args, kwargs)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+def _warmup() -> int:
+    # Import heavy modules once per worker so the first real job is not slow
+    import numpy  # noqa: F401
+    from services import audio_jobs  # noqa: F401
+    return os.getpid()
+
+
+class AudioWorkerPool:
+    """
+    Async front-end for a ProcessPoolExecutor running audio jobs
+    Functions submitted must be module-level (picklable), e.g. services.audio_jobs
+    """
+
+    def __init__(self, max_workers: int = AUDIO_WORKERS, batch_window_ms: float = BATCH_WINDOW_MS,
+                 max_batch_size: int = MAX_BATCH_SIZE, shm_threshold: int = SHM_THRESHOLD):
+        """
+        Initialize pool (processes are started by start())
+
+        Args:
+            max_workers: Worker processes (0 = run jobs in a thread instead)
+            batch_window_ms: How long small jobs wait to share an IPC round trip
+            max_batch_size: Flush a batch early once it has this many jobs
+            shm_threshold: Argument size above which shared memory is used
+        """
+        self.max_workers = max_workers
+        self.batch_window = batch_window_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self.shm_threshold = shm_threshold
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Tuple[Callable, tuple, dict, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        self.stats: Dict[str, float] = {
+            "jobs": 0,
+            "batches": 0,
+            "shared_memory_jobs": 0,
+            "errors": 0,
+            "busy_seconds": 0.0
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    async def start(self):
+        """Start worker processes and warm them up"""
+        if self._executor or self.max_workers <= 0:
+            return
+        # spawn: never fork a process that is running an event loop and threads
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=get_context("spawn"))
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(*[
+            loop.run_in_executor(self._executor, _warmup) for _ in range(self.max_workers)
+        ])
+        logger.info(f"AudioWorkerPool started: {len(set(pids))} worker processes")
+
+    async def shutdown(self):
+        """Stop worker processes (pending jobs are flushed first)"""
+        if self._pending:
+            self._flush()
+        if self._executor:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+            logger.info("AudioWorkerPool stopped")
+
+    def _is_large(self, value) -> bool:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return len(value) >= self.shm_threshold
+        if isinstance(value, list):
+            return sum(len(v) for v in value if isinstance(v, (bytes, bytearray, memoryview))) >= self.shm_threshold
+        return False
+
+    def _share(self, value, blocks: List[shared_memory.SharedMemory]):
+        if isinstance(value, (bytes, bytearray, memoryview)) and len(value) >= self.shm_threshold:
+            handle, shm = _to_shared(value)
+            blocks.append(shm)
+            return handle
+        if isinstance(value, list):
+            return [self._share(v, blocks) for v in value]
+        return value
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) in a worker process
+
+        Small jobs are coalesced with others submitted within batch_window;
+        jobs with large buffers are dispatched alone through shared memory
+
+        Returns:
+            The function's return value (exceptions are re-raised here)
+        """
+        self.stats["jobs"] += 1
+
+        if not self._executor:
+            # No process pool (disabled or not started): still keep the loop free
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+
+        if any(self._is_large(a) for a in args) or any(self._is_large(v) for v in kwargs.values()):
+            return await self._run_shared(loop, fn, args, kwargs)
+
+        future = loop.create_future()
+        self._pending.append((fn, args, kwargs, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return await future
+
+    async def _run_shared(self, loop, fn: Callable, args: tuple, kwargs: dict):
+        self.stats["shared_memory_jobs"] += 1
+        blocks: List[shared_memory.SharedMemory] = []
+        started = time.perf_counter()
+        try:
+            shared_args = tuple(self._share(a, blocks) for a in args)
+            shared_kwargs = {k: self._share(v, blocks) for k, v in kwargs.items()}
+            result = await loop.run_in_executor(self._executor, _run_job, fn, shared_args, shared_kwargs)
+            return self._collect(result)
+        except Exception:
+            self.stats["errors"] += 1
+            raise
+        finally:
+            self.stats["busy_seconds"] += time.perf_counter() - started
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+    def _collect(self, result):
+        """Parent side: read and free a shared-memory result"""
+        if isinstance(result, SharedBuffer):
+            shm = _attach(result.name)
+            try:
+                return bytes(shm.buf[:result.size])
+            finally:
+                shm.close()
+                shm.unlink()
+        return result
+
+    def _flush(self):
+        """Send all pending small jobs to one worker as a single batch"""
+        self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self.stats["batches"] += 1
+
+        jobs = [(fn, args, kwargs) for fn, args, kwargs, _ in batch]
+        futures = [future for *_, future in batch]
+        started = time.perf_counter()
+
+        try:
+            batch_future = asyncio.wrap_future(self._executor.submit(_run_batch, jobs))
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        def _deliver(done: asyncio.Future):
+            self.stats["busy_seconds"] += time.perf_counter() - started
+            if done.cancelled() or done.exception():
+                error = done.exception() if not done.cancelled() else asyncio.CancelledError()
+                self.stats["errors"] += len(futures)
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+            for future, (ok, value) in zip(futures, done.result()):
+                if ok:
+                    value = self._collect(value)  # Always free shared results
+                if future.done():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    self.stats["errors"] += 1
+                    future.set_exception(value)
+
+        batch_future.add_done_callback(_deliver)
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            "workers": self.max_workers if self._executor else 0,
+            "pending": len(self._pending)
+        }
+
+
+# Process-wide pool shared by all sessions
+audio_pool = AudioWorkerPool()
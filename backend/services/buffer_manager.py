@@ -6,15 +6,9 @@ Handles in-memory storage of translation segments with timestamps
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
-import io
 import base64
 
-try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
-    AudioSegment = None
+from services.audio_jobs import PYDUB_AVAILABLE, concat_mp3
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +125,41 @@ class BufferManager:
         logger.info(f"Replay exported: {len(segments)} segments, {len(audio_data)} bytes audio")
         return audio_data, vtt_data
     
+    async def export_replay_async(self, segments: List[Dict], pool=None) -> tuple[bytes, str]:
+        """
+        Same as export_replay, but the pydub work runs in the audio worker pool
+        so a long export does not stall the event loop
+        
+        Args:
+            segments: Segments to include in replay
+            pool: AudioWorkerPool (defaults to the process-wide pool)
+        
+        Returns:
+            Tuple of (audio_bytes, vtt_string)
+        """
+        if not segments:
+            return b"", ""
+        
+        if pool is None:
+            from services.audio_workers import audio_pool
+            pool = audio_pool
+        
+        segments = sorted(segments, key=lambda x: x["timestamp"])
+        
+        if PYDUB_AVAILABLE:
+            try:
+                audio_data = await pool.run(concat_mp3, [seg.get("audio_data") for seg in segments])
+            except Exception as e:
+                logger.error(f"Audio concatenation error: {e}")
+                audio_data = b""
+        else:
+            audio_data = self._concat_audio(segments)
+        
+        vtt_data = self._generate_webvtt(segments)
+        
+        logger.info(f"Replay exported: {len(segments)} segments, {len(audio_data)} bytes audio")
+        return audio_data, vtt_data
+    
     def _concat_audio(self, segments: List[Dict]) -> bytes:
         """Concatenate MP3 audio segments using pydub"""
         if not PYDUB_AVAILABLE:
@@ -142,20 +171,8 @@ class BufferManager:
             return b""
         
         try:
-            combined = AudioSegment.empty()
-            
-            for segment in segments:
-                if segment.get("audio_data"):
-                    audio_segment = AudioSegment.from_mp3(io.BytesIO(segment["audio_data"]))
-                    combined += audio_segment
-                else:
-                    # Add silence placeholder (500ms)
-                    combined += AudioSegment.silent(duration=500)
-            
-            # Export as MP3
-            output = io.BytesIO()
-            combined.export(output, format="mp3", bitrate="128k")
-            return output.getvalue()
+            # Segments without audio get a 500ms silence placeholder
+            return concat_mp3([segment.get("audio_data") for segment in segments])
         
         except Exception as e:
             logger.error(f"Audio concatenation error: {e}")
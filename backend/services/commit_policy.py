@@ -0,0 +1,230 @@
+"""
+Commit policies for the Realtime API input buffer
+Decide when buffered audio is committed and a response is requested
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from services.audio_processor import AudioProcessor
+from services.resampler import StreamConverter
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+REALTIME_COMMIT_POLICY = os.getenv("REALTIME_COMMIT_POLICY", "chunk")
+INPUT_SAMPLE_RATE = 24000
+
+
+class CommitPolicy:
+    """
+    Base policy: tracks audio time and responses so policies can be compared
+    Subclasses decide when to commit
+
+    Every policy counts all forwarded audio toward audio_ms, so responses per audio
+    minute share one denominator; speech_ms is only known to VAD-based policies
+    and is reported separately
+    """
+
+    name = "base"
+    # Session-level turn_detection sent in session.update (None = we commit manually)
+    turn_detection: Optional[Dict] = None
+    # Whether the server commits and creates responses on its own
+    server_managed = False
+    # Whether speech_ms is measured (VAD); audio_ms always is
+    measures_speech = False
+
+    def __init__(self):
+        self.commits = 0
+        self.responses = 0
+        self.audio_ms = 0.0
+        self.speech_ms = 0.0
+        self.uncommitted_ms = 0.0
+        self.first_uncommitted_at: Optional[float] = None
+
+    def on_audio(self, pcm, duration_ms: float) -> bool:
+        """
+        Called for every chunk of 24kHz PCM forwarded upstream
+
+        Returns:
+            True if the buffer should be committed now
+        """
+        if self.first_uncommitted_at is None:
+            self.first_uncommitted_at = time.monotonic()
+        self.uncommitted_ms += duration_ms
+        self.audio_ms += duration_ms
+        metrics.increment(f"realtime.commit_policy.{self.name}.audio_ms", duration_ms)
+        return False
+
+    def on_chunk_end(self) -> bool:
+        """Called after each complete client message; True to commit"""
+        return False
+
+    def on_tick(self, now: float) -> bool:
+        """Called periodically; True to commit (for time-based policies)"""
+        return False
+
+    def on_commit(self):
+        self.commits += 1
+        self.uncommitted_ms = 0.0
+        self.first_uncommitted_at = None
+        metrics.increment(f"realtime.commit_policy.{self.name}.commits")
+
+    def on_response_done(self):
+        self.responses += 1
+        metrics.increment(f"realtime.commit_policy.{self.name}.responses")
+
+    def on_server_speech(self, start_ms: int, end_ms: int):
+        """Server VAD reported a speech segment (audio_start_ms/audio_end_ms)"""
+
+    def _add_speech(self, ms: float):
+        """Detected speech (VAD-based policies only)"""
+        self.speech_ms += ms
+        metrics.increment(f"realtime.commit_policy.{self.name}.speech_ms", ms)
+
+    def get_stats(self) -> Dict:
+        audio_minutes = self.audio_ms / 60000.0
+        return {
+            "policy": self.name,
+            "commits": self.commits,
+            "responses": self.responses,
+            "audio_seconds": round(self.audio_ms / 1000.0, 1),
+            "speech_seconds": round(self.speech_ms / 1000.0, 1) if self.measures_speech else None,
+            "responses_per_audio_minute": round(self.responses / audio_minutes, 2) if audio_minutes > 0 else None
+        }
+
+
+class ChunkCommitPolicy(CommitPolicy):
+    """Legacy behaviour: commit after every client audio message (push-to-talk)"""
+
+    name = "chunk"
+
+    def on_chunk_end(self) -> bool:
+        return self.uncommitted_ms > 0
+
+
+class ServerVADPolicy(CommitPolicy):
+    """Let the Realtime API detect turns; it commits and responds by itself"""
+
+    name = "server_vad"
+    server_managed = True
+    measures_speech = True
+
+    def __init__(self, threshold: float = 0.5, prefix_padding_ms: int = 300, silence_duration_ms: int = 500):
+        super().__init__()
+        self.turn_detection = {
+            "type": "server_vad",
+            "threshold": threshold,
+            "prefix_padding_ms": prefix_padding_ms,
+            "silence_duration_ms": silence_duration_ms
+        }
+
+    def on_server_speech(self, start_ms: int, end_ms: int):
+        if end_ms > start_ms:
+            self._add_speech(end_ms - start_ms)
+        # Server committed this turn
+        self.on_commit()
+
+
+class LocalVADPolicy(CommitPolicy):
+    """
+    Local endpointer: commit once speech is followed by enough silence
+    Uses webrtcvad at 16kHz when available, an energy gate otherwise
+    """
+
+    name = "local_vad"
+    measures_speech = True
+
+    def __init__(self, silence_ms: int = 600, max_utterance_ms: int = 8000,
+                 energy_threshold: float = 0.01, vad_aggressiveness: int = 2):
+        super().__init__()
+        self.silence_ms = silence_ms
+        self.max_utterance_ms = max_utterance_ms
+        self.energy_threshold = energy_threshold
+
+        self.vad = AudioProcessor(sample_rate=16000, vad_aggressiveness=vad_aggressiveness)
+        self.converter = StreamConverter(out_rate=16000)
+        self.frame_bytes = 16000 * 2 * self.vad.frame_duration_ms // 1000
+        self._vad_pending = bytearray()
+
+        self.in_speech = False
+        self.trailing_silence_ms = 0.0
+        self.utterance_ms = 0.0
+
+    def _frame_is_speech(self, frame: bytes) -> bool:
+        if self.vad.vad is not None:
+            return self.vad.is_speech(frame)
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32) / 32768.0
+        return float(np.sqrt(np.mean(samples * samples))) > self.energy_threshold
+
+    def on_audio(self, pcm, duration_ms: float) -> bool:
+        super().on_audio(pcm, duration_ms)
+        self._vad_pending += self.converter.convert(pcm, INPUT_SAMPLE_RATE)
+
+        frame_ms = self.vad.frame_duration_ms
+        commit = False
+        usable = len(self._vad_pending) - len(self._vad_pending) % self.frame_bytes
+        for offset in range(0, usable, self.frame_bytes):
+            frame = bytes(self._vad_pending[offset:offset + self.frame_bytes])
+            if self._frame_is_speech(frame):
+                self.in_speech = True
+                self.trailing_silence_ms = 0.0
+                self._add_speech(frame_ms)
+            elif self.in_speech:
+                self.trailing_silence_ms += frame_ms
+
+            if self.in_speech:
+                self.utterance_ms += frame_ms
+                if self.trailing_silence_ms >= self.silence_ms or self.utterance_ms >= self.max_utterance_ms:
+                    commit = True
+        del self._vad_pending[:usable]
+        return commit
+
+    def on_commit(self):
+        super().on_commit()
+        self.in_speech = False
+        self.trailing_silence_ms = 0.0
+        self.utterance_ms = 0.0
+
+
+class TimeSizePolicy(CommitPolicy):
+    """Commit when enough audio is buffered or the oldest audio has waited too long"""
+
+    name = "time"
+
+    def __init__(self, max_buffer_ms: int = 3000, max_wait_ms: int = 2000, min_buffer_ms: int = 300):
+        super().__init__()
+        self.max_buffer_ms = max_buffer_ms
+        self.max_wait_ms = max_wait_ms
+        self.min_buffer_ms = min_buffer_ms
+
+    def on_audio(self, pcm, duration_ms: float) -> bool:
+        super().on_audio(pcm, duration_ms)
+        return self.uncommitted_ms >= self.max_buffer_ms
+
+    def on_tick(self, now: float) -> bool:
+        if self.first_uncommitted_at is None or self.uncommitted_ms < self.min_buffer_ms:
+            return False
+        return (now - self.first_uncommitted_at) * 1000 >= self.max_wait_ms
+
+
+COMMIT_POLICIES = {
+    ChunkCommitPolicy.name: ChunkCommitPolicy,
+    ServerVADPolicy.name: ServerVADPolicy,
+    LocalVADPolicy.name: LocalVADPolicy,
+    TimeSizePolicy.name: TimeSizePolicy,
+}
+
+
+def create_commit_policy(name: str = None) -> CommitPolicy:
+    """Instantiate a policy by name (defaults to REALTIME_COMMIT_POLICY)"""
+    name = name or REALTIME_COMMIT_POLICY
+    policy_class = COMMIT_POLICIES.get(name)
+    if policy_class is None:
+        logger.warning(f"Unknown commit policy '{name}', using '{ChunkCommitPolicy.name}'")
+        policy_class = ChunkCommitPolicy
+    return policy_class()
@@ -0,0 +1,169 @@
+"""
+Per-utterance latency budgets
+A Deadline is created when an utterance arrives and handed to every stage;
+retries and hedged requests are only made while they still fit in it (the
+first attempt of every request keeps its full per-call timeout)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from tenacity.stop import stop_base
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Whole utterance: STT + MT + TTS (first audio)
+UTTERANCE_BUDGET_MS = float(os.getenv("UTTERANCE_BUDGET_MS", "8000"))
+# Retries and hedges get at least this long, even when the budget is already spent
+DEADLINE_MIN_ATTEMPT_MS = float(os.getenv("DEADLINE_MIN_ATTEMPT_MS", "1000"))
+
+RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "3"))
+RETRY_BASE_MS = float(os.getenv("RETRY_BASE_MS", "100"))
+RETRY_MAX_WAIT_MS = float(os.getenv("RETRY_MAX_WAIT_MS", "1000"))
+
+# Hedging: a second request once the first is slower than the observed p95
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "true").lower() == "true"
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+
+
+class Deadline:
+    """Wall-clock budget for one utterance"""
+
+    def __init__(self, budget_ms: float = UTTERANCE_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.started = time.monotonic()
+        self.expires_at = self.started + budget_ms / 1000
+
+    def remaining(self) -> float:
+        """Seconds left (0 when spent)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.monotonic() - self.started) * 1000
+
+    def attempt_timeout(self, cap: Optional[float] = None, first: bool = False) -> float:
+        """
+        Timeout for a request attempt (seconds)
+
+        The first attempt gets the full cap, so a late stage is never cut below
+        its per-call timeout; retries and hedges get what's left of the budget,
+        never below DEADLINE_MIN_ATTEMPT_MS and never above cap
+        """
+        if first and cap:
+            return cap
+        timeout = max(self.remaining(), DEADLINE_MIN_ATTEMPT_MS / 1000)
+        return min(timeout, cap) if cap else timeout
+
+
+def _latency(name: str):
+    return metrics.histogram(f"deadline.{name}_ms")
+
+
+class stop_when_over_budget(stop_base):
+    """Stop retrying when the backoff plus a typical attempt no longer fits the deadline"""
+
+    def __init__(self, deadline: Deadline, name: str):
+        self.deadline = deadline
+        self.name = name
+
+    def __call__(self, retry_state) -> bool:
+        typical_ms = _latency(self.name).percentile(50) or 0.0
+        needed = (retry_state.upcoming_sleep or 0.0) + typical_ms / 1000
+        if self.deadline.remaining() < needed:
+            metrics.increment(f"deadline.{self.name}.retry_skipped")
+            return True
+        return False
+
+
+async def _timed_attempt(attempt_fn: Callable[[float], Awaitable[T]], timeout: float, name: str) -> T:
+    started = time.perf_counter()
+    result = await attempt_fn(timeout)
+    _latency(name).observe((time.perf_counter() - started) * 1000)
+    return result
+
+
+async def _hedged(attempt_fn: Callable[[float], Awaitable[T]], deadline: Deadline, name: str,
+                  hedge: bool, cap: Optional[float], first_attempt: bool) -> T:
+    """One attempt, plus a second one racing it if the first runs past the observed p95"""
+    histogram = _latency(name)
+    first = asyncio.ensure_future(
+        _timed_attempt(attempt_fn, deadline.attempt_timeout(cap, first=first_attempt), name)
+    )
+
+    hedge_after = None
+    if hedge and histogram.count >= HEDGE_MIN_SAMPLES:
+        hedge_after = histogram.percentile(HEDGE_PERCENTILE) / 1000
+    if hedge_after is None or hedge_after >= deadline.remaining():
+        return await first
+
+    pending = {first}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=hedge_after)
+        # Only hedge when a typical request could still finish inside the budget
+        if not done and deadline.remaining() >= (histogram.percentile(50) or 0.0) / 1000:
+            metrics.increment(f"deadline.{name}.hedges")
+            pending.add(asyncio.ensure_future(
+                _timed_attempt(attempt_fn, deadline.attempt_timeout(cap), name)
+            ))
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is not first:
+                        metrics.increment(f"deadline.{name}.hedge_wins")
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def call_with_deadline(attempt_fn: Callable[[float], Awaitable[T]], deadline: Optional[Deadline],
+                             name: str, cap: Optional[float] = None, hedge: bool = HEDGE_ENABLED,
+                             retry_on: Tuple[Type[BaseException], ...] = (Exception,)) -> T:
+    """
+    Run a request under a latency budget
+
+    Args:
+        attempt_fn: Coroutine function taking a timeout in seconds; called once per
+            attempt (and once more for a hedge), so it must not share consumable state
+        deadline: Utterance budget (a fresh default budget when None)
+        name: Metric name for this kind of request (attempt latencies feed the
+            retry and hedge decisions)
+        cap: Longest a single attempt may take, in seconds (the first attempt
+            always gets all of it; retries and hedges are also held to the budget)
+        hedge: Allow a hedged second request
+        retry_on: Exception types worth another attempt
+
+    Returns:
+        Result of the first successful attempt
+    """
+    deadline = deadline or Deadline()
+    retrying = AsyncRetrying(
+        stop=stop_after_attempt(RETRY_ATTEMPTS) | stop_when_over_budget(deadline, name),
+        wait=wait_random_exponential(multiplier=RETRY_BASE_MS / 1000, max=RETRY_MAX_WAIT_MS / 1000),
+        retry=retry_if_exception_type(retry_on),
+        before_sleep=lambda state: metrics.increment(f"deadline.{name}.retries"),
+        reraise=True
+    )
+    async for attempt in retrying:
+        with attempt:
+            first_attempt = attempt.retry_state.attempt_number == 1
+            return await _hedged(attempt_fn, deadline, name, hedge, cap, first_attempt)
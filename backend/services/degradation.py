@@ -0,0 +1,213 @@
+"""
+Adaptive degradation under load
+Watches upstream call latency and connection-pool backlog, and steps service down
+(captions only → fastest models → shed low-priority rooms) before timeouts cascade
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from services.deadline import UTTERANCE_BUDGET_MS
+from services.model_profiles import ModelProfile, get_profile
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+DEGRADATION_ENABLED = os.getenv("DEGRADATION_ENABLED", "true").lower() == "true"
+DEGRADE_INTERVAL_S = float(os.getenv("DEGRADE_INTERVAL_S", "5"))
+DEGRADE_WINDOW_S = float(os.getenv("DEGRADE_WINDOW_S", "30"))
+# Pressure 1.0 = a slow (p95) utterance just fills the budget, or the pool is at target saturation
+DEGRADE_UP_PRESSURE = float(os.getenv("DEGRADE_UP_PRESSURE", "1.0"))
+DEGRADE_DOWN_PRESSURE = float(os.getenv("DEGRADE_DOWN_PRESSURE", "0.7"))
+DEGRADE_UP_TICKS = int(os.getenv("DEGRADE_UP_TICKS", "2"))
+DEGRADE_DOWN_TICKS = int(os.getenv("DEGRADE_DOWN_TICKS", "6"))
+DEGRADE_SATURATION_TARGET = float(os.getenv("DEGRADE_SATURATION_TARGET", "0.8"))
+# Rooms hosted on these tiers are shed first
+DEGRADE_SHED_TIERS = set(os.getenv("DEGRADE_SHED_TIERS", "free").split(","))
+
+LEVEL_NORMAL = 0
+LEVEL_CAPTIONS_ONLY = 1  # Skip TTS
+LEVEL_FAST_MODELS = 2    # Also force the fastest model profile
+LEVEL_SHED_ROOMS = 3     # Also stop translating low-priority rooms
+LEVEL_NAMES = ("normal", "captions_only", "fast_models", "shed_rooms")
+
+# Stage families whose per-attempt latencies (deadline.<family>.<stage>_ms) add up to an utterance.
+# Each step lists alternative stages (MT is a direct translation or a single-request pivot);
+# a step counts its slowest alternative
+STAGE_FAMILIES = {
+    "minimal": (("stt",), ("mt", "pivot"), ("tts",)),
+    "traditional": (("stt",), ("mt",), ("tts",)),
+}
+
+
+class DegradationController:
+    """
+    Level 0-3 with hysteresis: a level is entered after DEGRADE_UP_TICKS consecutive
+    ticks above DEGRADE_UP_PRESSURE and left after DEGRADE_DOWN_TICKS ticks below
+    DEGRADE_DOWN_PRESSURE, one level at a time
+    """
+
+    def __init__(self, interval: float = DEGRADE_INTERVAL_S, window: float = DEGRADE_WINDOW_S,
+                 budget_ms: float = UTTERANCE_BUDGET_MS):
+        self.interval = interval
+        self.window = window
+        self.budget_ms = budget_ms
+        self.level = LEVEL_NORMAL
+        self.pressure = 0.0
+        self.changed_at = time.time()
+        self._above = 0
+        self._below = 0
+        self._seen: Dict[str, int] = {}  # histogram name -> count at last tick
+        self._samples: Dict[str, Deque[Tuple[float, float]]] = {}  # name -> (time, ms)
+        self._last_p95: Dict[str, float] = {}  # name -> p95 when the stage was last measured
+        self._baseline: Dict[str, float] = {}  # family -> measured-stage total when stages were switched off
+        self._shed_rooms: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if DEGRADATION_ENABLED and self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("📉 Degradation controller started")
+
+    async def shutdown(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.tick()
+            except Exception as e:
+                logger.error(f"❌ Degradation controller tick failed: {e}")
+
+    # ---- Signals ----
+
+    def _collect(self, name: str, now: float) -> List[float]:
+        """Samples recorded in the window (new ones are read off the histogram's recent deque)"""
+        histogram = metrics.histogram(name)
+        new = histogram.count - self._seen.get(name, 0)
+        self._seen[name] = histogram.count
+        samples = self._samples.setdefault(name, deque())
+        if new > 0:
+            recent = list(histogram.recent)
+            samples.extend((now, value) for value in recent[-min(new, len(recent)):])
+        while samples and samples[0][0] < now - self.window:
+            samples.popleft()
+        return [value for _, value in samples]
+
+    def _disabled_stages(self) -> Set[str]:
+        """Stages the current level switched off (they stop producing samples)"""
+        return {"tts"} if self.level >= LEVEL_CAPTIONS_ONLY else set()
+
+    def _latency_pressure(self, now: float) -> float:
+        """
+        Sum of recent per-stage p95s over the utterance budget, worst family
+
+        A stage switched off by degradation stops producing samples; it is estimated
+        from its last measured p95, scaled by how the still-measured stages moved since
+        it was switched off, so its absence does not read as recovery and flap the level
+        """
+        disabled = self._disabled_stages()
+        if not disabled:
+            self._baseline.clear()
+        worst = 0.0
+        for family, steps in STAGE_FAMILIES.items():
+            measured = 0.0
+            for step in steps:
+                step_p95 = 0.0
+                for stage in step:
+                    name = f"deadline.{family}.{stage}_ms"
+                    values = sorted(self._collect(name, now))
+                    if values:
+                        self._last_p95[name] = values[min(len(values) - 1, int(round(0.95 * (len(values) - 1))))]
+                        if stage not in disabled:
+                            step_p95 = max(step_p95, self._last_p95[name])
+                measured += step_p95
+            total = measured
+            if disabled:
+                baseline = self._baseline.setdefault(family, measured)
+                scale = measured / baseline if baseline else 1.0
+                total += sum(self._last_p95.get(f"deadline.{family}.{stage}_ms", 0.0) * scale
+                             for step in steps for stage in step if stage in disabled)
+            worst = max(worst, total / self.budget_ms)
+        return worst
+
+    def _backlog_pressure(self) -> float:
+        return metrics.gauges.get("openai.http.saturation", 0.0) / DEGRADE_SATURATION_TARGET
+
+    def tick(self):
+        """Re-evaluate pressure and move at most one level"""
+        now = time.time()
+        self.pressure = max(self._latency_pressure(now), self._backlog_pressure())
+        metrics.set_gauge("degradation.pressure", self.pressure)
+
+        if self.pressure > DEGRADE_UP_PRESSURE:
+            self._above += 1
+            self._below = 0
+        elif self.pressure < DEGRADE_DOWN_PRESSURE:
+            self._below += 1
+            self._above = 0
+        else:
+            self._above = self._below = 0
+
+        if self._above >= DEGRADE_UP_TICKS and self.level < LEVEL_SHED_ROOMS:
+            self._set_level(self.level + 1)
+        elif self._below >= DEGRADE_DOWN_TICKS and self.level > LEVEL_NORMAL:
+            self._set_level(self.level - 1)
+
+    def _set_level(self, level: int):
+        previous = self.level
+        self.level = level
+        self.changed_at = time.time()
+        self._above = self._below = 0
+        if level < LEVEL_SHED_ROOMS:
+            self._shed_rooms.clear()
+        metrics.set_gauge("degradation.level", level)
+        metrics.increment(f"degradation.transitions.{LEVEL_NAMES[level]}")
+        log = logger.warning if level > previous else logger.info
+        log(f"📉 Degradation level {LEVEL_NAMES[previous]} → {LEVEL_NAMES[level]} (pressure {self.pressure:.2f})")
+
+    # ---- Decisions for callers ----
+
+    @property
+    def skip_tts(self) -> bool:
+        return self.level >= LEVEL_CAPTIONS_ONLY
+
+    def effective_profile(self, profile: ModelProfile) -> ModelProfile:
+        """The requested profile, or the fastest one while degraded to fast models"""
+        if self.level >= LEVEL_FAST_MODELS:
+            return get_profile("fastest")
+        return profile
+
+    def should_shed(self, room_id: str, tier: str) -> bool:
+        """True when this room's audio should not be translated right now"""
+        if self.level < LEVEL_SHED_ROOMS or tier not in DEGRADE_SHED_TIERS:
+            return False
+        if room_id not in self._shed_rooms:
+            self._shed_rooms.add(room_id)
+            metrics.increment("degradation.rooms_shed")
+            logger.warning(f"📉 Shedding room {room_id} ({tier} tier)")
+        return True
+
+    def is_shed(self, room_id: str) -> bool:
+        return room_id in self._shed_rooms
+
+    def get_stats(self) -> Dict:
+        return {
+            "enabled": DEGRADATION_ENABLED,
+            "level": self.level,
+            "level_name": LEVEL_NAMES[self.level],
+            "pressure": round(self.pressure, 3),
+            "since": self.changed_at,
+            "shed_rooms": sorted(self._shed_rooms)
+        }
+
+
+# Process-wide controller
+degradation = DegradationController()
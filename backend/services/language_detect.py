@@ -0,0 +1,82 @@
+"""
+Spoken-language detection for routing
+Uses the language Whisper detected (verbose_json), falling back to a local text
+classifier when available, so listeners who already understand an utterance
+can skip MT and TTS
+"""
+
+import logging
+import os
+from typing import Optional
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# "declared": trust the speaker's source_lang and pin Whisper to it
+# "detect": let Whisper detect the language and route on what was actually spoken
+LANGUAGE_DETECTION = os.getenv("LANGUAGE_DETECTION", "declared")
+DETECTION_MODES = ("declared", "detect")
+
+# Shortest transcript the text classifier is trusted on
+CLASSIFIER_MIN_CHARS = int(os.getenv("LANGUAGE_CLASSIFIER_MIN_CHARS", "20"))
+
+try:
+    import langid
+    LANGID_AVAILABLE = True
+except ImportError:
+    langid = None
+    LANGID_AVAILABLE = False
+
+# Whisper reports languages by English name
+WHISPER_LANGUAGE_CODES = {
+    "english": "en", "spanish": "es", "french": "fr", "german": "de",
+    "chinese": "zh", "arabic": "ar", "russian": "ru", "japanese": "ja",
+    "korean": "ko", "portuguese": "pt", "italian": "it", "dutch": "nl",
+    "hindi": "hi", "turkish": "tr", "vietnamese": "vi", "icelandic": "is",
+    "ukrainian": "uk", "polish": "pl", "swedish": "sv", "norwegian": "no",
+    "nynorsk": "nn", "danish": "da", "finnish": "fi", "czech": "cs",
+    "romanian": "ro", "hungarian": "hu", "greek": "el", "persian": "fa",
+    "urdu": "ur", "bengali": "bn", "thai": "th", "indonesian": "id",
+    "tagalog": "tl", "lithuanian": "lt", "latvian": "lv", "estonian": "et",
+    "croatian": "hr", "serbian": "sr", "bulgarian": "bg", "slovak": "sk",
+    "slovenian": "sl", "hebrew": "he", "somali": "so", "swahili": "sw",
+    "pashto": "ps", "kurdish": "ku", "albanian": "sq", "catalan": "ca",
+}
+
+
+def whisper_language_code(language: Optional[str]) -> Optional[str]:
+    """ISO 639-1 code for a Whisper language name (codes pass through)"""
+    if not language:
+        return None
+    language = language.strip().lower()
+    if len(language) == 2:
+        return language
+    return WHISPER_LANGUAGE_CODES.get(language)
+
+
+def classify_text(text: str) -> Optional[str]:
+    """Language of a transcript from the local classifier (None when unavailable or too short)"""
+    if not LANGID_AVAILABLE or len(text) < CLASSIFIER_MIN_CHARS:
+        return None
+    code, _ = langid.classify(text)
+    return code
+
+
+def detect_spoken_language(language: Optional[str], text: str, declared: str) -> str:
+    """
+    Best guess of the language actually spoken
+
+    Args:
+        language: Language Whisper reported (verbose_json "language")
+        text: Transcript
+        declared: Speaker's declared source language (fallback)
+
+    Returns:
+        ISO 639-1 code
+    """
+    detected = whisper_language_code(language) or classify_text(text) or declared
+    if detected != declared:
+        metrics.increment("language_detect.mismatch")
+        logger.info(f"🗣️ Detected {detected} (declared {declared})")
+    return detected
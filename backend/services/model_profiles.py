@@ -0,0 +1,90 @@
+"""
+Latency-tier model profiles
+A profile fixes STT/MT/TTS models, voice, audio format and token limits together,
+so a room or session can trade quality for latency without code changes
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ModelProfile:
+    """Models and output settings for one latency tier"""
+    name: str
+    stt_model: str
+    mt_model: str
+    mt_max_tokens: int
+    tts_model: str
+    tts_voice: str
+    tts_format: str  # OpenAI speech response_format (opus, mp3, ...)
+    tts_speed: float = 1.0
+
+
+MODEL_PROFILES: Dict[str, ModelProfile] = {
+    profile.name: profile for profile in (
+        ModelProfile(
+            name="fastest",
+            stt_model="whisper-1",
+            mt_model="gpt-3.5-turbo",
+            mt_max_tokens=500,
+            tts_model="tts-1",
+            tts_voice="alloy",
+            tts_format="opus",
+            tts_speed=1.05
+        ),
+        ModelProfile(
+            name="balanced",
+            stt_model="whisper-1",
+            mt_model="gpt-4o-mini",
+            mt_max_tokens=500,
+            tts_model="tts-1-hd",
+            tts_voice="nova",
+            tts_format="mp3"
+        ),
+        ModelProfile(
+            name="quality",
+            stt_model="whisper-1",
+            mt_model="gpt-4o",
+            mt_max_tokens=1000,
+            tts_model="tts-1-hd",
+            tts_voice="nova",
+            tts_format="mp3"
+        ),
+    )
+}
+
+# Defaults keep each backend on the models it used before profiles existed
+MINIMAL_MODEL_PROFILE = os.getenv("MINIMAL_MODEL_PROFILE", "fastest")
+TRADITIONAL_MODEL_PROFILE = os.getenv("TRADITIONAL_MODEL_PROFILE", "balanced")
+
+
+def get_profile(name: Optional[str], default: str = MINIMAL_MODEL_PROFILE) -> ModelProfile:
+    """
+    Look up a profile by name
+
+    Args:
+        name: Requested profile (None or unknown falls back to default)
+        default: Profile name to fall back to
+
+    Returns:
+        The matching ModelProfile
+    """
+    profile = MODEL_PROFILES.get(name) if name else None
+    if profile is None:
+        if name:
+            logger.warning(f"⚠️ Unknown model profile '{name}', using '{default}'")
+        profile = MODEL_PROFILES[default]
+    return profile
+
+
+def record_profile_latency(profile: ModelProfile, latency_ms: float):
+    """Count an utterance served by a profile and its end-to-end latency"""
+    metrics.increment(f"profiles.{profile.name}.utterances")
+    metrics.observe(f"profiles.{profile.name}.latency_ms", latency_ms)
@@ -0,0 +1,210 @@
+"""
+Process-wide OpenAI clients with pooled, kept-alive connections
+Created at startup, closed at shutdown; sessions borrow instead of building their own
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from services.deadline import Deadline, call_with_deadline
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "50"))
+OPENAI_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", "20"))
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "30"))
+
+
+class RetryableStatus(Exception):
+    """Rate-limited or server-error response; another attempt may succeed"""
+
+    def __init__(self, response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+class OpenAIClients:
+    """
+    Holds one AsyncOpenAI client (httpx pool) and one requests.Session
+    (for the synchronous minimal backend) per process
+
+    In-flight requests are tracked against the pool size so saturation shows
+    up in metrics (openai.http.in_flight, openai.http.saturation).
+    """
+
+    def __init__(self, max_connections: int = OPENAI_MAX_CONNECTIONS,
+                 max_keepalive: int = OPENAI_MAX_KEEPALIVE,
+                 keepalive_expiry: float = OPENAI_KEEPALIVE_EXPIRY,
+                 timeout: float = OPENAI_TIMEOUT):
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+
+        self._async_client = None
+        self._http_client = None
+        self._session = None
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()  # post_within() runs post() in worker threads
+
+    # ---- Saturation tracking ----
+
+    def _request_started(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        metrics.increment("openai.http.requests")
+        metrics.set_gauge("openai.http.in_flight", self.in_flight)
+        metrics.set_gauge("openai.http.saturation", self.in_flight / self.max_connections)
+        if self.in_flight >= self.max_connections:
+            metrics.increment("openai.http.saturated")
+
+    def _request_finished(self):
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+        metrics.set_gauge("openai.http.in_flight", self.in_flight)
+        metrics.set_gauge("openai.http.saturation", self.in_flight / self.max_connections)
+
+    # ---- Async client (AsyncOpenAI over a shared httpx pool) ----
+
+    def _build_async_client(self, api_key: Optional[str]):
+        import httpx
+        from openai import AsyncOpenAI
+
+        owner = self
+
+        class CountingTransport(httpx.AsyncBaseTransport):
+            """Counts requests waiting on the pool or the server (until headers arrive)"""
+
+            def __init__(self, inner):
+                self.inner = inner
+
+            async def handle_async_request(self, request):
+                owner._request_started()
+                started = time.perf_counter()
+                try:
+                    return await self.inner.handle_async_request(request)
+                finally:
+                    owner._request_finished()
+                    metrics.observe("openai.http.ttfb_ms", (time.perf_counter() - started) * 1000)
+
+            async def aclose(self):
+                await self.inner.aclose()
+
+        transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry
+        ))
+        self._http_client = httpx.AsyncClient(
+            transport=CountingTransport(transport),
+            timeout=httpx.Timeout(self.timeout, connect=10.0)
+        )
+        self._async_client = AsyncOpenAI(
+            api_key=api_key or os.getenv("OPENAI_API_KEY"),
+            http_client=self._http_client
+        )
+
+    async def start(self, api_key: str = None):
+        """Create the shared clients (idempotent)"""
+        if self._async_client is None:
+            self._build_async_client(api_key)
+            logger.info(f"OpenAI client pool ready (max {self.max_connections} connections, "
+                        f"{self.max_keepalive} keep-alive)")
+
+    def get_client(self, api_key: str = None):
+        """Shared AsyncOpenAI client (created on first use if start() was not called)"""
+        if self._async_client is None:
+            self._build_async_client(api_key)
+        return self._async_client
+
+    # ---- Sync session (requests) ----
+
+    @property
+    def session(self):
+        """Shared requests.Session with a pooled adapter for api.openai.com"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_keepalive)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    def post(self, url: str, **kwargs):
+        """requests.post over the shared session, counted toward saturation"""
+        self._request_started()
+        started = time.perf_counter()
+        try:
+            return self.session.post(url, **kwargs)
+        finally:
+            self._request_finished()
+            metrics.observe("openai.http.request_ms", (time.perf_counter() - started) * 1000)
+
+    async def post_within(self, url: str, deadline: Optional[Deadline], name: str,
+                          cap: Optional[float] = None, **kwargs):
+        """
+        post() off the event loop under an utterance budget
+
+        429/5xx responses and network errors are retried while the budget allows.
+        Never hedged: a losing attempt's thread can't be cancelled, so the duplicate
+        request would still run and be billed. Request bodies must be re-sendable
+        (pass bytes in files=, not open streams).
+
+        Args:
+            url: Endpoint
+            deadline: Utterance latency budget
+            name: Metric name for this kind of request
+            cap: Longest a single attempt may take, in seconds
+
+        Returns:
+            The response (the last one when every attempt got 429/5xx)
+        """
+        import requests
+
+        async def attempt(timeout: float):
+            response = await asyncio.to_thread(self.post, url, timeout=timeout, **kwargs)
+            if response.status_code == 429 or response.status_code >= 500:
+                raise RetryableStatus(response)
+            return response
+
+        try:
+            return await call_with_deadline(attempt, deadline, name, cap=cap, hedge=False,
+                                            retry_on=(RetryableStatus, requests.RequestException))
+        except RetryableStatus as e:
+            return e.response
+
+    async def shutdown(self):
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._http_client = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        logger.info("OpenAI client pool closed")
+
+    def get_stats(self) -> Dict:
+        return {
+            "max_connections": self.max_connections,
+            "max_keepalive": self.max_keepalive,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "saturation": round(self.in_flight / self.max_connections, 3),
+            "ttfb": metrics.histogram("openai.http.ttfb_ms").snapshot()
+        }
+
+
+# Process-wide clients
+openai_clients = OpenAIClients()
@@ -0,0 +1,112 @@
+"""
+Staged async pipeline: independent stages joined by bounded queues
+Throughput is set by the slowest stage instead of the sum of all stages
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# (name, coroutine function, concurrency); a stage returning None drops the item
+Stage = Tuple[str, Callable[[Any], Awaitable[Optional[Any]]], int]
+
+_DROPPED = object()  # Placeholder so the reorder buffer can skip dropped items
+
+
+class StagedPipeline:
+    """
+    Runs items through stages concurrently, emitting results in submission order
+
+    Each stage has its own worker count, so chunk n+1 can be transcribed while
+    chunk n is still being translated or synthesized.
+    """
+
+    def __init__(self, stages: List[Stage], on_result: Callable[[Any], Awaitable[None]],
+                 queue_size: int = 8, name: str = "pipeline"):
+        """
+        Initialize pipeline (workers start with start())
+
+        Args:
+            stages: Ordered (name, fn, concurrency) tuples
+            on_result: Coroutine called with each completed item, in order
+            queue_size: Bound on items waiting in front of each stage (backpressure)
+            name: Metric prefix
+        """
+        self.stages = stages
+        self.on_result = on_result
+        self.name = name
+        self._queues = [asyncio.Queue(maxsize=queue_size) for _ in stages]
+        self._done: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._next_seq = 0
+        self._emit_seq = 0
+        self._reorder: Dict[int, Any] = {}
+
+    def start(self):
+        for index, (stage_name, fn, concurrency) in enumerate(self.stages):
+            for _ in range(max(1, concurrency)):
+                self._workers.append(asyncio.create_task(self._stage_worker(index, stage_name, fn)))
+        self._workers.append(asyncio.create_task(self._emitter()))
+
+    async def submit(self, item: Any) -> int:
+        """
+        Enqueue an item (waits when the first stage is backed up)
+
+        Returns:
+            Sequence number of the item
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        await self._queues[0].put((seq, time.perf_counter(), item))
+        return seq
+
+    @property
+    def in_flight(self) -> int:
+        return self._next_seq - self._emit_seq
+
+    async def _stage_worker(self, index: int, stage_name: str, fn):
+        queue = self._queues[index]
+        last = index == len(self.stages) - 1
+        while True:
+            seq, submitted, item = await queue.get()
+            started = time.perf_counter()
+            try:
+                result = await fn(item)
+            except Exception as e:
+                logger.error(f"{self.name} stage '{stage_name}' failed for item {seq}: {e}")
+                result = None
+            metrics.observe(f"{self.name}.{stage_name}_ms", (time.perf_counter() - started) * 1000)
+
+            if result is None:
+                await self._done.put((seq, submitted, _DROPPED))
+            elif last:
+                await self._done.put((seq, submitted, result))
+            else:
+                await self._queues[index + 1].put((seq, submitted, result))
+
+    async def _emitter(self):
+        """Re-sequence completed items and deliver them in order"""
+        while True:
+            seq, submitted, result = await self._done.get()
+            self._reorder[seq] = (submitted, result)
+            while self._emit_seq in self._reorder:
+                submitted, result = self._reorder.pop(self._emit_seq)
+                self._emit_seq += 1
+                if result is _DROPPED:
+                    continue
+                metrics.observe(f"{self.name}.end_to_end_ms", (time.perf_counter() - submitted) * 1000)
+                try:
+                    await self.on_result(result)
+                except Exception as e:
+                    logger.error(f"{self.name} result delivery failed: {e}")
+
+    async def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
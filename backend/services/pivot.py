@@ -0,0 +1,86 @@
+"""
+English pivot translation support
+Cache of English intermediates (so every target language in a room reuses one
+source → English step) and parsing of single-request pivot responses
+"""
+
+import json
+import logging
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# "single": one structured-output request returns English + target
+# "two_call": source → English, then English → target
+PIVOT_MODE = os.getenv("PIVOT_MODE", "single")
+PIVOT_MODES = ("single", "two_call")
+PIVOT_CACHE_SIZE = int(os.getenv("PIVOT_CACHE_SIZE", "512"))
+
+# How translate_via_english actually produced a translation
+PATH_SINGLE = "single"                    # One structured-output request
+PATH_SINGLE_FALLBACK = "single_fallback"  # Unparseable single response, then two requests
+PATH_TWO_CALL = "two_call"                # source → English, then English → target
+PATH_ENGLISH_CACHED = "english_cached"    # English already known: English → target only
+
+
+class EnglishCache:
+    """LRU of English intermediates keyed by (source language, source text)"""
+
+    def __init__(self, max_size: int = PIVOT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    def get(self, source_lang: str, text: str) -> Optional[str]:
+        key = (source_lang, text.strip())
+        english = self._entries.get(key)
+        if english is None:
+            metrics.increment("pivot.cache.misses")
+            return None
+        self._entries.move_to_end(key)
+        metrics.increment("pivot.cache.hits")
+        return english
+
+    def put(self, source_lang: str, text: str, english: str):
+        if self.max_size <= 0 or not english:
+            return
+        key = (source_lang, text.strip())
+        self._entries[key] = english
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> Dict:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": metrics.counters.get("pivot.cache.hits", 0),
+            "misses": metrics.counters.get("pivot.cache.misses", 0)
+        }
+
+
+def parse_pivot_content(content: str) -> Tuple[str, str]:
+    """
+    English intermediate and final translation from a pivot response
+
+    Raises:
+        ValueError: Content is not the expected JSON object
+    """
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Pivot response is not JSON: {e}")
+    if not isinstance(data, dict):
+        raise ValueError("Pivot response is not a JSON object")
+    english = str(data.get("english") or "").strip()
+    translation = str(data.get("translation") or "").strip()
+    if not translation:
+        raise ValueError("Pivot response has no translation")
+    return english, translation
+
+
+# Process-wide cache
+english_cache = EnglishCache()
@@ -0,0 +1,118 @@
+"""
+Translation prompts laid out for provider-side prefix caching
+Static system prompt → per-language-pair instructions → variable context and text,
+so consecutive requests for a pair share the longest possible prefix
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from utils.metrics import metrics
+
+# Identical for every request; keep anything variable out of it
+TRANSLATOR_SYSTEM_PROMPT = """You are a professional real-time translator specializing in accurate, natural translations of spoken conversation.
+Maintain natural conversational tone, slang, and emotional context.
+Keep translations concise and accurate. Use correct spelling, grammar, and punctuation.
+Reply with the translation only: no quotes, notes, or explanations.
+Previous context, when given, is for disambiguation only and must not be translated."""
+
+ICELANDIC_INSTRUCTIONS = """CRITICAL for Icelandic: Use correct spelling and grammar. Pay special attention to:
+- Special characters: ð (eth), þ (thorn), æ, ö
+- Correct declensions and conjugations
+- Proper capitalization (Icelandic uses lowercase for most nouns)
+- Natural Icelandic word order"""
+
+# Single-request pivot: English intermediate and final translation as one JSON object
+PIVOT_SYSTEM_PROMPT = """You are a professional real-time translator specializing in accurate, natural translations of spoken conversation.
+Maintain natural conversational tone, slang, and emotional context.
+Translate in two steps: first into English, then from that English into the target language.
+Reply with a JSON object only: {"english": "<English translation>", "translation": "<target-language translation>"}"""
+
+CONTEXT_CHARS = 150
+
+
+@lru_cache(maxsize=256)
+def pair_instructions(source_lang: str, target_lang: str) -> str:
+    """Stable instructions for one language pair"""
+    instructions = f"Translate from {source_lang} to {target_lang}."
+    if "is" in (source_lang, target_lang):
+        instructions += f"\n\n{ICELANDIC_INSTRUCTIONS}"
+    return instructions
+
+
+@lru_cache(maxsize=256)
+def _pair_prefix(source_lang: str, target_lang: str) -> Tuple[Dict, Dict]:
+    return (
+        {"role": "system", "content": TRANSLATOR_SYSTEM_PROMPT},
+        {"role": "system", "content": pair_instructions(source_lang, target_lang)}
+    )
+
+
+def translation_messages(text: str, source_lang: str, target_lang: str,
+                         context: Optional[str] = None) -> List[Dict]:
+    """
+    Chat messages for one translation
+
+    Args:
+        text: Text to translate
+        source_lang: Source language
+        target_lang: Target language
+        context: Preceding transcript (only the tail is sent)
+
+    Returns:
+        Messages whose first two entries are shared by every request for the pair
+    """
+    if context:
+        content = f"Previous context: {context[-CONTEXT_CHARS:]}\n\nText to translate:\n{text}"
+    else:
+        content = f"Text to translate:\n{text}"
+    return [*_pair_prefix(source_lang, target_lang), {"role": "user", "content": content}]
+
+
+@lru_cache(maxsize=256)
+def pivot_instructions(source_lang: str, target_lang: str) -> str:
+    """Stable instructions for one pivoted language pair"""
+    instructions = f"Translate from {source_lang} to English, then from English to {target_lang}."
+    if "is" in (source_lang, target_lang):
+        instructions += f"\n\n{ICELANDIC_INSTRUCTIONS}"
+    return instructions
+
+
+@lru_cache(maxsize=256)
+def _pivot_prefix(source_lang: str, target_lang: str) -> Tuple[Dict, Dict]:
+    return (
+        {"role": "system", "content": PIVOT_SYSTEM_PROMPT},
+        {"role": "system", "content": pivot_instructions(source_lang, target_lang)}
+    )
+
+
+def pivot_messages(text: str, source_lang: str, target_lang: str) -> List[Dict]:
+    """Chat messages for a source → English → target translation in one request"""
+    return [*_pivot_prefix(source_lang, target_lang), {"role": "user", "content": f"Text to translate:\n{text}"}]
+
+
+def _field(obj, key: str):
+    if obj is None:
+        return None
+    return obj.get(key) if isinstance(obj, dict) else getattr(obj, key, None)
+
+
+def record_prompt_usage(name: str, usage, latency_ms: float):
+    """
+    Track prompt cache effectiveness for a chat completion
+
+    Args:
+        name: Metric prefix for the caller (e.g. "traditional.mt")
+        usage: Response usage (SDK object or the JSON dict)
+        latency_ms: Request latency, split by cache hit/miss
+    """
+    prompt_tokens = _field(usage, "prompt_tokens") or 0
+    cached_tokens = _field(_field(usage, "prompt_tokens_details"), "cached_tokens") or 0
+
+    prefix = f"prompt_cache.{name}"
+    metrics.increment(f"{prefix}.prompt_tokens", prompt_tokens)
+    metrics.increment(f"{prefix}.cached_tokens", cached_tokens)
+    total = metrics.counters.get(f"{prefix}.prompt_tokens", 0)
+    if total:
+        metrics.set_gauge(f"{prefix}.cached_ratio", metrics.counters.get(f"{prefix}.cached_tokens", 0) / total)
+    metrics.observe(f"{prefix}.{'hit' if cached_tokens else 'miss'}_ms", latency_ms)
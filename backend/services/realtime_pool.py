@@ -0,0 +1,209 @@
+"""
+Pool of pre-connected, pre-configured OpenAI Realtime sessions
+Hides the TLS + WebSocket handshake and session.update from new clients
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Deque, Dict, Hashable, List, Optional
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+REALTIME_POOL_ENABLED = os.getenv("REALTIME_POOL_ENABLED", "true").lower() == "true"
+REALTIME_POOL_MAX = int(os.getenv("REALTIME_POOL_MAX", "4"))  # Warm sessions per key
+REALTIME_POOL_MAX_AGE = float(os.getenv("REALTIME_POOL_MAX_AGE", "300"))  # Seconds before recycling
+HEALTH_CHECK_INTERVAL = 15.0
+RATE_WINDOW = 300.0  # Seconds of connection history used to size the pool
+REFILL_HORIZON = 30.0  # Keep enough sessions warm for this many seconds of arrivals
+
+
+@dataclass
+class WarmSession:
+    """An upstream socket that has completed its handshake and session.update"""
+    key: Hashable
+    ws: object
+    created_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+
+class RealtimeSessionPool:
+    """
+    Keeps a few warm Realtime sessions per language configuration key
+    Pool size per key follows the recent connection rate (demand-driven)
+    """
+
+    def __init__(self, factory: Callable[[Hashable], Awaitable[object]],
+                 max_size: int = REALTIME_POOL_MAX, max_age: float = REALTIME_POOL_MAX_AGE,
+                 min_sizes: Dict[Hashable, int] = None):
+        """
+        Initialize pool (maintenance starts with start())
+
+        Args:
+            factory: Coroutine that opens and configures a session for a key
+            max_size: Upper bound on warm sessions per key
+            max_age: Seconds after which an idle session is recycled
+            min_sizes: Sessions to keep warm per key regardless of demand
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.max_age = max_age
+        self.min_sizes = dict(min_sizes or {})
+
+        self._idle: Dict[Hashable, Deque[WarmSession]] = {}
+        self._arrivals: Dict[Hashable, Deque[float]] = {}
+        self._opening: Dict[Hashable, int] = {}
+        self._checking: Dict[Hashable, int] = {}  # Idle sessions out for a health check
+        self._task: Optional[asyncio.Task] = None
+        self._refills: List[asyncio.Task] = []
+
+    async def start(self):
+        if self._task or not REALTIME_POOL_ENABLED:
+            return
+        self._task = asyncio.create_task(self._maintain())
+        logger.info(f"RealtimeSessionPool started (max {self.max_size}/key, max age {self.max_age:.0f}s)")
+
+    async def shutdown(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for task in self._refills:
+            task.cancel()
+        for sessions in self._idle.values():
+            while sessions:
+                await self._close(sessions.popleft())
+        logger.info("RealtimeSessionPool stopped")
+
+    def target_size(self, key: Hashable) -> int:
+        """Warm sessions wanted for key: arrivals/sec x refill horizon, clamped"""
+        arrivals = self._arrivals.get(key, ())
+        now = time.monotonic()
+        recent = sum(1 for t in arrivals if now - t <= RATE_WINDOW)
+        rate = recent / RATE_WINDOW
+        wanted = math.ceil(rate * REFILL_HORIZON) if recent else 0
+        return max(self.min_sizes.get(key, 0), min(self.max_size, wanted))
+
+    async def acquire(self, key: Hashable):
+        """
+        Take a warm session for key
+
+        Returns:
+            A configured upstream socket, or None when nothing healthy is warm
+            (the caller then connects itself)
+        """
+        arrivals = self._arrivals.setdefault(key, deque(maxlen=256))
+        arrivals.append(time.monotonic())
+
+        sessions = self._idle.get(key)
+        while sessions:
+            session = sessions.popleft()
+            if session.age < self.max_age and self._is_open(session.ws):
+                metrics.increment("realtime.pool.hits")
+                self._schedule_refill(key)
+                return session.ws
+            await self._close(session)
+
+        metrics.increment("realtime.pool.misses")
+        self._schedule_refill(key)
+        return None
+
+    def _is_open(self, ws) -> bool:
+        return not getattr(ws, "closed", False)
+
+    async def _close(self, session: WarmSession):
+        try:
+            await session.ws.close()
+        except Exception:
+            pass
+
+    def _schedule_refill(self, key: Hashable):
+        if not self._task:
+            return  # Pool not running (disabled or shut down)
+        idle = len(self._idle.get(key, ())) + self._checking.get(key, 0)
+        missing = self.target_size(key) - idle - self._opening.get(key, 0)
+        for _ in range(max(0, missing)):
+            self._opening[key] = self._opening.get(key, 0) + 1
+            task = asyncio.create_task(self._open(key))
+            self._refills.append(task)
+            task.add_done_callback(self._refills.remove)
+
+    async def _open(self, key: Hashable):
+        started = time.perf_counter()
+        try:
+            ws = await self.factory(key)
+            metrics.observe("realtime.pool.handshake_ms", (time.perf_counter() - started) * 1000)
+            self._idle.setdefault(key, deque()).append(WarmSession(key, ws))
+        except Exception as e:
+            metrics.increment("realtime.pool.open_errors")
+            logger.warning(f"⚠️ Failed to pre-warm Realtime session {key}: {e}")
+        finally:
+            self._opening[key] -= 1
+
+    async def _health_check(self, session: WarmSession) -> bool:
+        try:
+            pong = await session.ws.ping()
+            await asyncio.wait_for(pong, timeout=5)
+            return True
+        except Exception:
+            return False
+
+    async def _checked(self, session: WarmSession) -> bool:
+        """Health check a session taken out of the idle deque (closed if cancelled meanwhile)"""
+        self._checking[session.key] = self._checking.get(session.key, 0) + 1
+        try:
+            return await self._health_check(session)
+        except asyncio.CancelledError:
+            await self._close(session)
+            raise
+        finally:
+            self._checking[session.key] -= 1
+
+    async def _maintain(self):
+        """Recycle aged/broken sessions and resize each key toward its target"""
+        while True:
+            try:
+                await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+                for key in list(set(self._idle) | set(self.min_sizes) | set(self._arrivals)):
+                    # Check one session at a time against the live deque: acquire() keeps
+                    # serving the others, and sessions _open() adds meanwhile are kept
+                    sessions = self._idle.setdefault(key, deque())
+                    for session in list(sessions):
+                        if session not in sessions:
+                            continue  # Acquired while an earlier session was being checked
+                        sessions.remove(session)
+                        if session.age < self.max_age and await self._checked(session):
+                            sessions.append(session)
+                        else:
+                            metrics.increment("realtime.pool.recycled")
+                            await self._close(session)
+
+                    # Shrink when demand drops
+                    target = self.target_size(key)
+                    while len(sessions) > target:
+                        await self._close(sessions.pop())
+                    self._schedule_refill(key)
+
+                metrics.set_gauge("realtime.pool.idle", sum(len(s) for s in self._idle.values()))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Realtime pool maintenance error: {e}")
+
+    def get_stats(self) -> Dict:
+        return {
+            str(key): {
+                "idle": len(self._idle.get(key, ())),
+                "opening": self._opening.get(key, 0),
+                "target": self.target_size(key)
+            }
+            for key in set(self._idle) | set(self._arrivals)
+        }
@@ -0,0 +1,257 @@
+"""
+Realtime API backed rooms
+Each active speaker gets one Realtime session per distinct listener language;
+session output is fanned out to the listeners who want that language
+"""
+
+import asyncio
+import base64
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Iterable, List, Set, Tuple
+
+from services.audio_jobs import decode_audio
+from services.audio_workers import audio_pool
+from services.resampler import StreamConverter
+from services.translator_realtime import REALTIME_SAMPLE_RATE, RealtimeTranslator
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent Realtime sessions per room; extra pairs use Whisper
+ROOM_REALTIME_MAX_SESSIONS = int(os.getenv("ROOM_REALTIME_MAX_SESSIONS", "6"))
+
+# Listener participant dicts for a language, and a per-participant send
+ListenersFn = Callable[[], List[Dict]]
+SendFn = Callable[[str, Dict], Awaitable[None]]
+
+
+class ListenerGroupSink:
+    """
+    Stands in for the client WebSocket of a RealtimeTranslator (send_json/send_bytes)
+    and forwards its output to a listener group in the room message format
+
+    Listeners that opted into streaming get audio_delta messages as they arrive;
+    everyone else gets the whole response as audio_base64 on the translation message.
+    """
+
+    def __init__(self, source_lang: str, target_lang: str, listeners: ListenersFn, send: SendFn):
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.listeners = listeners
+        self.send = send
+        self.turn_started_at = None  # Set when audio for a new turn is forwarded
+        self._audio = bytearray()
+
+    async def send_json(self, message: Dict):
+        message_type = message.get("type")
+        if message_type == "audio_delta":
+            self._audio += base64.b64decode(message["audio"])
+            for listener in self.listeners():
+                if listener.get("stream_audio"):
+                    await self.send(listener["id"], {
+                        "type": "audio_delta",
+                        "audio": message["audio"],
+                        "source_lang": self.source_lang,
+                        "target_lang": self.target_lang
+                    })
+        elif message_type == "translation":
+            await self._send_translation(message)
+        elif message_type == "error":
+            logger.warning(f"⚠️ Realtime room session {self.source_lang}→{self.target_lang}: {message.get('message')}")
+        # status/connected messages describe the upstream session, not the room
+
+    async def send_bytes(self, data: bytes):
+        """Binary output is not negotiated for rooms"""
+
+    async def _send_translation(self, message: Dict):
+        latency_ms = 0
+        if self.turn_started_at is not None:
+            latency_ms = int((time.monotonic() - self.turn_started_at) * 1000)
+            metrics.observe("rooms.realtime.latency_ms", latency_ms)
+            self.turn_started_at = None
+
+        audio_base64 = base64.b64encode(self._audio).decode("utf-8") if self._audio else None
+        self._audio.clear()
+
+        for listener in self.listeners():
+            await self.send(listener["id"], {
+                "type": "translation",
+                "timestamp": datetime.utcnow().timestamp(),
+                # Hide the original when the speaker's language is Icelandic (matches Whisper rooms)
+                "original": "" if self.source_lang == "is" else message.get("original", ""),
+                "translated": message.get("translated", ""),
+                "source_lang": self.source_lang,
+                "target_lang": self.target_lang,
+                "latency_ms": latency_ms,
+                "audio_base64": None if listener.get("stream_audio") else audio_base64,
+                "mode": "realtime"
+            })
+
+
+class RealtimeRoomSession:
+    """One speaker → one listener language over a Realtime API session"""
+
+    def __init__(self, sink: ListenerGroupSink, source_lang: str, target_lang: str):
+        self.sink = sink
+        self.translator = RealtimeTranslator(sink, source_lang=source_lang, target_lang=target_lang)
+        # The room decodes each chunk once and hands every session 24kHz PCM
+        self.translator.input_format = "pcm16"
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        await self.translator.connect()
+        self._tasks = [
+            asyncio.create_task(self.translator.handle_realtime_events()),
+            asyncio.create_task(self.translator.run_commit_timer())
+        ]
+
+    async def send_pcm(self, pcm: bytes):
+        if self.sink.turn_started_at is None:
+            self.sink.turn_started_at = time.monotonic()
+        await self.translator.send_audio(pcm)
+        await self.translator.on_chunk_end()
+
+    async def close(self):
+        for task in self._tasks:
+            task.cancel()
+        await self.translator.close()
+
+
+class RealtimeRoomManager:
+    """Creates, feeds and tears down Realtime sessions for room speakers"""
+
+    def __init__(self, max_sessions_per_room: int = ROOM_REALTIME_MAX_SESSIONS):
+        self.max_sessions_per_room = max_sessions_per_room
+        # (room_id, speaker_id, source_lang, target_lang) -> session
+        self.sessions: Dict[Tuple[str, str, str, str], RealtimeRoomSession] = {}
+        # (room_id, speaker_id) -> resampler state for that speaker's audio
+        self.converters: Dict[Tuple[str, str], StreamConverter] = {}
+        # (room_id, speaker_id) -> lock over that speaker's sessions; a slow handshake
+        # only holds up its own speaker, never other speakers or rooms
+        self._speaker_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        # room_id -> sessions still handshaking (count toward the room cap)
+        self._starting: Dict[str, int] = {}
+
+    def _room_session_count(self, room_id: str) -> int:
+        return sum(1 for key in self.sessions if key[0] == room_id) + self._starting.get(room_id, 0)
+
+    def _speaker_lock(self, room_id: str, speaker_id: str) -> asyncio.Lock:
+        return self._speaker_locks.setdefault((room_id, speaker_id), asyncio.Lock())
+
+    async def route(self, room_id: str, speaker_id: str, source_lang: str,
+                    listener_langs: Iterable[str], audio_chunk: bytes,
+                    listeners_for: Callable[[str], ListenersFn], send: SendFn) -> Set[str]:
+        """
+        Forward one speaker chunk to a Realtime session per listener language
+
+        Args:
+            room_id: Room code
+            speaker_id: Speaking participant
+            source_lang: Speaker's language
+            listener_langs: Languages listeners want (speaker's own language excluded)
+            audio_chunk: Browser audio (WebM/Opus)
+            listeners_for: Maps a language to a callable returning its current listeners
+            send: Coroutine sending a message to one participant
+
+        Returns:
+            Listener languages that could not be served (caller falls back to Whisper)
+        """
+        wanted = set(listener_langs)
+        unserved: Set[str] = set()
+
+        async with self._speaker_lock(room_id, speaker_id):
+            # Close sessions this speaker no longer needs (group emptied); when the
+            # speaker changed language, reconfigure the live session instead
+            for key in [k for k in self.sessions if k[:2] == (room_id, speaker_id)]:
+                new_key = (room_id, speaker_id, source_lang, key[3])
+                if key[3] not in wanted or (key != new_key and new_key in self.sessions):
+                    await self._close(key)
+                elif key != new_key:
+                    session = self.sessions.pop(key)
+                    try:
+                        await session.translator.set_language(source_lang, key[3])
+                        session.sink.source_lang = source_lang
+                        self.sessions[new_key] = session
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not switch Realtime room session language: {e}")
+                        await session.close()
+
+            targets = []
+            for lang in sorted(wanted):
+                key = (room_id, speaker_id, source_lang, lang)
+                session = self.sessions.get(key)
+                if session is None:
+                    if self._room_session_count(room_id) >= self.max_sessions_per_room:
+                        unserved.add(lang)
+                        continue
+                    session = RealtimeRoomSession(
+                        ListenerGroupSink(source_lang, lang, listeners_for(lang), send),
+                        source_lang, lang
+                    )
+                    self._starting[room_id] = self._starting.get(room_id, 0) + 1
+                    try:
+                        await session.start()
+                    except Exception as e:
+                        logger.error(f"❌ Realtime room session {source_lang}→{lang} failed, using Whisper: {e}")
+                        metrics.increment("rooms.realtime.session_failures")
+                        unserved.add(lang)
+                        continue
+                    finally:
+                        self._starting[room_id] -= 1
+                        if not self._starting[room_id]:
+                            del self._starting[room_id]
+                    self.sessions[key] = session
+                    logger.info(f"🏠 Realtime session for room {room_id}: {speaker_id} {source_lang}→{lang}")
+                targets.append(session)
+
+        if not targets:
+            return unserved
+
+        # Decode and resample once for all of this speaker's sessions
+        try:
+            decoded = await audio_pool.run(decode_audio, audio_chunk, "webm")
+            converter = self.converters.setdefault((room_id, speaker_id), StreamConverter(out_rate=REALTIME_SAMPLE_RATE))
+            pcm = converter.convert(decoded["raw"], decoded["frame_rate"], decoded["channels"], decoded["sample_width"])
+        except Exception as e:
+            logger.error(f"❌ Could not decode room audio for Realtime sessions: {e}")
+            return unserved | {s.translator.target_lang for s in targets}
+
+        metrics.increment("rooms.realtime.chunks")
+        await asyncio.gather(*(session.send_pcm(pcm) for session in targets))
+        return unserved
+
+    async def _close(self, key: Tuple[str, str, str, str]):
+        session = self.sessions.pop(key, None)
+        if session:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"⚠️ Error closing Realtime room session {key}: {e}")
+
+    async def close_speaker(self, room_id: str, speaker_id: str):
+        """Speaker left the room"""
+        lock = self._speaker_lock(room_id, speaker_id)
+        async with lock:
+            for key in [k for k in self.sessions if k[:2] == (room_id, speaker_id)]:
+                await self._close(key)
+            self.converters.pop((room_id, speaker_id), None)
+        if not lock.locked():
+            self._speaker_locks.pop((room_id, speaker_id), None)
+
+    async def close_all(self):
+        for key in list(self.sessions):
+            await self._close(key)
+        self.converters.clear()
+
+    def get_stats(self) -> Dict:
+        rooms: Dict[str, int] = {}
+        for key in self.sessions:
+            rooms[key[0]] = rooms.get(key[0], 0) + 1
+        return {"sessions": len(self.sessions), "rooms": rooms}
+
+
+# Process-wide manager used by minimal_main
+realtime_rooms = RealtimeRoomManager()
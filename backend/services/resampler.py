@@ -0,0 +1,199 @@
+"""
+Vectorized polyphase resampling and channel mixing for 16-bit PCM
+Shared by the Realtime (24kHz) and Whisper (16kHz) audio paths
+"""
+
+import logging
+from functools import lru_cache
+from math import gcd
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TAPS_PER_PHASE = 16  # Filter length per polyphase branch (latency = half this, in input samples)
+KAISER_BETA = 8.0
+ROLLOFF = 0.92  # Passband edge as a fraction of the lower Nyquist frequency
+
+
+@lru_cache(maxsize=32)
+def design_filter_bank(in_rate: int, out_rate: int, taps_per_phase: int = TAPS_PER_PHASE) -> Tuple[int, int, np.ndarray]:
+    """
+    Precompute the polyphase filter bank for a rate pair (cached per pair)
+
+    Args:
+        in_rate: Input sample rate in Hz
+        out_rate: Output sample rate in Hz
+        taps_per_phase: Taps in each polyphase branch
+
+    Returns:
+        Tuple of (up, down, bank) where bank has shape (up, taps_per_phase)
+        and bank[p, j] is the tap applied to input sample n - j for phase p
+    """
+    divisor = gcd(in_rate, out_rate)
+    up = out_rate // divisor
+    down = in_rate // divisor
+
+    # Windowed-sinc lowpass at the upsampled rate
+    length = up * taps_per_phase
+    cutoff = 0.5 * ROLLOFF / max(up, down)  # Normalized to the upsampled rate
+    n = np.arange(length) - (length - 1) / 2.0
+    prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, KAISER_BETA)
+    prototype *= up / prototype.sum()  # Unity DC gain after zero-stuffing
+
+    # bank[p, j] = h[p + j*up]
+    bank = prototype.reshape(taps_per_phase, up).T.astype(np.float32)
+    bank.setflags(write=False)
+    return up, down, bank
+
+
+def pcm16_to_float(raw, sample_width: int = 2) -> np.ndarray:
+    """
+    Interpret raw PCM as float32 samples in [-1, 1)
+
+    Args:
+        raw: PCM bytes-like object
+        sample_width: Bytes per sample (1, 2 or 4, as produced by pydub)
+
+    Returns:
+        Interleaved float32 samples
+    """
+    if sample_width == 2:
+        return np.frombuffer(raw, dtype=np.int16).astype(np.float32) * (1.0 / 32768.0)
+    if sample_width == 4:
+        return (np.frombuffer(raw, dtype=np.int32) * (1.0 / 2147483648.0)).astype(np.float32)
+    if sample_width == 1:
+        # 8-bit WAV PCM is unsigned
+        return (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) * (1.0 / 128.0)
+    raise ValueError(f"Unsupported sample width: {sample_width}")
+
+
+def mix_to_mono(samples: np.ndarray, channels: int) -> np.ndarray:
+    """Average interleaved channels down to mono"""
+    if channels == 1:
+        return samples
+    usable = samples.shape[0] - samples.shape[0] % channels
+    return samples[:usable].reshape(-1, channels).mean(axis=1, dtype=np.float32)
+
+
+def float_to_pcm16(samples: np.ndarray) -> bytes:
+    """Clip float samples and pack as 16-bit PCM"""
+    scaled = np.multiply(samples, 32767.0, dtype=np.float32)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    return scaled.astype(np.int16).tobytes()
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational-ratio resampler
+    Carries filter history and phase across chunks so chunk boundaries are seamless
+    """
+
+    def __init__(self, in_rate: int, out_rate: int, taps_per_phase: int = TAPS_PER_PHASE):
+        """
+        Initialize resampler
+
+        Args:
+            in_rate: Input sample rate in Hz
+            out_rate: Output sample rate in Hz
+            taps_per_phase: Taps in each polyphase branch
+        """
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.up, self.down, self.bank = design_filter_bank(in_rate, out_rate, taps_per_phase)
+        self.taps = taps_per_phase
+        self._tap_offsets = np.arange(taps_per_phase)
+
+        # Streaming state
+        self._history = np.zeros(taps_per_phase, dtype=np.float32)
+        self._inputs_seen = 0  # Absolute count of input samples consumed
+        self._next_output = 0  # Absolute index of the next output sample
+
+    def reset(self):
+        """Forget history (e.g. at the start of a new utterance)"""
+        self._history[:] = 0
+        self._inputs_seen = 0
+        self._next_output = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Resample one chunk of mono float32 audio
+
+        Args:
+            samples: Mono float32 samples at in_rate
+
+        Returns:
+            Mono float32 samples at out_rate
+        """
+        if self.up == self.down:
+            return samples.astype(np.float32, copy=False)
+
+        samples = samples.astype(np.float32, copy=False)
+        extended = np.concatenate((self._history, samples))
+        first_input = self._inputs_seen - self._history.shape[0]  # Absolute index of extended[0]
+        total_inputs = self._inputs_seen + samples.shape[0]
+
+        # Output m reads input n = floor(m * down / up) and its predecessors
+        last_output = (total_inputs * self.up - 1) // self.down  # Largest m with n < total_inputs
+        outputs = np.arange(self._next_output, last_output + 1, dtype=np.int64)
+        result = np.empty(0, dtype=np.float32)
+        if outputs.shape[0]:
+            positions = outputs * self.down
+            input_index = positions // self.up - first_input
+            phases = positions % self.up
+
+            # Gather (M, taps) windows and apply each output's phase branch
+            windows = extended[input_index[:, None] - self._tap_offsets[None, :]]
+            result = np.einsum("ij,ij->i", windows, self.bank[phases]).astype(np.float32, copy=False)
+            self._next_output = int(outputs[-1]) + 1
+
+        # Keep the last `taps` inputs: with upsampling the next output may still read
+        # the final sample of this chunk, plus taps-1 samples before it
+        self._history = extended[-self.taps:].copy()
+        self._inputs_seen = total_inputs
+        return result
+
+
+class StreamConverter:
+    """
+    Per-stream PCM normalizer: any rate/channels/width -> mono 16-bit at a fixed rate
+    Reuses its resampler while the input format stays the same
+    """
+
+    def __init__(self, out_rate: int):
+        self.out_rate = out_rate
+        self._resampler: Optional[PolyphaseResampler] = None
+
+    def reset(self):
+        if self._resampler:
+            self._resampler.reset()
+
+    def convert(self, raw, in_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+        """
+        Convert a PCM chunk to mono 16-bit PCM at out_rate
+
+        Args:
+            raw: Interleaved PCM bytes-like object
+            in_rate: Input sample rate in Hz
+            channels: Input channel count
+            sample_width: Input bytes per sample
+
+        Returns:
+            Mono PCM16 bytes at out_rate
+        """
+        samples = mix_to_mono(pcm16_to_float(raw, sample_width), channels)
+
+        if in_rate != self.out_rate:
+            if self._resampler is None or self._resampler.in_rate != in_rate:
+                if self._resampler is not None:
+                    logger.info(f"Input rate changed {self._resampler.in_rate} → {in_rate}Hz, new resampler")
+                self._resampler = PolyphaseResampler(in_rate, self.out_rate)
+            samples = self._resampler.process(samples)
+
+        return float_to_pcm16(samples)
+
+
+def resample_pcm16(raw, in_rate: int, out_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    """One-shot conversion to mono PCM16 at out_rate (no state kept)"""
+    return StreamConverter(out_rate).convert(raw, in_rate, channels, sample_width)
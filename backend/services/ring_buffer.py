@@ -0,0 +1,137 @@
+"""
+Fixed-capacity ring buffer for PCM audio
+Exposes memoryview windows so audio is copied once on ingestion and
+never again until it is framed for upload
+"""
+
+import logging
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity byte ring for per-speaker audio accumulation
+    Oldest audio is overwritten when the buffer is full
+    """
+
+    def __init__(self, capacity: int, sample_width: int = 2):
+        """
+        Initialize ring buffer
+
+        Args:
+            capacity: Maximum number of bytes retained
+            sample_width: Bytes per sample (writes and windows stay sample-aligned)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        # Keep capacity sample-aligned so a window never splits a sample
+        self.sample_width = sample_width
+        self.capacity = capacity - (capacity % sample_width)
+        self._buffer = bytearray(self.capacity)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # Offset of oldest byte
+        self._size = 0  # Number of valid bytes
+        self.dropped_bytes = 0  # Bytes overwritten before being read
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def free_space(self) -> int:
+        return self.capacity - self._size
+
+    def clear(self):
+        """Drop all buffered audio (for privacy)"""
+        self._start = 0
+        self._size = 0
+
+    def write(self, data) -> int:
+        """
+        Copy audio into the ring (the only copy made on ingestion)
+
+        Args:
+            data: Any bytes-like object (bytes, bytearray, memoryview)
+
+        Returns:
+            Number of bytes written
+        """
+        src = memoryview(data).cast("B")
+        n = len(src)
+        if n == 0:
+            return 0
+
+        # Only the newest `capacity` bytes can survive
+        if n > self.capacity:
+            self.dropped_bytes += self._size + (n - self.capacity)
+            src = src[n - self.capacity:]
+            n = self.capacity
+            self._start = 0
+            self._size = 0
+
+        overflow = n - self.free_space
+        if overflow > 0:
+            self.dropped_bytes += overflow
+            self._start = (self._start + overflow) % self.capacity
+            self._size -= overflow
+
+        end = (self._start + self._size) % self.capacity
+        first = min(n, self.capacity - end)
+        self._view[end:end + first] = src[:first]
+        if first < n:
+            self._view[0:n - first] = src[first:]
+
+        self._size += n
+        return n
+
+    def window(self, offset: int = 0, length: int = None) -> Tuple[memoryview, ...]:
+        """
+        Zero-copy view over buffered audio
+
+        Args:
+            offset: Start position relative to the oldest buffered byte
+            length: Number of bytes (defaults to everything after offset)
+
+        Returns:
+            One memoryview, or two when the window wraps around the ring end
+        """
+        if offset < 0 or offset > self._size:
+            raise IndexError("window offset out of range")
+        if length is None:
+            length = self._size - offset
+        length = max(0, min(length, self._size - offset))
+        if length == 0:
+            return ()
+
+        begin = (self._start + offset) % self.capacity
+        first = min(length, self.capacity - begin)
+        if first == length:
+            return (self._view[begin:begin + length],)
+        return (self._view[begin:self.capacity], self._view[0:length - first])
+
+    def consume(self, length: int):
+        """Release `length` bytes from the front once they have been uploaded"""
+        length = min(length, self._size)
+        self._start = (self._start + length) % self.capacity
+        self._size -= length
+
+    def read(self, length: int = None) -> bytes:
+        """Copy out and consume audio (for callers that need owned bytes)"""
+        parts = self.window(0, length)
+        data = b"".join(parts)
+        self.consume(len(data))
+        return data
+
+    def stats(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "buffered_bytes": self._size,
+            "dropped_bytes": self.dropped_bytes
+        }
+
+
+def total_length(parts: List[memoryview]) -> int:
+    """Combined byte length of a sequence of buffer views"""
+    return sum(len(p) for p in parts)
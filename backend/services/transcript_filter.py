@@ -0,0 +1,129 @@
+"""
+Whisper hallucination and no-speech filter
+Drops verbose_json segments that Whisper itself flags as unlikely speech
+(no_speech_prob, compression_ratio) and known phantom phrases, before any
+translation or TTS is paid for
+"""
+
+import logging
+import os
+import re
+from typing import FrozenSet, List, Optional
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Whisper's own rules: a segment is silence when no_speech_prob > 0.6 AND avg_logprob < -1.0
+# (confidently decoded text is kept even with a high no-speech probability); compression
+# ratio above 2.4 marks repetitive, likely hallucinated output
+NO_SPEECH_PROB_MAX = float(os.getenv("WHISPER_NO_SPEECH_PROB_MAX", "0.6"))
+LOGPROB_MIN = float(os.getenv("WHISPER_LOGPROB_MIN", "-1.0"))
+COMPRESSION_RATIO_MAX = float(os.getenv("WHISPER_COMPRESSION_RATIO_MAX", "2.4"))
+
+# Extra phrases: comma-separated in HALLUCINATION_PHRASES and/or one per line in HALLUCINATION_PHRASES_FILE
+DEFAULT_HALLUCINATION_PHRASES = (
+    "thanks for watching",
+    "thank you for watching",
+    "thank you so much for watching",
+    "thanks for watching and see you next time",
+    "please subscribe",
+    "please like and subscribe",
+    "like and subscribe",
+    "don't forget to like and subscribe",
+    "subtitles by the amara.org community",
+    "subtitles by amara.org",
+    "transcribed by https://otter.ai",
+    "takk fyrir að horfa",
+    "gracias por ver",
+    "gracias por ver el video",
+    "sous-titres réalisés par la communauté d'amara.org",
+    "продолжение следует",
+    "дякую за перегляд",
+)
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_phrase(text: str) -> str:
+    """Lowercase, punctuation stripped, whitespace collapsed"""
+    return _SPACES.sub(" ", _NON_WORD.sub(" ", text.lower())).strip()
+
+
+def load_hallucination_phrases() -> FrozenSet[str]:
+    phrases = list(DEFAULT_HALLUCINATION_PHRASES)
+    phrases += [p for p in os.getenv("HALLUCINATION_PHRASES", "").split(",") if p.strip()]
+    path = os.getenv("HALLUCINATION_PHRASES_FILE")
+    if path:
+        try:
+            with open(path, encoding="utf-8") as f:
+                phrases += [line for line in f.read().splitlines() if line.strip() and not line.startswith("#")]
+        except OSError as e:
+            logger.warning(f"⚠️ Could not read HALLUCINATION_PHRASES_FILE {path}: {e}")
+    return frozenset(normalize_phrase(p) for p in phrases)
+
+
+HALLUCINATION_PHRASES = load_hallucination_phrases()
+
+
+def _field(obj, key: str):
+    return obj.get(key) if isinstance(obj, dict) else getattr(obj, key, None)
+
+
+def _drop_reason(text: str, no_speech_prob: Optional[float], avg_logprob: Optional[float],
+                 compression_ratio: Optional[float]) -> Optional[str]:
+    if (no_speech_prob is not None and no_speech_prob > NO_SPEECH_PROB_MAX
+            and avg_logprob is not None and avg_logprob < LOGPROB_MIN):
+        return "no_speech"
+    if compression_ratio is not None and compression_ratio > COMPRESSION_RATIO_MAX:
+        return "compression_ratio"
+    normalized = normalize_phrase(text)
+    if not normalized:
+        return "empty"
+    if normalized in HALLUCINATION_PHRASES:
+        return "phrase"
+    return None
+
+
+def filter_transcription(response) -> str:
+    """
+    Speech text of a Whisper verbose_json response with suspect segments removed
+
+    Args:
+        response: Parsed JSON dict or SDK Transcription object; without segments
+            (plain json format) only the phrase list applies
+
+    Returns:
+        Remaining text ("" when nothing survives)
+    """
+    segments = _field(response, "segments")
+    text = (_field(response, "text") or "").strip()
+
+    if not segments:
+        reason = _drop_reason(text, None, None, None) if text else None
+        if reason:
+            metrics.increment(f"transcript_filter.dropped.{reason}")
+            logger.info(f"🔇 Dropped transcription ({reason}): '{text[:60]}'")
+            return ""
+        return text
+
+    kept: List[str] = []
+    for segment in segments:
+        segment_text = (_field(segment, "text") or "").strip()
+        reason = _drop_reason(segment_text, _field(segment, "no_speech_prob"), _field(segment, "avg_logprob"),
+                              _field(segment, "compression_ratio"))
+        if reason:
+            metrics.increment(f"transcript_filter.dropped.{reason}")
+            logger.info(f"🔇 Dropped segment ({reason}): '{segment_text[:60]}'")
+        else:
+            kept.append(segment_text)
+    metrics.increment("transcript_filter.segments", len(segments))
+
+    # Whole-text phrase check catches a phantom phrase split across segments
+    result = " ".join(kept)
+    if result and normalize_phrase(result) in HALLUCINATION_PHRASES:
+        metrics.increment("transcript_filter.dropped.phrase")
+        logger.info(f"🔇 Dropped transcription (phrase): '{result[:60]}'")
+        return ""
+    return result
@@ -0,0 +1,154 @@
+"""
+Measured routing between direct and English-pivot translation
+Per language pair, the best-quality route whose recent p95 fits the latency
+budget (and that is not failing) is used; otherwise the fastest healthy one
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from services.pivot import PIVOT_MODE
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+ROUTE_DIRECT = "direct"
+ROUTE_PIVOT_SINGLE = "pivot_single"      # One structured-output request via English
+ROUTE_PIVOT_TWO_CALL = "pivot_two_call"  # source → English, then English → target
+ROUTES = (ROUTE_DIRECT, ROUTE_PIVOT_SINGLE, ROUTE_PIVOT_TWO_CALL)
+
+# MT latency a route's p95 must stay within to be chosen
+ROUTE_LATENCY_BUDGET_MS = float(os.getenv("ROUTE_LATENCY_BUDGET_MS", "2500"))
+# Routes with fewer recent samples are trusted until measured
+ROUTE_MIN_SAMPLES = int(os.getenv("ROUTE_MIN_SAMPLES", "10"))
+ROUTE_MAX_FAILURE_RATE = float(os.getenv("ROUTE_MAX_FAILURE_RATE", "0.2"))
+# Every Nth decision for a pair re-measures a preferred route that was passed over
+ROUTE_PROBE_EVERY = int(os.getenv("ROUTE_PROBE_EVERY", "10"))
+# Decisions use only this many recent outcomes per route, so a recovered route wins back quickly
+ROUTE_WINDOW = int(os.getenv("ROUTE_WINDOW", "20"))
+# Pairs involving these languages (and not English) are translated via English for quality
+PIVOT_LANGUAGES = set(os.getenv("PIVOT_LANGUAGES", "is").split(","))
+
+
+def _percentile(values: List[float], p: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))]
+
+
+def candidate_routes(source_lang: str, target_lang: str) -> Tuple[str, ...]:
+    """Routes for a pair, best quality first"""
+    if "en" in (source_lang, target_lang) or not PIVOT_LANGUAGES & {source_lang, target_lang}:
+        return (ROUTE_DIRECT,)
+    if PIVOT_MODE == "two_call":
+        return (ROUTE_PIVOT_TWO_CALL, ROUTE_PIVOT_SINGLE, ROUTE_DIRECT)
+    return (ROUTE_PIVOT_SINGLE, ROUTE_PIVOT_TWO_CALL, ROUTE_DIRECT)
+
+
+class TranslationRouter:
+    """Per-pair, per-route latency and failure statistics plus the routing policy"""
+
+    def __init__(self, budget_ms: float = ROUTE_LATENCY_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self._outcomes: Dict[Tuple[str, str, str], Deque[bool]] = {}
+        self._latencies: Dict[Tuple[str, str, str], Deque[float]] = {}
+        self._decisions: Dict[Tuple[str, str], int] = {}
+        self._current: Dict[Tuple[str, str], str] = {}
+
+    @staticmethod
+    def _histogram_name(source_lang: str, target_lang: str, route: str) -> str:
+        return f"routes.{source_lang}-{target_lang}.{route}_ms"
+
+    def record(self, source_lang: str, target_lang: str, route: str, latency_ms: float, ok: bool):
+        """Outcome of one translation over a route (latency only counts successes)"""
+        key = (source_lang, target_lang, route)
+        self._outcomes.setdefault(key, deque(maxlen=ROUTE_WINDOW)).append(ok)
+        if ok:
+            self._latencies.setdefault(key, deque(maxlen=ROUTE_WINDOW)).append(latency_ms)
+            metrics.observe(self._histogram_name(source_lang, target_lang, route), latency_ms)
+        else:
+            metrics.increment(f"routes.{source_lang}-{target_lang}.{route}.failures")
+
+    def route_stats(self, source_lang: str, target_lang: str, route: str) -> Dict:
+        """Recent-window stats the policy decides on (total count from the metrics histogram)"""
+        key = (source_lang, target_lang, route)
+        latencies = list(self._latencies.get(key, ()))
+        outcomes = self._outcomes.get(key, ())
+        return {
+            "samples": len(outcomes),
+            "total": metrics.histogram(self._histogram_name(source_lang, target_lang, route)).count,
+            "p50_ms": _percentile(latencies, 50),
+            "p95_ms": _percentile(latencies, 95),
+            "failure_rate": (outcomes.count(False) / len(outcomes)) if outcomes else 0.0
+        }
+
+    def _healthy(self, stats: Dict) -> bool:
+        return stats["failure_rate"] <= ROUTE_MAX_FAILURE_RATE
+
+    def _within_budget(self, stats: Dict) -> bool:
+        return stats["p95_ms"] is not None and stats["p95_ms"] <= self.budget_ms
+
+    def choose(self, source_lang: str, target_lang: str) -> str:
+        """Route for the next translation of this pair"""
+        candidates = candidate_routes(source_lang, target_lang)
+        if len(candidates) == 1:
+            return candidates[0]
+
+        pair = (source_lang, target_lang)
+        self._decisions[pair] = self._decisions.get(pair, 0) + 1
+        stats = {route: self.route_stats(source_lang, target_lang, route) for route in candidates}
+
+        chosen: Optional[str] = None
+        for route in candidates:
+            if stats[route]["samples"] < ROUTE_MIN_SAMPLES:
+                chosen = route  # Not measured enough yet
+                break
+            if self._healthy(stats[route]) and self._within_budget(stats[route]):
+                chosen = route
+                break
+        if chosen is None:
+            # Nothing fits the budget: fastest healthy route (fastest of all if none are healthy)
+            measured = [r for r in candidates if stats[r]["p95_ms"] is not None]
+            pool = [r for r in measured if self._healthy(stats[r])] or measured or list(candidates)
+            chosen = min(pool, key=lambda r: stats[r]["p95_ms"] or 0)
+
+        # Occasionally re-measure the best-quality route so it can win back the pair
+        preferred = candidates[0]
+        if chosen != preferred and ROUTE_PROBE_EVERY > 0 and self._decisions[pair] % ROUTE_PROBE_EVERY == 0:
+            metrics.increment("routes.probes")
+            return preferred
+
+        if self._current.get(pair) != chosen:
+            if pair in self._current:
+                logger.info(f"🧭 Route {source_lang}→{target_lang}: {self._current[pair]} → {chosen}")
+                metrics.increment("routes.switches")
+            self._current[pair] = chosen
+        return chosen
+
+    def get_stats(self) -> Dict:
+        pairs = {pair for pair in self._current}
+        pairs.update((s, t) for s, t, _ in self._outcomes)
+        routes: List[Dict] = []
+        for source_lang, target_lang in sorted(pairs):
+            candidates = candidate_routes(source_lang, target_lang)
+            routes.append({
+                "pair": f"{source_lang}-{target_lang}",
+                "current": self._current.get((source_lang, target_lang), candidates[0]),
+                "routes": {route: self.route_stats(source_lang, target_lang, route) for route in candidates}
+            })
+        return {
+            "budget_ms": self.budget_ms,
+            "min_samples": ROUTE_MIN_SAMPLES,
+            "max_failure_rate": ROUTE_MAX_FAILURE_RATE,
+            "pivot_languages": sorted(PIVOT_LANGUAGES),
+            "pairs": routes,
+            "generated_at": time.time()
+        }
+
+
+# Process-wide router
+translation_router = TranslationRouter()
@@ -8,50 +8,207 @@ import json
 import logging
 import os
 import base64
+import random
+import time
 from datetime import datetime
+from functools import lru_cache
 import websockets
 from fastapi import WebSocketDisconnect
 
+from services.agc import StreamingAGC
+from services.audio_frames import CODEC_PCM16, AudioDeltaCoalescer, pack_frame
+from services.audio_jobs import decode_audio
+from services.audio_workers import audio_pool
+from services.commit_policy import create_commit_policy
+from services.realtime_pool import RealtimeSessionPool
+from services.resampler import StreamConverter
+from services.ring_buffer import AudioRingBuffer
+from utils import fastjson
+from utils.metrics import metrics
+
 logger = logging.getLogger(__name__)
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 REALTIME_API_URL = "wss://api.openai.com/v1/realtime?model=gpt-4o-realtime-preview-2024-10-01"
+REALTIME_SAMPLE_RATE = 24000  # Realtime API pcm16 is 24kHz mono
+APPEND_MS = int(os.getenv("REALTIME_APPEND_MS", "100"))  # Duration of each input_audio_buffer.append
+REPLAY_SECONDS = float(os.getenv("REALTIME_REPLAY_SECONDS", "5"))  # Uncommitted audio kept for reconnects
+RECONNECT_ATTEMPTS = int(os.getenv("REALTIME_RECONNECT_ATTEMPTS", "5"))
+RECONNECT_BASE_DELAY = 0.25  # Seconds, doubled per attempt
+RECONNECT_MAX_DELAY = 4.0
+
+
+LANGUAGE_NAMES = {
+    "en": "English", "es": "Spanish", "fr": "French", "de": "German",
+    "zh": "Chinese", "ar": "Arabic", "ru": "Russian", "ja": "Japanese",
+    "ko": "Korean", "pt": "Portuguese", "it": "Italian", "nl": "Dutch",
+    "hi": "Hindi", "tr": "Turkish", "vi": "Vietnamese", "is": "Icelandic",
+    "uk": "Ukrainian", "pl": "Polish"
+}
+
+
+def language_name(code: str) -> str:
+    return LANGUAGE_NAMES.get(code, code)
+
+
+@lru_cache(maxsize=256)
+def translation_instructions(source_lang: str, target_lang: str) -> str:
+    """Session instructions for one language pair (cached per pair)"""
+    source, target = language_name(source_lang), language_name(target_lang)
+    return (
+        f"You are a {target} translator. "
+        f"Listen to the {source} audio and speak the {target} translation. "
+        "Do not add any other words. "
+        f"Only speak the direct {target} translation of what you hear."
+    )
+
+
+async def open_realtime_socket():
+    """Open an authenticated WebSocket to the Realtime API"""
+    return await websockets.connect(
+        REALTIME_API_URL,
+        extra_headers={
+            "Authorization": f"Bearer {OPENAI_API_KEY}",
+            "OpenAI-Beta": "realtime=v1"
+        }
+    )
+
+
+def build_session_config(turn_detection=None, source_lang: str = "en", target_lang: str = "es") -> dict:
+    """session.update event configuring a session for translation"""
+    return {
+        "type": "session.update",
+        "session": {
+            "modalities": ["text", "audio"],
+            "instructions": translation_instructions(source_lang, target_lang),
+            "voice": "alloy",
+            "input_audio_format": "pcm16",
+            "output_audio_format": "pcm16",
+            "input_audio_transcription": {
+                "model": "whisper-1"
+            },
+            # None = we commit manually; server_vad policy lets the API detect turns
+            "turn_detection": turn_detection,
+            "temperature": 0.3,
+            "max_response_output_tokens": 4096
+        }
+    }
+
+
+async def open_configured_session(key):
+    """
+    Pool factory: connect and send session.update for a session key
+
+    Args:
+        key: (source_lang, target_lang, commit_policy_name)
+    """
+    source_lang, target_lang, policy_name = key
+    ws = await open_realtime_socket()
+    try:
+        turn_detection = create_commit_policy(policy_name).turn_detection
+        await ws.send(json.dumps(build_session_config(turn_detection, source_lang, target_lang)))
+    except Exception:
+        await ws.close()
+        raise
+    return ws
+
+
+_EVENT_METRIC_NAMES = {}
+
+
+def _event_metric_names(event_type):
+    """(counter, histogram) metric names for an event type, built once per type"""
+    names = _EVENT_METRIC_NAMES.get(event_type)
+    if names is None:
+        names = (f"realtime.events.{event_type}", f"realtime.event_ms.{event_type}")
+        _EVENT_METRIC_NAMES[event_type] = names
+    return names
+
+
+# Warm sessions shared by all Realtime clients (started by the app)
+session_pool = RealtimeSessionPool(open_configured_session)
+
 
 class RealtimeTranslator:
     """
     OpenAI Realtime API translator with streaming audio translation
     """
     
-    def __init__(self, client_ws):
+    def __init__(self, client_ws, commit_policy: str = None, source_lang: str = "en", target_lang: str = "es"):
         self.client_ws = client_ws
         self.openai_ws = None
         self.session_id = None
         self.is_running = False
+        self.source_lang = source_lang
+        self.target_lang = target_lang
         self.original_transcript = ""
         self.translated_text = ""
         
+        # Client audio format: "webm" (MediaRecorder chunks) or "pcm16" (raw 24kHz mono frames)
+        self.input_format = "webm"
+        
+        # Decoded audio -> 24kHz mono PCM16 with resampler state carried across chunks
+        self.converter = StreamConverter(out_rate=REALTIME_SAMPLE_RATE)
+        
+        # Running gain control over the 24kHz PCM we forward upstream
+        self.agc = StreamingAGC(sample_rate=REALTIME_SAMPLE_RATE)
+        
+        # PCM not yet forwarded (less than one append frame)
+        self.append_bytes = REALTIME_SAMPLE_RATE * 2 * APPEND_MS // 1000
+        self._pending_pcm = bytearray()
+        # append_pcm() and flush_audio() (also reached from the commit timer task) must not interleave
+        self._append_lock = asyncio.Lock()
+        
+        # Audio appended since the last commit, replayed into a new session after a drop
+        self.replay_buffer = AudioRingBuffer(capacity=int(REALTIME_SAMPLE_RATE * 2 * REPLAY_SECONDS))
+        self.upstream_ready = False  # False while reconnecting; appends only go to replay_buffer
+        self.reconnects = 0
+        
+        # When to commit the input buffer (see services/commit_policy.py)
+        self.commit_policy = create_commit_policy(commit_policy)
+        self._speech_started_ms = 0
+        
+        # Translated audio delivery: "json" (base64 audio_delta messages) or "binary" frames
+        self.output_format = "json"
+        self.coalescer = AudioDeltaCoalescer(sample_rate=REALTIME_SAMPLE_RATE)
+        self._frame_seq = 0
+        
+        # Response lifecycle, so a language switch can cancel in-flight output
+        self._response_active = False
+        self._discard_output = False  # Drop deltas of a cancelled response until its response.done
+        self._language_switch_started = None
+        
+    @property
+    def session_key(self):
+        """Pool key: sessions are interchangeable only with the same configuration"""
+        return (self.source_lang, self.target_lang, self.commit_policy.name)
+    
     async def connect(self):
-        """Connect to OpenAI Realtime API"""
+        """Connect to OpenAI Realtime API (warm pooled session when available)"""
         try:
-            logger.info("🔌 Connecting to OpenAI Realtime API...")
-            logger.info(f"URL: {REALTIME_API_URL}")
-            logger.info(f"API Key configured: {bool(OPENAI_API_KEY)}")
-            
-            # Connect with API key in header
-            self.openai_ws = await websockets.connect(
-                REALTIME_API_URL,
-                extra_headers={
-                    "Authorization": f"Bearer {OPENAI_API_KEY}",
-                    "OpenAI-Beta": "realtime=v1"
-                }
-            )
+            started = time.perf_counter()
+            self.openai_ws = await session_pool.acquire(self.session_key)
             
-            logger.info("✅ Connected to OpenAI Realtime API")
-            
-            # Configure session for translation
-            await self.configure_session()
+            if self.openai_ws is not None:
+                # Already connected and configured; its session.created/updated
+                # events are still queued and reach handle_realtime_events
+                logger.info("♨️ Using pre-warmed Realtime session")
+            else:
+                logger.info("🔌 Connecting to OpenAI Realtime API...")
+                logger.info(f"URL: {REALTIME_API_URL}")
+                logger.info(f"API Key configured: {bool(OPENAI_API_KEY)}")
+                
+                # Connect with API key in header
+                self.openai_ws = await open_realtime_socket()
+                
+                logger.info("✅ Connected to OpenAI Realtime API")
+                
+                # Configure session for translation
+                await self.configure_session()
             
+            metrics.observe("realtime.connect_ms", (time.perf_counter() - started) * 1000)
             self.is_running = True
+            self.upstream_ready = True
             
             # Notify client of successful connection
             await self.client_ws.send_json({
@@ -70,79 +227,168 @@ class RealtimeTranslator:
     
     async def configure_session(self):
         """Configure the Realtime API session for translation"""
-        config = {
-            "type": "session.update",
-            "session": {
-                "modalities": ["text", "audio"],
-                "instructions": (
-                    "You are a Spanish translator. "
-                    "Listen to the English audio and speak the Spanish translation. "
-                    "Do not add any other words. "
-                    "Only speak the direct Spanish translation of what you hear."
-                ),
-                "voice": "alloy",
-                "input_audio_format": "pcm16",
-                "output_audio_format": "pcm16",
-                "input_audio_transcription": {
-                    "model": "whisper-1"
-                },
-                "turn_detection": None,  # Disable auto turn detection (we handle it manually)
-                "temperature": 0.3,
-                "max_response_output_tokens": 4096
-            }
-        }
-        
+        config = build_session_config(self.commit_policy.turn_detection, self.source_lang, self.target_lang)
         await self.openai_ws.send(json.dumps(config))
-        logger.info("📝 Session configured for English→Spanish translation")
+        logger.info(f"📝 Session configured for {self.source_lang}→{self.target_lang} translation")
     
     async def send_audio(self, audio_chunk: bytes):
-        """Send audio chunk to Realtime API"""
+        """Decode a client audio chunk and stream it to the Realtime API"""
         try:
-            # Convert WebM to PCM16 (required by Realtime API)
-            import io
-            from pydub import AudioSegment
-            
-            # Load WebM audio
-            audio = AudioSegment.from_file(io.BytesIO(audio_chunk), format="webm")
-            
-            # Convert to PCM16: 24kHz, mono, 16-bit
-            audio = audio.set_frame_rate(24000)
-            audio = audio.set_channels(1)
-            audio = audio.set_sample_width(2)  # 16-bit = 2 bytes
-            
-            # Export as raw PCM
-            pcm_data = audio.raw_data
+            if self.input_format == "pcm16":
+                # Already 24kHz mono PCM16 - forward without decoding
+                pcm_data = bytearray(audio_chunk)
+            else:
+                # Convert WebM to PCM16 (required by Realtime API)
+                # Decode off the event loop, in the audio worker pool
+                decoded = await audio_pool.run(decode_audio, audio_chunk, "webm")
+                
+                # Convert to PCM16: 24kHz, mono, 16-bit (vectorized, no intermediate AudioSegments)
+                pcm_data = bytearray(self.converter.convert(
+                    decoded["raw"], decoded["frame_rate"], decoded["channels"], decoded["sample_width"]
+                ))
+                logger.debug(f"🔄 Converted WebM ({len(audio_chunk)} bytes) to PCM16 ({len(pcm_data)} bytes)")
             
-            # Encode to base64
-            audio_base64 = base64.b64encode(pcm_data).decode('utf-8')
+            self.agc.process_stream(pcm_data)
+            await self.append_pcm(pcm_data)
             
-            logger.info(f"🔄 Converted WebM ({len(audio_chunk)} bytes) to PCM16 ({len(pcm_data)} bytes)")
-            
-            message = {
-                "type": "input_audio_buffer.append",
-                "audio": audio_base64
-            }
-            
-            await self.openai_ws.send(json.dumps(message))
-            logger.info(f"📤 Sent PCM16 audio: {len(pcm_data)} bytes")
+            duration_ms = len(pcm_data) * 1000 / (REALTIME_SAMPLE_RATE * 2)
+            if self.commit_policy.on_audio(pcm_data, duration_ms):
+                await self.commit_audio()
             
         except Exception as e:
             logger.error(f"❌ Error sending audio: {e}", exc_info=True)
     
+    async def append_pcm(self, pcm_data):
+        """
+        Forward PCM to the Realtime API in fixed APPEND_MS appends
+        The API can start work on the first frames while later ones are still
+        being sent; a remainder shorter than one frame waits for more audio
+        """
+        async with self._append_lock:
+            self._pending_pcm += pcm_data
+            while len(self._pending_pcm) >= self.append_bytes:
+                # Take the frame off the buffer before awaiting the send
+                frame = bytes(self._pending_pcm[:self.append_bytes])
+                del self._pending_pcm[:self.append_bytes]
+                await self._send_append(frame)
+    
+    async def flush_audio(self):
+        """Forward any buffered remainder (before a commit)"""
+        async with self._append_lock:
+            if self._pending_pcm:
+                pending, self._pending_pcm = bytes(self._pending_pcm), bytearray()
+                await self._send_append(pending)
+    
+    async def _send_append(self, frame):
+        self.replay_buffer.write(frame)
+        if self.upstream_ready:
+            try:
+                await self._send_frame(frame)
+            except websockets.exceptions.ConnectionClosed:
+                # Frame is in replay_buffer; the event loop reconnects and replays it
+                self.upstream_ready = False
+    
+    async def _send_frame(self, frame):
+        message = {
+            "type": "input_audio_buffer.append",
+            "audio": base64.b64encode(frame).decode('utf-8')
+        }
+        await self.openai_ws.send(fastjson.dumps(message))
+    
+    async def set_language(self, source_lang: str, target_lang: str):
+        """
+        Switch the language pair on the live session (no reconnect)
+        Cancels a response still being generated for the old pair. While the
+        upstream is reconnecting only the pair is stored; reconnect() configures
+        the new session with it
+        """
+        if (source_lang, target_lang) == (self.source_lang, self.target_lang):
+            return
+        source_changed = source_lang != self.source_lang
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        if source_changed:
+            # Uncommitted audio was spoken in the old language
+            self._pending_pcm.clear()
+            self.replay_buffer.clear()
+        
+        if not self.upstream_ready:
+            logger.info(f"🌍 Realtime language set to {source_lang}→{target_lang} (applied on reconnect)")
+            return
+        
+        self._language_switch_started = time.perf_counter()
+        try:
+            if self._response_active:
+                await self.openai_ws.send(json.dumps({"type": "response.cancel"}))
+                self._discard_output = True
+                self.coalescer.flush()  # Drop the partial frame of the old translation
+                self.original_transcript = ""
+                self.translated_text = ""
+            
+            if source_changed:
+                await self.openai_ws.send(json.dumps({"type": "input_audio_buffer.clear"}))
+            
+            await self.openai_ws.send(json.dumps({
+                "type": "session.update",
+                "session": {"instructions": translation_instructions(source_lang, target_lang)}
+            }))
+        except websockets.exceptions.ConnectionClosed:
+            # The event loop reconnects and configures the new pair
+            self.upstream_ready = False
+            return
+        logger.info(f"🌍 Realtime session switched to {source_lang}→{target_lang}")
+    
+    async def set_commit_policy(self, name: str):
+        """Switch commit policy mid-session (updates server turn detection; stored while reconnecting)"""
+        self.commit_policy = create_commit_policy(name)
+        if self.upstream_ready:
+            try:
+                await self.openai_ws.send(json.dumps({
+                    "type": "session.update",
+                    "session": {"turn_detection": self.commit_policy.turn_detection}
+                }))
+            except websockets.exceptions.ConnectionClosed:
+                self.upstream_ready = False  # Applied by reconnect()
+        logger.info(f"🎚️ Commit policy: {self.commit_policy.name}")
+    
+    async def on_chunk_end(self):
+        """A complete client audio message has been forwarded"""
+        if self.commit_policy.on_chunk_end():
+            await self.commit_audio()
+    
+    async def check_commit_timer(self):
+        """Periodic check for time-based commit policies"""
+        if self.commit_policy.on_tick(time.monotonic()):
+            await self.commit_audio()
+    
+    async def run_commit_timer(self, interval: float = 0.25):
+        """Time-based commit policies need a clock even when no audio arrives"""
+        while self.is_running:
+            await asyncio.sleep(interval)
+            await self.check_commit_timer()
+    
     async def commit_audio(self):
         """Commit the audio buffer and trigger response"""
+        if self.commit_policy.server_managed:
+            return  # Server VAD commits and responds on its own
+        if not self.upstream_ready:
+            return  # Audio waits in replay_buffer; committed after reconnect
         try:
+            await self.flush_audio()
+            self.commit_policy.on_commit()
+            
             message = {
                 "type": "input_audio_buffer.commit"
             }
             await self.openai_ws.send(json.dumps(message))
+            self.replay_buffer.clear()
             
             # Create a response
             response_message = {
                 "type": "response.create",
                 "response": {
                     "modalities": ["text", "audio"],
-                    "instructions": "Translate to Spanish"
+                    "instructions": f"Translate to {language_name(self.target_lang)}"
                 }
             }
             await self.openai_ws.send(json.dumps(response_message))
@@ -152,111 +398,261 @@ class RealtimeTranslator:
         except Exception as e:
             logger.error(f"❌ Error committing audio: {e}")
     
+    def set_output_format(self, format: str, codec: str = "pcm16"):
+        """
+        Choose how translated audio reaches the client
+
+        Args:
+            format: "json" (legacy audio_delta messages) or "binary" (framed, see audio_frames)
+            codec: Binary frame codec; only "pcm16" is supported
+        """
+        self.output_format = "binary" if format == "binary" else "json"
+        if codec != "pcm16":
+            logger.warning(f"⚠️ Unsupported output codec '{codec}' requested, sending PCM16")
+    
+    async def forward_audio_delta(self, audio_delta: str):
+        """Send one response.audio.delta to the client in the negotiated format"""
+        if self.output_format == "json":
+            await self.client_ws.send_json({
+                "type": "audio_delta",
+                "audio": audio_delta
+            })
+            return
+        for pcm in self.coalescer.add(audio_delta):
+            await self._send_audio_frame(pcm)
+    
+    async def flush_audio_output(self):
+        """Send the tail of a response that did not fill a frame"""
+        if self.output_format == "binary":
+            for pcm in self.coalescer.flush():
+                await self._send_audio_frame(pcm)
+    
+    async def _send_audio_frame(self, pcm: bytes):
+        duration_ms = self.coalescer.duration_ms(pcm)
+        await self.client_ws.send_bytes(pack_frame(pcm, CODEC_PCM16, duration_ms, self._frame_seq))
+        self._frame_seq += 1
+    
+    # ---- Realtime API event handlers (see EVENT_HANDLERS) ----
+    
+    async def _on_session_created(self, event):
+        self.session_id = event.get("session", {}).get("id")
+        logger.info(f"🎉 Session created: {self.session_id}")
+        
+        # Notify client
+        await self.client_ws.send_json({
+            "type": "connected",
+            "session_id": self.session_id,
+            "mode": "realtime",
+            "timestamp": datetime.utcnow().isoformat()
+        })
+    
+    async def _on_session_updated(self, event):
+        logger.info("✅ Session updated successfully")
+        if self._language_switch_started is not None:
+            metrics.observe("realtime.language_switch_ms", (time.perf_counter() - self._language_switch_started) * 1000)
+            self._language_switch_started = None
+    
+    async def _on_response_created(self, event):
+        self._response_active = True
+    
+    async def _on_speech_started(self, event):
+        logger.debug("🎤 Speech detected")
+        self._speech_started_ms = event.get("audio_start_ms", 0)
+        await self.client_ws.send_json({
+            "type": "status",
+            "message": "Speech detected..."
+        })
+    
+    async def _on_speech_stopped(self, event):
+        logger.debug("🛑 Speech ended")
+        self.commit_policy.on_server_speech(self._speech_started_ms, event.get("audio_end_ms", 0))
+        self.replay_buffer.clear()  # Server committed the turn
+    
+    async def _on_input_transcript(self, event):
+        # Original audio transcription completed
+        self.original_transcript = event.get("transcript", "")
+        logger.debug(f"📝 Original transcript: {self.original_transcript}")
+    
+    async def _on_output_transcript(self, event):
+        # Complete translated transcription
+        if self._discard_output:
+            return
+        self.translated_text = event.get("transcript", "")
+        logger.debug(f"✅ Translation transcript: {self.translated_text}")
+    
+    async def _on_audio_delta(self, event):
+        # Streaming audio output
+        audio_delta = event.get("delta", "")
+        if audio_delta and not self._discard_output:
+            await self.forward_audio_delta(audio_delta)
+    
+    async def _on_audio_done(self, event):
+        await self.flush_audio_output()
+    
+    async def _on_response_done(self, event):
+        # Full response complete
+        self._response_active = False
+        if self._discard_output or event.get("response", {}).get("status") == "cancelled":
+            # Cancelled by a language switch; nothing to deliver
+            self._discard_output = False
+            self.original_transcript = ""
+            self.translated_text = ""
+            return
+        self.commit_policy.on_response_done()
+        
+        # Send final translation with both original and translated text
+        await self.client_ws.send_json({
+            "type": "translation",
+            "timestamp": datetime.utcnow().timestamp(),
+            "original": self.original_transcript or "Realtime transcription",
+            "translated": self.translated_text or "Translation in progress...",
+            "source_lang": self.source_lang,
+            "target_lang": self.target_lang,
+            "latency_ms": 0  # Real-time, no need to track
+        })
+        
+        # Reset for next translation
+        self.original_transcript = ""
+        self.translated_text = ""
+    
+    async def _on_error(self, event):
+        error = event.get("error", {})
+        logger.error(f"❌ OpenAI error: {error}")
+        
+        await self.client_ws.send_json({
+            "type": "error",
+            "message": f"Realtime API error: {error.get('message')}"
+        })
+    
+    EVENT_HANDLERS = {
+        "session.created": _on_session_created,
+        "session.updated": _on_session_updated,
+        "input_audio_buffer.speech_started": _on_speech_started,
+        "input_audio_buffer.speech_stopped": _on_speech_stopped,
+        "conversation.item.input_audio_transcription.completed": _on_input_transcript,
+        "response.audio_transcript.done": _on_output_transcript,
+        "response.created": _on_response_created,
+        "response.audio.delta": _on_audio_delta,
+        "response.audio.done": _on_audio_done,
+        "response.done": _on_response_done,
+        "error": _on_error,
+    }
+    
     async def handle_realtime_events(self):
-        """Handle incoming events from OpenAI Realtime API"""
-        try:
-            async for message in self.openai_ws:
-                event = json.loads(message)
-                event_type = event.get("type")
-                
-                # Log all events for debugging
-                logger.info(f"📨 Received event: {event_type}")
-                
-                if event_type == "session.created":
-                    self.session_id = event.get("session", {}).get("id")
-                    logger.info(f"🎉 Session created: {self.session_id}")
-                    
-                    # Notify client
-                    await self.client_ws.send_json({
-                        "type": "connected",
-                        "session_id": self.session_id,
-                        "mode": "realtime",
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-                
-                elif event_type == "session.updated":
-                    logger.info("✅ Session updated successfully")
-                
-                elif event_type == "input_audio_buffer.speech_started":
-                    logger.info("🎤 Speech detected")
-                    await self.client_ws.send_json({
-                        "type": "status",
-                        "message": "Speech detected..."
-                    })
-                
-                elif event_type == "input_audio_buffer.speech_stopped":
-                    logger.info("🛑 Speech ended")
-                
-                elif event_type == "conversation.item.created":
-                    item = event.get("item", {})
-                    logger.info(f"💬 Conversation item: {item.get('type')}")
-                
-                elif event_type == "response.audio_transcript.delta":
-                    # Streaming transcription
-                    delta = event.get("delta", "")
-                    logger.info(f"📝 Transcript delta: {delta}")
-                
-                elif event_type == "conversation.item.input_audio_transcription.completed":
-                    # Original audio transcription completed
-                    transcript = event.get("transcript", "")
-                    self.original_transcript = transcript
-                    logger.info(f"📝 Original transcript: {transcript}")
-                
-                elif event_type == "response.audio_transcript.done":
-                    # Complete translated transcription
-                    transcript = event.get("transcript", "")
-                    self.translated_text = transcript
-                    logger.info(f"✅ Translation transcript: {transcript}")
-                
-                elif event_type == "response.audio.delta":
-                    # Streaming audio output
-                    audio_delta = event.get("delta", "")
-                    if audio_delta:
-                        # Send audio chunk to client
-                        await self.client_ws.send_json({
-                            "type": "audio_delta",
-                            "audio": audio_delta
-                        })
-                
-                elif event_type == "response.audio.done":
-                    logger.info("✅ Audio generation complete")
-                
-                elif event_type == "response.done":
-                    # Full response complete
-                    logger.info("✅ Response complete")
+        """
+        Handle incoming events from OpenAI Realtime API
+        Dispatches by event type; per-type counts and handler latency go to
+        metrics instead of a log line per event (deltas arrive many times a second)
+        """
+        handlers = self.EVENT_HANDLERS
+        while True:
+            try:
+                async for message in self.openai_ws:
+                    started = time.perf_counter()
+                    event = fastjson.loads(message)
+                    event_type = event.get("type")
                     
-                    # Send final translation with both original and translated text
-                    await self.client_ws.send_json({
-                        "type": "translation",
-                        "timestamp": datetime.utcnow().timestamp(),
-                        "original": self.original_transcript or "Realtime transcription",
-                        "translated": self.translated_text or "Translation in progress...",
-                        "source_lang": "en",
-                        "target_lang": "es",
-                        "latency_ms": 0  # Real-time, no need to track
-                    })
+                    names = _event_metric_names(event_type)
+                    metrics.increment(names[0])
+                    handler = handlers.get(event_type)
+                    if handler is not None:
+                        await handler(self, event)
+                    metrics.observe(names[1], (time.perf_counter() - started) * 1000)
                     
-                    # Reset for next translation
-                    self.original_transcript = ""
-                    self.translated_text = ""
+            except websockets.exceptions.ConnectionClosed:
+                logger.info("🔌 OpenAI connection closed")
+            except Exception as e:
+                logger.error(f"❌ Error handling events: {e}")
+                return
+            
+            # Upstream dropped while the client is still streaming
+            if not self.is_running or not await self.reconnect():
+                return
+    
+    async def reconnect(self) -> bool:
+        """
+        Re-establish the upstream session with exponential backoff and replay
+        the uncommitted audio into it
+
+        Returns:
+            True when a new session is live
+        """
+        self.upstream_ready = False
+        started = time.perf_counter()
+        await self.client_ws.send_json({
+            "type": "status",
+            "message": "Realtime connection lost, reconnecting..."
+        })
+        
+        # The interrupted response will never complete
+        self.original_transcript = ""
+        self.translated_text = ""
+        await self.flush_audio_output()
+        
+        delay = RECONNECT_BASE_DELAY
+        for attempt in range(1, RECONNECT_ATTEMPTS + 1):
+            try:
+                session_key = self.session_key
+                ws = await session_pool.acquire(session_key)
+                if ws is None:
+                    ws = await open_realtime_socket()
+                    await ws.send(json.dumps(build_session_config(
+                        self.commit_policy.turn_detection, self.source_lang, self.target_lang
+                    )))
+                self.openai_ws = ws
+                if self.session_key != session_key:
+                    await self.configure_session()  # Language or policy changed while connecting
                 
-                elif event_type == "error":
-                    error = event.get("error", {})
-                    logger.error(f"❌ OpenAI error: {error}")
-                    
-                    await self.client_ws.send_json({
-                        "type": "error",
-                        "message": f"Realtime API error: {error.get('message')}"
-                    })
+                await self._replay_uncommitted()
+                self.upstream_ready = True
+                self.reconnects += 1
                 
-        except websockets.exceptions.ConnectionClosed:
-            logger.info("🔌 OpenAI connection closed")
-        except Exception as e:
-            logger.error(f"❌ Error handling events: {e}")
+                reconnect_ms = (time.perf_counter() - started) * 1000
+                metrics.increment("realtime.reconnects")
+                metrics.observe("realtime.reconnect_ms", reconnect_ms)
+                logger.info(f"🔁 Reconnected to Realtime API (attempt {attempt}, {reconnect_ms:.0f}ms)")
+                await self.client_ws.send_json({
+                    "type": "status",
+                    "message": "Realtime connection restored"
+                })
+                return True
+            except Exception as e:
+                if not self.is_running:
+                    return False
+                logger.warning(f"⚠️ Reconnect attempt {attempt}/{RECONNECT_ATTEMPTS} failed: {e}")
+                # Jittered backoff so many bridges don't reconnect in lockstep
+                await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+        
+        metrics.increment("realtime.reconnect_failures")
+        logger.error("❌ Could not reconnect to Realtime API")
+        await self.client_ws.send_json({
+            "type": "error",
+            "message": "Realtime connection lost"
+        })
+        return False
+    
+    async def _replay_uncommitted(self):
+        """
+        Send audio appended since the last commit into the new session
+        Keeps going until caught up with audio that arrived during the replay
+        """
+        replayed = 0
+        while replayed < len(self.replay_buffer):
+            parts = self.replay_buffer.window(replayed, self.append_bytes)
+            frame = b"".join(parts)
+            for part in parts:
+                part.release()
+            await self._send_frame(frame)
+            replayed += len(frame)
+        if replayed:
+            logger.info(f"🔁 Replayed {replayed * 1000 // (REALTIME_SAMPLE_RATE * 2)}ms of uncommitted audio")
     
     async def close(self):
         """Close the connection"""
         self.is_running = False
+        self.upstream_ready = False
+        logger.info(f"📊 Commit policy stats: {self.commit_policy.get_stats()}")
         if self.openai_ws:
             await self.openai_ws.close()
             logger.info("🔌 Disconnected from OpenAI Realtime API")
@@ -274,6 +670,7 @@ async def handle_realtime_translation(client_ws):
         
         # Start listening to OpenAI events
         event_task = asyncio.create_task(translator.handle_realtime_events())
+        timer_task = asyncio.create_task(translator.run_commit_timer())
         
         # Listen for client messages (audio bytes or JSON)
         while True:
@@ -286,8 +683,8 @@ async def handle_realtime_translation(client_ws):
                     logger.info(f"📥 Received audio chunk: {len(audio_chunk)} bytes")
                     await translator.send_audio(audio_chunk)
                     
-                    # Auto-commit after receiving audio (for push-to-talk)
-                    await translator.commit_audio()
+                    # Commit according to policy ("chunk" = after every message, for push-to-talk)
+                    await translator.on_chunk_end()
                 
                 elif "text" in data:
                     # JSON message received
@@ -296,6 +693,49 @@ async def handle_realtime_translation(client_ws):
                     if message.get("action") == "ping":
                         await client_ws.send_json({"type": "pong"})
                     
+                    elif message.get("action") == "audio_format":
+                        # Clients that can capture raw 24kHz PCM16 skip server-side decoding
+                        translator.input_format = "pcm16" if message.get("format") == "pcm16" else "webm"
+                        await client_ws.send_json({
+                            "type": "status",
+                            "message": f"Audio format: {translator.input_format}"
+                        })
+                    
+                    elif message.get("action") == "audio_output":
+                        # Opt-in binary frames instead of base64 audio_delta messages
+                        translator.set_output_format(message.get("format", "json"), message.get("codec", "pcm16"))
+                        await client_ws.send_json({
+                            "type": "status",
+                            "message": f"Audio output: {translator.output_format}"
+                        })
+                    
+                    elif message.get("action") == "set_language":
+                        await translator.set_language(
+                            message.get("source_lang", translator.source_lang),
+                            message.get("target_lang", translator.target_lang)
+                        )
+                        await client_ws.send_json({
+                            "type": "language_updated",
+                            "source_lang": translator.source_lang,
+                            "target_lang": translator.target_lang
+                        })
+                    
+                    elif message.get("action") == "commit_policy":
+                        await translator.set_commit_policy(message.get("policy"))
+                        await client_ws.send_json({
+                            "type": "status",
+                            "message": f"Commit policy: {translator.commit_policy.name}"
+                        })
+                    
+                    elif message.get("action") == "stats":
+                        await client_ws.send_json({
+                            "type": "stats",
+                            "commit_policy": translator.commit_policy.get_stats(),
+                            "session_pool": session_pool.get_stats(),
+                            "reconnects": translator.reconnects,
+                            "events": metrics.snapshot("realtime.event")
+                        })
+                    
                     elif message.get("action") == "disconnect":
                         break
                         
@@ -305,6 +745,7 @@ async def handle_realtime_translation(client_ws):
         
         # Wait for event task to finish
         event_task.cancel()
+        timer_task.cancel()
         
     except Exception as e:
         logger.error(f"❌ Realtime translation error: {e}", exc_info=True)
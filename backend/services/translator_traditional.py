@@ -5,17 +5,58 @@ Fallback approach with ~3-5s latency
 
 import asyncio
 import logging
-from typing import Optional, Dict
+import os
+import re
+import time
+from typing import Awaitable, Callable, List, Optional, Dict
 from datetime import datetime
-from openai import AsyncOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
-import io
 
 from services.audio_processor import AudioProcessor
+from services.deadline import Deadline, call_with_deadline
+from services.degradation import degradation
+from services.language_detect import whisper_language_code
+from services.model_profiles import TRADITIONAL_MODEL_PROFILE, ModelProfile, get_profile, record_profile_latency
+from services.openai_clients import openai_clients
+from services.pipeline import StagedPipeline
+from services.prompts import record_prompt_usage, translation_messages
+from services.transcript_filter import filter_transcription
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Workers per pipeline stage (STT stays at 1 so Whisper prompts carry context in order)
+PIPELINE_STT_CONCURRENCY = int(os.getenv("PIPELINE_STT_CONCURRENCY", "1"))
+PIPELINE_MT_CONCURRENCY = int(os.getenv("PIPELINE_MT_CONCURRENCY", "2"))
+PIPELINE_TTS_CONCURRENCY = int(os.getenv("PIPELINE_TTS_CONCURRENCY", "2"))
+
+# Sentence-level TTS: pieces shorter than this are merged with the next one
+TTS_MIN_SENTENCE_CHARS = int(os.getenv("TTS_MIN_SENTENCE_CHARS", "16"))
+TTS_SENTENCE_CONCURRENCY = int(os.getenv("TTS_SENTENCE_CONCURRENCY", "3"))
+
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？…])\s+")
+
+
+def split_sentences(text: str, min_chars: int = TTS_MIN_SENTENCE_CHARS) -> List[str]:
+    """
+    Split text at sentence boundaries for incremental TTS
+
+    Short fragments are merged forward so a greeting like "Hi." doesn't cost
+    its own TTS request.
+    """
+    sentences: List[str] = []
+    pending = ""
+    for piece in _SENTENCE_END.split(text.strip()):
+        pending = f"{pending} {piece}" if pending else piece
+        if len(pending) >= min_chars:
+            sentences.append(pending)
+            pending = ""
+    if pending:
+        if sentences:
+            sentences[-1] = f"{sentences[-1]} {pending}"
+        else:
+            sentences.append(pending)
+    return sentences
+
 
 class TraditionalTranslator:
     """
@@ -23,16 +64,20 @@ class TraditionalTranslator:
     More reliable but higher latency than Realtime API
     """
     
-    def __init__(self, api_key: str):
-        self.client = AsyncOpenAI(api_key=api_key)
+    def __init__(self, api_key: str, profile: str = None):
+        # Borrow the process-wide client so sessions reuse pooled connections
+        self.client = openai_clients.get_client(api_key)
         self.source_lang = "en"
         self.target_lang = "es"
+        self.profile = get_profile(profile, TRADITIONAL_MODEL_PROFILE)
         self.audio_processor = AudioProcessor()
         
-        # Accumulator for better transcription (overlapping context)
-        self.audio_buffer = bytearray()
+        # Context for the next Whisper prompt
         self.previous_transcript = ""
         
+        # Bounds concurrent sentence TTS requests for this session
+        self.tts_semaphore = asyncio.Semaphore(TTS_SENTENCE_CONCURRENCY)
+        
         logger.info("TraditionalTranslator initialized (Whisper + GPT + TTS)")
     
     def set_languages(self, source_lang: str, target_lang: str):
@@ -41,33 +86,46 @@ class TraditionalTranslator:
         self.target_lang = target_lang
         logger.info(f"Languages set: {source_lang} → {target_lang}")
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def transcribe_audio_webm(self, audio_data: bytes) -> Optional[Dict]:
+    def set_profile(self, name: str) -> ModelProfile:
+        """Switch model profile (applies to chunks submitted from now on)"""
+        self.profile = get_profile(name, TRADITIONAL_MODEL_PROFILE)
+        logger.info(f"Model profile set: {self.profile.name}")
+        return self.profile
+    
+    def _client_for(self, timeout: float):
+        """Client for one attempt: retries are budgeted by call_with_deadline, not the SDK"""
+        return self.client.with_options(timeout=timeout, max_retries=0)
+    
+    async def transcribe_audio_webm(self, audio_data: bytes, deadline: Deadline = None,
+                                    profile: ModelProfile = None) -> Optional[Dict]:
         """
-        Transcribe WebM/Opus audio using Whisper API with retry logic
+        Transcribe WebM/Opus audio using Whisper API, retrying within the deadline
         
         Args:
             audio_data: Raw WebM audio bytes
+            deadline: Utterance latency budget
+            profile: Model profile (defaults to the session's)
         
         Returns:
             Transcription result with text and language
         """
+        profile = profile or self.profile
         try:
-            # Create file-like object with WebM audio
-            audio_file = io.BytesIO(audio_data)
-            audio_file.name = "audio.webm"
-            
-            # Whisper transcription with context (WebM format is supported)
-            response = await self.client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language=self.source_lang if self.source_lang != "auto" else None,
-                prompt=self.previous_transcript[-200:] if self.previous_transcript else None,
-                response_format="verbose_json"
+            # Whisper transcription with context (WebM format is supported);
+            # a fresh file tuple per attempt so retries and hedges don't share a stream
+            response = await call_with_deadline(
+                lambda timeout: self._client_for(timeout).audio.transcriptions.create(
+                    model=profile.stt_model,
+                    file=("audio.webm", audio_data),
+                    language=self.source_lang if self.source_lang != "auto" else None,
+                    prompt=self.previous_transcript[-200:] if self.previous_transcript else None,
+                    response_format="verbose_json"
+                ),
+                deadline, "traditional.stt"
             )
             
             return {
-                "text": response.text,
+                "text": filter_transcription(response),  # Silence and hallucinated segments removed
                 "language": response.language if hasattr(response, 'language') else self.source_lang,
                 "confidence": getattr(response, 'confidence', 0.9)
             }
@@ -76,25 +134,24 @@ class TraditionalTranslator:
             logger.error(f"Whisper transcription error: {e}")
             raise
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def transcribe_audio(self, audio_data: bytes) -> Optional[Dict]:
+    async def transcribe_audio(self, audio_data: bytes, deadline: Deadline = None,
+                               profile: ModelProfile = None) -> Optional[Dict]:
         """
-        Transcribe audio using Whisper API with retry logic
+        Transcribe audio using Whisper API, retrying within the deadline
         
         Args:
-            audio_data: Raw PCM audio
+            audio_data: Raw PCM audio, or a sequence of PCM views
+            deadline: Utterance latency budget
+            profile: Model profile (defaults to the session's)
         
         Returns:
             Transcription result with text and language
         """
+        profile = profile or self.profile
         try:
-            # Convert to WAV for Whisper
+            # Convert to WAV for Whisper (single copy: header + PCM views joined once)
             wav_data = self.audio_processor.convert_to_wav(audio_data)
             
-            # Create file-like object
-            audio_file = io.BytesIO(wav_data)
-            audio_file.name = "audio.wav"
-            
             # Whisper transcription with context
             # Build prompt: previous transcript + Icelandic-specific vocabulary if needed
             whisper_prompt = None
@@ -109,16 +166,19 @@ class TraditionalTranslator:
                 else:
                     whisper_prompt = icelandic_vocab
             
-            response = await self.client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                language=self.source_lang if self.source_lang != "auto" else None,
-                prompt=whisper_prompt,
-                response_format="verbose_json"
+            response = await call_with_deadline(
+                lambda timeout: self._client_for(timeout).audio.transcriptions.create(
+                    model=profile.stt_model,
+                    file=("audio.wav", wav_data),
+                    language=self.source_lang if self.source_lang != "auto" else None,
+                    prompt=whisper_prompt,
+                    response_format="verbose_json"
+                ),
+                deadline, "traditional.stt"
             )
             
             return {
-                "text": response.text,
+                "text": filter_transcription(response),  # Silence and hallucinated segments removed
                 "language": response.language if hasattr(response, 'language') else self.source_lang,
                 "confidence": getattr(response, 'confidence', 0.9)
             }
@@ -127,46 +187,43 @@ class TraditionalTranslator:
             logger.error(f"Whisper transcription error: {e}")
             raise
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def translate_text(self, text: str, source_lang: str) -> str:
+    async def translate_text(self, text: str, source_lang: str, target_lang: str = None,
+                             context: str = None, deadline: Deadline = None,
+                             profile: ModelProfile = None) -> str:
         """
-        Translate text using GPT with retry logic
+        Translate text using GPT, retrying within the deadline
         
         Args:
             text: Source text
             source_lang: Detected source language
+            target_lang: Target language (defaults to the session's)
+            context: Preceding transcript (defaults to the latest one)
+            deadline: Utterance latency budget
+            profile: Model profile (defaults to the session's)
         
         Returns:
             Translated text
         """
+        target_lang = target_lang or self.target_lang
+        profile = profile or self.profile
+        if context is None:
+            context = self.previous_transcript
         try:
-            # Translation prompt optimized for natural conversation with Icelandic-specific instructions
-            icelandic_instructions = ""
-            if self.target_lang == "is" or source_lang == "is":
-                icelandic_instructions = """
-CRITICAL for Icelandic: Use correct spelling and grammar. Pay special attention to:
-- Special characters: ð (eth), þ (thorn), æ, ö
-- Correct declensions and conjugations
-- Proper capitalization (Icelandic uses lowercase for most nouns)
-- Natural Icelandic word order
-"""
+            # Static system prompt, then per-pair instructions, then context + text,
+            # so the provider can reuse the cached prefix across a session
+            messages = translation_messages(text, source_lang, target_lang, context)
             
-            system_prompt = f"""You are a professional real-time translator specializing in accurate, natural translations.
-Translate the following from {source_lang} to {self.target_lang}.
-{icelandic_instructions}
-Maintain natural conversational tone, slang, and emotional context.
-Keep translations concise and accurate. Use correct spelling, grammar, and punctuation.
-Previous context: {self.previous_transcript[-150:] if self.previous_transcript else 'None'}"""
-
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text}
-                ],
-                temperature=0.3,
-                max_tokens=200
+            started = time.perf_counter()
+            response = await call_with_deadline(
+                lambda timeout: self._client_for(timeout).chat.completions.create(
+                    model=profile.mt_model,
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=profile.mt_max_tokens
+                ),
+                deadline, "traditional.mt"
             )
+            record_prompt_usage("traditional.mt", response.usage, (time.perf_counter() - started) * 1000)
             
             return response.choices[0].message.content.strip()
         
@@ -174,107 +231,192 @@ Previous context: {self.previous_transcript[-150:] if self.previous_transcript e
             logger.error(f"Translation error: {e}")
             raise
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def synthesize_speech(self, text: str) -> bytes:
+    async def synthesize_speech(self, text: str, deadline: Deadline = None,
+                                profile: ModelProfile = None) -> bytes:
         """
-        Generate speech using OpenAI TTS
+        Generate speech using OpenAI TTS, retrying within the deadline
         
         Args:
             text: Text to synthesize
+            deadline: Utterance latency budget
+            profile: Model profile (defaults to the session's)
         
         Returns:
             MP3 audio bytes
         """
+        profile = profile or self.profile
         try:
-            response = await self.client.audio.speech.create(
-                model="tts-1-hd",  # High-quality TTS model
-                voice="nova",  # Clear, warm voice (Options: alloy, echo, fable, onyx, nova, shimmer)
-                input=text,
-                response_format="mp3",
-                speed=1.0
+            response = await call_with_deadline(
+                lambda timeout: self._client_for(timeout).audio.speech.create(
+                    model=profile.tts_model,
+                    voice=profile.tts_voice,
+                    input=text,
+                    response_format="mp3",  # Always MP3: the replay buffer concatenates MP3 segments
+                    speed=profile.tts_speed
+                ),
+                deadline, "traditional.tts"
             )
             
-            # Read audio bytes (compatible with openai 1.3.0)
-            audio_bytes = b""
-            for chunk in response.iter_bytes():
-                audio_bytes += chunk
-            
-            return audio_bytes
+            # Read audio bytes (compatible with openai 1.3.0); one join instead of repeated +=
+            return b"".join(response.iter_bytes())
         
         except Exception as e:
             logger.error(f"TTS error: {e}")
             raise
     
+    async def _synthesize_sentence(self, sentence: str, deadline: Deadline = None,
+                                   profile: ModelProfile = None) -> bytes:
+        async with self.tts_semaphore:
+            return await self.synthesize_speech(sentence, deadline, profile)
+    
+    def start_sentence_synthesis(self, text: str, deadline: Deadline = None,
+                                 profile: ModelProfile = None) -> List[asyncio.Task]:
+        """
+        Start TTS for every sentence of text at once (bounded by tts_semaphore)
+        
+        Returns:
+            One task per sentence, in reading order; the first is queued first so
+            it is never behind later sentences for a semaphore slot
+        """
+        return [asyncio.create_task(self._synthesize_sentence(sentence, deadline, profile)) for sentence in split_sentences(text)]
+    
+    # ---- Pipeline stages: each takes and returns a job dict (None drops the chunk) ----
+    
+    def new_job(self, audio_chunk: bytes, timestamp: float) -> Dict:
+        """
+        Job for one chunk; languages and profile are captured now so later changes
+        don't affect it, and the latency budget starts now so queueing counts against it
+        """
+        return {
+            "audio_chunk": audio_chunk,
+            "timestamp": timestamp,
+            "source_lang": self.source_lang,
+            "target_lang": self.target_lang,
+            "started_at": datetime.utcnow(),
+            "deadline": Deadline(),
+            # Under load the controller may force faster models
+            "profile": degradation.effective_profile(self.profile)
+        }
+    
+    async def stage_transcribe(self, job: Dict) -> Optional[Dict]:
+        audio_chunk = job.pop("audio_chunk")
+        # Skip very small chunks (< 2KB) - likely incomplete
+        if len(audio_chunk) < 2000:
+            logger.info(f"Chunk too small ({len(audio_chunk)} bytes), skipping...")
+            return None
+        
+        transcription = await self.transcribe_audio_webm(audio_chunk, job["deadline"], job["profile"])
+        if not transcription or not transcription["text"].strip():
+            logger.warning("No transcription result or empty text")
+            return None
+        
+        # Translation context is the transcript before this chunk, whatever order later stages run in
+        job["context"] = self.previous_transcript
+        self.previous_transcript = transcription["text"]
+        
+        job["original_text"] = transcription["text"]
+        # Whisper names the language ("icelandic"); route on the ISO code when known
+        job["detected_lang"] = whisper_language_code(transcription["language"]) or transcription["language"]
+        job["confidence"] = transcription.get("confidence", 0.0)
+        logger.info(f"Transcription: '{job['original_text']}' (lang: {job['detected_lang']})")
+        return job
+    
+    async def stage_translate(self, job: Dict) -> Optional[Dict]:
+        if job["detected_lang"] == job["target_lang"]:
+            # Already spoken in the target language: pass the original through, no MT or TTS
+            job["translated_text"] = job["original_text"]
+            job["passthrough"] = True
+            return job
+        job["translated_text"] = await self.translate_text(
+            job["original_text"], job["detected_lang"], job["target_lang"], job["context"],
+            job["deadline"], job["profile"]
+        )
+        logger.info(f"Translation: '{job['translated_text']}'")
+        return job
+    
+    async def stage_synthesize(self, job: Dict) -> Optional[Dict]:
+        """
+        Waits for the first sentence only; later sentences keep synthesizing and
+        are delivered from audio_parts (in order) by the consumer
+        
+        Under load (degradation.skip_tts) or for passthrough text no audio is made
+        and captions go out alone
+        """
+        if degradation.skip_tts or job.get("passthrough"):
+            audio_parts = []
+        else:
+            audio_parts = self.start_sentence_synthesis(job["translated_text"], job["deadline"], job["profile"])
+            if not audio_parts:
+                return None
+            try:
+                first = await audio_parts[0]
+            except Exception:
+                for task in audio_parts[1:]:
+                    task.cancel()
+                raise
+            logger.info(f"TTS first sentence: {len(first)} bytes ({len(audio_parts)} sentences)")
+        # Time to first audio (or to captions when TTS is skipped)
+        latency_ms = (datetime.utcnow() - job["started_at"]).total_seconds() * 1000
+        record_profile_latency(job["profile"], latency_ms)
+        return {
+            "original_text": job["original_text"],
+            "translated_text": job["translated_text"],
+            "source_lang": job["detected_lang"],
+            "target_lang": job["target_lang"],
+            "latency_ms": latency_ms,
+            "profile": job["profile"].name,
+            "audio_data": None,
+            "audio_parts": audio_parts,
+            "timestamp": job["timestamp"],
+            "confidence": job["confidence"]
+        }
+    
+    def create_pipeline(self, on_result: Callable[[Dict], Awaitable[None]]) -> StagedPipeline:
+        """
+        Pipelined STT → MT → TTS for a stream of chunks
+        Submit jobs from new_job(); results reach on_result in submission order
+        """
+        pipeline = StagedPipeline(
+            [
+                ("stt", self.stage_transcribe, PIPELINE_STT_CONCURRENCY),
+                ("mt", self.stage_translate, PIPELINE_MT_CONCURRENCY),
+                ("tts", self.stage_synthesize, PIPELINE_TTS_CONCURRENCY),
+            ],
+            on_result,
+            name="traditional.pipeline"
+        )
+        pipeline.start()
+        return pipeline
+    
     async def process_audio(self, audio_chunk: bytes, timestamp: float, heartbeat_callback=None) -> Optional[Dict]:
         """
-        Full pipeline: STT → Translation → TTS
+        Full pipeline for a single chunk: STT → Translation → TTS
+        (streams of chunks should use create_pipeline instead)
         
         Args:
-            audio_chunk: Raw PCM audio
+            audio_chunk: Complete WebM file
             timestamp: Chunk timestamp
         
         Returns:
             Complete translation result
         """
-        start_time = datetime.utcnow()
-        
         try:
             logger.info(f"[TRANSLATOR] Processing complete WebM file: {len(audio_chunk)} bytes")
             
-            # Skip very small chunks (< 2KB) - likely incomplete
-            min_chunk_size = 2000
-            if len(audio_chunk) < min_chunk_size:
-                logger.info(f"Chunk too small ({len(audio_chunk)} bytes), skipping...")
-                return None
-            
-            # Step 1: Transcribe complete WebM file directly (no buffering needed)
-            logger.info("Sending complete WebM to Whisper...")
-            if heartbeat_callback:
-                await heartbeat_callback()
-            transcription = await self.transcribe_audio_webm(audio_chunk)
-            if not transcription or not transcription["text"].strip():
-                logger.warning("No transcription result or empty text")
-                return None
-            
-            original_text = transcription["text"]
-            detected_lang = transcription["language"]
-            logger.info(f"Transcription: '{original_text}' (lang: {detected_lang})")
+            job = self.new_job(audio_chunk, timestamp)
+            for stage in (self.stage_transcribe, self.stage_translate, self.stage_synthesize):
+                if heartbeat_callback:
+                    await heartbeat_callback()
+                job = await stage(job)
+                if job is None:
+                    return None
             
-            # Step 2: Translate
-            logger.info("Starting translation...")
-            if heartbeat_callback:
-                await heartbeat_callback()
-            translated_text = await self.translate_text(original_text, detected_lang)
-            logger.info(f"Translation: '{translated_text}'")
+            # Single-chunk callers get the whole clip
+            job["audio_data"] = b"".join(await asyncio.gather(*job.pop("audio_parts")))
             
-            # Step 3: Synthesize speech
-            logger.info("Starting TTS...")
-            if heartbeat_callback:
-                await heartbeat_callback()
-            audio_data = await self.synthesize_speech(translated_text)
-            logger.info(f"TTS generated {len(audio_data)} bytes")
-            
-            # Update context
-            self.previous_transcript = original_text
-            
-            # Calculate total latency
-            latency_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-            
-            result = {
-                "original_text": original_text,
-                "translated_text": translated_text,
-                "source_lang": detected_lang,
-                "target_lang": self.target_lang,
-                "latency_ms": latency_ms,
-                "audio_data": audio_data,
-                "timestamp": timestamp,
-                "confidence": transcription.get("confidence", 0.0)
-            }
-            
-            logger.info(f"Pipeline completed in {latency_ms:.0f}ms: '{original_text[:50]}...' -> '{translated_text[:50]}...'")
-            return result
+            logger.info(f"Pipeline completed in {job['latency_ms']:.0f}ms: '{job['original_text'][:50]}...' -> '{job['translated_text'][:50]}...'")
+            return job
         
         except Exception as e:
             logger.error(f"Pipeline error: {e}", exc_info=True)
             return None
-
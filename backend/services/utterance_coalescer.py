@@ -0,0 +1,149 @@
+"""
+Per-speaker utterance coalescing
+Short transcript fragments ("so", "and then") are held briefly and merged, so
+one translation + TTS per listener covers a whole phrase instead of each piece
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Hold a fragment this long for a follow-up (0 disables coalescing)
+COALESCE_WINDOW_MS = float(os.getenv("COALESCE_WINDOW_MS", "1500"))
+# Never hold the first fragment of a unit longer than this
+COALESCE_MAX_WAIT_MS = float(os.getenv("COALESCE_MAX_WAIT_MS", "4000"))
+# Whisper punctuates short fragments ("So.", "Okay."), so end punctuation only
+# closes a unit once it has this many words or characters (characters cover CJK)
+COALESCE_MIN_WORDS = int(os.getenv("COALESCE_MIN_WORDS", "4"))
+COALESCE_MIN_CHARS = int(os.getenv("COALESCE_MIN_CHARS", "20"))
+
+_SENTENCE_ENDINGS = ".!?。！？"
+_CONTINUATIONS = ("...", "…")
+
+# Called with (key, merged text, meta of the unit's first fragment)
+DeliverFn = Callable[[Hashable, str, Dict[str, Any]], Awaitable[None]]
+
+
+def ends_sentence(text: str) -> bool:
+    """Whether text reads as a finished sentence (a trailing ellipsis continues)"""
+    stripped = text.rstrip().rstrip("\"'”’)")
+    if not stripped or stripped.endswith(_CONTINUATIONS) or stripped[-1] not in _SENTENCE_ENDINGS:
+        return False
+    return len(stripped.split()) >= COALESCE_MIN_WORDS or len(stripped) >= COALESCE_MIN_CHARS
+
+
+@dataclass
+class PendingUtterance:
+    meta: Dict[str, Any]
+    first_at: float
+    group: Hashable = None
+    parts: List[str] = field(default_factory=list)
+    timer: Optional[asyncio.Task] = None
+
+
+class UtteranceCoalescer:
+    """
+    Buffers fragments per key (e.g. room + speaker) and delivers them as one unit
+    at a sentence boundary (end punctuation on a long enough unit), after
+    COALESCE_WINDOW_MS without a follow-up, or at COALESCE_MAX_WAIT_MS after the
+    first fragment, whichever comes first
+
+    Fragments that must not be merged (e.g. a different spoken language) carry a
+    different group; a group change delivers the pending unit first. Deliveries for
+    the same key never overlap, so units arrive in order.
+    """
+
+    def __init__(self, deliver: DeliverFn, window_ms: float = COALESCE_WINDOW_MS,
+                 max_wait_ms: float = COALESCE_MAX_WAIT_MS):
+        self.deliver = deliver
+        self.window = window_ms / 1000
+        self.max_wait = max_wait_ms / 1000
+        self._pending: Dict[Hashable, PendingUtterance] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    async def add(self, key: Hashable, text: str, meta: Dict[str, Any], group: Hashable = None):
+        """
+        Add a fragment; delivers inline when it completes a unit
+
+        Args:
+            key: Stream the fragment belongs to
+            text: Transcript fragment
+            meta: Delivery context (only the first fragment's is kept, so budgets
+                and latencies count from the start of the unit)
+            group: Fragments are only merged within the same group
+        """
+        pending = self._pending.get(key)
+        if pending is not None and pending.group != group:
+            await self.flush(key)
+            pending = None
+        now = time.monotonic()
+        if pending is None:
+            pending = self._pending[key] = PendingUtterance(meta=meta, first_at=now, group=group)
+        pending.parts.append(text)
+        metrics.increment("coalescer.fragments")
+
+        if pending.timer:
+            pending.timer.cancel()
+            pending.timer = None
+
+        waited = now - pending.first_at
+        if self.window <= 0 or ends_sentence(" ".join(pending.parts)) or waited >= self.max_wait:
+            await self.flush(key)
+        else:
+            delay = min(self.window, self.max_wait - waited)
+            pending.timer = asyncio.create_task(self._flush_later(key, delay))
+
+    async def _flush_later(self, key: Hashable, delay: float):
+        await asyncio.sleep(delay)
+        await self.flush(key)
+
+    async def flush(self, key: Hashable):
+        """Deliver whatever is pending for key now"""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        if pending.timer and pending.timer is not asyncio.current_task():
+            pending.timer.cancel()
+
+        text = " ".join(part.strip() for part in pending.parts if part.strip())
+        metrics.increment("coalescer.units")
+        metrics.observe("coalescer.hold_ms", (time.monotonic() - pending.first_at) * 1000)
+        if len(pending.parts) > 1:
+            logger.info(f"🧩 Coalesced {len(pending.parts)} fragments: '{text[:60]}'")
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            try:
+                await self.deliver(key, text, pending.meta)
+            except Exception as e:
+                logger.error(f"❌ Coalesced utterance delivery failed: {e}")
+
+    async def close(self, key: Hashable):
+        """Deliver what is pending and forget the key (e.g. a speaker leaving)"""
+        await self.flush(key)
+        lock = self._locks.get(key)
+        if lock is not None and not lock.locked():
+            del self._locks[key]
+
+    def shutdown(self):
+        """Drop pending fragments (process exit)"""
+        for pending in self._pending.values():
+            if pending.timer:
+                pending.timer.cancel()
+        self._pending.clear()
+
+    def get_stats(self) -> Dict:
+        return {
+            "pending": len(self._pending),
+            "window_ms": self.window * 1000,
+            "max_wait_ms": self.max_wait * 1000,
+            "fragments": metrics.counters.get("coalescer.fragments", 0),
+            "units": metrics.counters.get("coalescer.units", 0)
+        }
@@ -0,0 +1,91 @@
+"""
+Optional pre-upload stage for Whisper: re-encode large browser audio to
+compact mono 16kHz Opus/FLAC before it goes over a slow uplink
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Tuple
+
+from services.audio_jobs import PYDUB_AVAILABLE, compact_for_whisper
+from services.audio_workers import audio_pool
+
+logger = logging.getLogger(__name__)
+
+# "off", "opus" or "flac"
+WHISPER_REENCODE = os.getenv("WHISPER_REENCODE", "off").lower()
+# Only re-encode uploads at least this big; small chunks upload fast anyway
+WHISPER_REENCODE_MIN_BYTES = int(os.getenv("WHISPER_REENCODE_MIN_BYTES", str(64 * 1024)))
+WHISPER_OPUS_BITRATE = os.getenv("WHISPER_OPUS_BITRATE", "24k")
+
+upload_stats: Dict[str, float] = {
+    "uploads": 0,
+    "reencoded": 0,
+    "bytes_in": 0,
+    "bytes_out": 0,
+    "encode_ms_total": 0.0
+}
+
+
+def should_reencode(size: int, mode: str = None) -> bool:
+    """Whether an upload of `size` bytes goes through the re-encode stage"""
+    mode = mode or WHISPER_REENCODE
+    return PYDUB_AVAILABLE and mode in ("opus", "flac") and size >= WHISPER_REENCODE_MIN_BYTES
+
+
+async def prepare_whisper_upload(audio_chunk: bytes, format: str = "webm",
+                                 mode: str = None) -> Tuple[str, bytes, str]:
+    """
+    Build the multipart file tuple for a Whisper upload
+
+    Args:
+        audio_chunk: Browser audio (WebM/Opus)
+        format: Input container format
+        mode: Override WHISPER_REENCODE ("off", "opus", "flac")
+
+    Returns:
+        (filename, bytes, mime) - the original audio when the stage is off,
+        the input is small, encoding fails, or the result is not smaller
+    """
+    mode = mode or WHISPER_REENCODE
+    original = (f"audio.{format}", audio_chunk, f"audio/{format}")
+    upload_stats["uploads"] += 1
+    upload_stats["bytes_in"] += len(audio_chunk)
+
+    if not should_reencode(len(audio_chunk), mode):
+        upload_stats["bytes_out"] += len(audio_chunk)
+        return original
+
+    start = time.perf_counter()
+    try:
+        result = await audio_pool.run(
+            compact_for_whisper, audio_chunk, format, mode, 16000, WHISPER_OPUS_BITRATE
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ Whisper re-encode failed, uploading original: {e}")
+        upload_stats["bytes_out"] += len(audio_chunk)
+        return original
+
+    encode_ms = (time.perf_counter() - start) * 1000
+    upload_stats["encode_ms_total"] += encode_ms
+
+    if len(result["data"]) >= len(audio_chunk):
+        upload_stats["bytes_out"] += len(audio_chunk)
+        return original
+
+    upload_stats["reencoded"] += 1
+    upload_stats["bytes_out"] += len(result["data"])
+    logger.info(f"🗜️ Re-encoded upload {len(audio_chunk)} → {len(result['data'])} bytes ({mode}, {encode_ms:.0f}ms)")
+    return result["filename"], result["data"], result["mime"]
+
+
+def get_upload_stats() -> Dict:
+    saved = upload_stats["bytes_in"] - upload_stats["bytes_out"]
+    return {
+        **upload_stats,
+        "mode": WHISPER_REENCODE,
+        "min_bytes": WHISPER_REENCODE_MIN_BYTES,
+        "bytes_saved": saved,
+        "avg_encode_ms": upload_stats["encode_ms_total"] / upload_stats["reencoded"] if upload_stats["reencoded"] else 0.0
+    }
@@ -14,6 +14,8 @@ from typing import Dict, List, Optional
 import os
 from dotenv import load_dotenv
 
+from services.openai_clients import openai_clients
+
 load_dotenv()
 
 # Configuration
@@ -53,6 +55,15 @@ async def startup_event():
     
     logger.info("[STARTUP] LiveTranslateAI Simple Backend starting")
     logger.info(f"[CONFIG] Max buffer duration: {MAX_BUFFER_DURATION}s")
+    
+    # One pooled OpenAI client for all chunks and sessions
+    await openai_clients.start(OPENAI_API_KEY)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release process-wide resources"""
+    await openai_clients.shutdown()
 
 
 @app.get("/")
@@ -112,15 +123,10 @@ async def websocket_translate(websocket: WebSocket):
                     
                     # Process with real OpenAI translation
                     try:
-                        from openai import AsyncOpenAI
-                        
                         logger.info("Attempting OpenAI translation...")
                         
-                        # Create client with proper API version
-                        client = AsyncOpenAI(
-                            api_key=OPENAI_API_KEY,
-                            timeout=30.0
-                        )
+                        # Shared client: reuses pooled connections instead of a new TLS handshake per chunk
+                        client = openai_clients.get_client(OPENAI_API_KEY)
                         
                         # For now, send a simple text response
                         # TODO: Add real audio processing
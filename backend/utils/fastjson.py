@@ -0,0 +1,28 @@
+"""
+JSON encode/decode for hot paths
+Uses orjson when installed, the standard library otherwise
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj) -> str:
+        # str so websockets sends a text frame
+        return orjson.dumps(obj).decode("utf-8")
+else:
+    loads = json.loads
+    _encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def dumps(obj) -> str:
+        return _encoder.encode(obj)
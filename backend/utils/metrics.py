@@ -0,0 +1,91 @@
+"""
+In-process metrics: counters and latency histograms
+Cheap enough for per-event use on hot paths (no logging, no I/O)
+"""
+
+import bisect
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+# Histogram bucket upper bounds in milliseconds
+DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram plus a rolling window of recent samples for percentiles"""
+
+    def __init__(self, buckets_ms=DEFAULT_BUCKETS_MS, window: int = 512):
+        self.buckets = tuple(buckets_ms)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value_ms: float):
+        self.bucket_counts[bisect.bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.recent.append(value_ms)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """p-th percentile (0-100) over the recent window, None when empty"""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        index = min(len(ordered) - 1, max(0, int(round(p / 100.0 * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def snapshot(self) -> Dict:
+        buckets = {f"le_{b}": c for b, c in zip(self.buckets, self.bucket_counts)}
+        buckets["le_inf"] = self.bucket_counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": buckets
+        }
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms (names are dotted strings)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()  # Worker threads may record too
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def increment(self, name: str, value: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float):
+        self.gauges[name] = value
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def observe(self, name: str, value_ms: float):
+        self.histogram(name).observe(value_ms)
+
+    def snapshot(self, prefix: str = "") -> Dict:
+        """All metrics whose name starts with prefix"""
+        return {
+            "counters": {k: v for k, v in self.counters.items() if k.startswith(prefix)},
+            "gauges": {k: v for k, v in self.gauges.items() if k.startswith(prefix)},
+            "histograms": {k: h.snapshot() for k, h in self.histograms.items() if k.startswith(prefix)}
+        }
+
+    def names(self, prefix: str = "") -> List[str]:
+        return sorted(n for n in list(self.counters) + list(self.histograms) if n.startswith(prefix))
+
+
+# Process-wide registry
+metrics = MetricsRegistry()